@@ -0,0 +1,159 @@
+import hashlib
+import json
+import os
+import time
+from math import comb
+from DataStructures.GraphStructures.BitsetAdjacency import BitsetAdjacency
+from DataStructures.ParallelToughnessSearch import search_range
+
+class AnytimeToughnessSearch:
+    """Classe que abstrai a busca de um subconjunto S que viole
+    w(G-S) <= |S| com limite de tempo ou de subconjuntos avaliados.
+
+    Os subconjuntos são avaliados em blocos, por tamanho e em ordem
+    lexicográfica, de modo que a posição da busca se resume ao
+    tamanho k e à posição do próximo subconjunto entre os C(n,k) de
+    tamanho k. Entre os blocos, a busca verifica os limites, relata o
+    progresso e grava a posição em um arquivo de checkpoint, a partir
+    do qual uma nova execução continua. O prazo também é consultado a
+    cada subconjunto dentro do bloco, já que, em grafos grandes, um
+    bloco pode levar mais do que o tempo disponível. Ao esgotar um
+    limite, a busca termina sem resposta definitiva.
+
+    Parâmetros
+    ----------
+        - adjacency (list): Vizinhos de cada vértice (0, 1, ..., n-1).
+        - max_size (int): Tamanho máximo de S.
+        - time_budget (float): Tempo máximo desta execução, em segundos.
+        - subset_budget (int): Quantidade máxima de subconjuntos
+        avaliados nesta execução.
+        - checkpoint (str): Arquivo JSON com a posição da busca.
+        - report (callable): Função chamada com o progresso (subconjuntos
+        avaliados, total e subconjuntos por segundo nesta execução) a
+        cada report_interval segundos.
+        - report_interval (float): Intervalo entre relatos de progresso
+        e gravações do checkpoint, em segundos.
+    """
+
+    # Subconjuntos avaliados entre duas verificações dos limites
+    BLOCK_SIZE = 1 << 12
+
+    def __init__(self, adjacency: list, max_size: int, time_budget: float = None,
+                 subset_budget: int = None, checkpoint: str = None, report=None,
+                 report_interval: float = 10.0):
+        self.__n = len(adjacency)
+        self.__max_size = max_size
+        self.__time_budget = time_budget
+        self.__subset_budget = subset_budget
+        self.__checkpoint = checkpoint
+        self.__report = report
+        self.__report_interval = report_interval
+        self.__masks = BitsetAdjacency.masks_of(adjacency)
+        # Identificação do grafo, para não continuar o checkpoint de outro grafo
+        self.__fingerprint = hashlib.sha256(",".join(map(str, self.__masks)).encode()).hexdigest()
+        # Total de subconjuntos, calculado apenas no primeiro relato (a soma
+        # de coeficientes binomiais enormes leva frações de segundo em grafos grandes)
+        self.__total = None
+
+    def run(self):
+        """Executa a busca a partir do checkpoint, se existir.
+
+        Retorno
+        -------
+        - s (list | None): Índices dos vértices de S que viola a
+        condição, ou None caso nenhum subconjunto avaliado a viole.
+        - complete (bool): Indica se a resposta é definitiva: uma
+        violação foi encontrada ou todos os subconjuntos foram avaliados.
+        - examined (int): Quantidade de subconjuntos avaliados, somando
+        as execuções anteriores.
+        """
+
+        state = self.__load_checkpoint()
+        if state["complete"]: # Resposta já obtida em uma execução anterior
+            return state["violator"], True, state["examined"]
+
+        start_time = time.perf_counter()
+        last_report = start_time
+        stop = None if self.__time_budget is None else _Deadline(start_time + self.__time_budget)
+        examined_now = 0 # Subconjuntos avaliados nesta execução
+        k, rank = state["size"], state["rank"]
+        while k <= self.__max_size:
+            total_k = comb(self.__n, k)
+            if rank >= total_k: # Tamanho k esgotado
+                k, rank = k + 1, 0
+                continue
+
+            # Limites desta execução
+            elapsed = time.perf_counter() - start_time
+            if self.__time_budget is not None and elapsed >= self.__time_budget:
+                break
+            block = min(self.BLOCK_SIZE, total_k - rank)
+            if self.__subset_budget is not None:
+                block = min(block, self.__subset_budget - examined_now)
+                if block <= 0:
+                    break
+
+            # Interrompido pelo prazo, o bloco retorna quantos subconjuntos avaliou
+            violator, count = search_range(self.__masks, k, rank, rank + block, stop, 1)
+            examined_now += count
+            state["examined"] += count
+            rank += count
+            if violator is not None:
+                state.update(complete=True, violator=violator)
+                break
+
+            now = time.perf_counter()
+            if now - last_report >= self.__report_interval:
+                last_report = now
+                state.update(size=k, rank=rank)
+                self.__save_checkpoint(state)
+                if self.__report is not None:
+                    if self.__total is None:
+                        self.__total = sum(comb(self.__n, k) for k in range(1, self.__max_size + 1))
+                    self.__report(state["examined"], self.__total, examined_now / (now - start_time))
+        else: # Todos os subconjuntos foram avaliados
+            state["complete"] = True
+
+        state.update(size=k, rank=rank)
+        self.__save_checkpoint(state)
+        return state["violator"], state["complete"], state["examined"]
+
+    def __load_checkpoint(self):
+        # Posição inicial da busca: a do checkpoint do mesmo grafo ou o início
+        state = {"fingerprint": self.__fingerprint, "max_size": self.__max_size,
+                 "size": 1, "rank": 0, "examined": 0, "complete": False, "violator": None}
+        if self.__checkpoint is None or not os.path.exists(self.__checkpoint):
+            return state
+
+        with open(self.__checkpoint, "r") as fp:
+            saved = json.load(fp)
+        if saved.get("fingerprint") != self.__fingerprint or saved.get("max_size") != self.__max_size:
+            raise ValueError("O checkpoint {} pertence a outro grafo".format(self.__checkpoint))
+        state.update(saved)
+        return state
+
+    def __save_checkpoint(self, state: dict):
+        # Grava em um arquivo temporário e o renomeia, para nunca deixar um checkpoint incompleto
+        if self.__checkpoint is None:
+            return
+        temporary = self.__checkpoint + ".tmp"
+        with open(temporary, "w") as fp:
+            json.dump(state, fp)
+        os.replace(temporary, self.__checkpoint)
+
+
+class _Deadline:
+    """Prazo da busca, consultado por search_range como o evento de
+    parada dos processos da busca paralela.
+
+    Parâmetros
+    ----------
+        - deadline (float): Instante (time.perf_counter) de parada.
+    """
+
+    def __init__(self, deadline: float):
+        self.__deadline = deadline
+
+    def is_set(self):
+        # Indica se o prazo se esgotou
+        return time.perf_counter() >= self.__deadline
@@ -0,0 +1,194 @@
+import glob
+import os
+import signal
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from DataStructures.Graph import Graph
+
+class BatchRunner:
+    """Classe que abstrai a verificação de muitos arquivos de grafos
+    em paralelo. Os arquivos são distribuídos entre processos de um
+    ProcessPoolExecutor, que carregam os módulos uma única vez, e cada
+    processo verifica as condições eulerianas e hamiltonianas de um
+    arquivo por vez. Erros e tempo esgotado afetam apenas o resultado
+    do arquivo em que ocorreram. Se um processo for encerrado (ex.:
+    falta de memória), o executor inteiro deixa de funcionar: os
+    arquivos ainda sem resultado são repetidos, cada um em um
+    executor próprio, e somente o arquivo cujo processo é encerrado
+    novamente é registrado como erro.
+
+    Parâmetros
+    ----------
+        - backend (str): Estrutura utilizada para o grafo.
+        - workers (int): Quantidade de processos. Se omitido, usa a
+        quantidade de núcleos da máquina.
+        - timeout (float): Tempo máximo, em segundos, de cada arquivo.
+        Se omitido, não há limite.
+    """
+
+    # Extensões dos arquivos de grafos buscados em diretórios
+    EXTENSIONS = (".txt", ".bin")
+
+    def __init__(self, backend: str = "default", workers: int = None, timeout: float = None):
+        self.__backend = backend
+        self.__workers = workers or os.cpu_count() or 1
+        self.__timeout = timeout
+
+    @classmethod
+    def collect_files(cls, sources: list):
+        """Retorna os arquivos de grafos indicados pelas fontes, sem
+        repetições e na ordem em que aparecem. Uma fonte pode ser um
+        diretório (arquivos .txt e .bin, em ordem alfabética), um
+        padrão glob, uma lista de arquivos (@lista.txt, um arquivo
+        por linha) ou um arquivo.
+
+        Parâmetros
+        ----------
+        - sources (list): Fontes dos arquivos.
+
+        Retorno
+        -------
+        - files (list): Caminhos dos arquivos de grafos.
+        """
+
+        files = []
+        for source in sources:
+            if source.startswith("@"): # Lista de arquivos
+                with open(source[1:], "r") as manifest:
+                    names = [line.strip() for line in manifest]
+                # Caminhos relativos partem do diretório da lista
+                base = os.path.dirname(source[1:])
+                files += [os.path.join(base, name) for name in names
+                          if name and not name.startswith("#")]
+            elif os.path.isdir(source):
+                files += sorted(os.path.join(source, name) for name in os.listdir(source)
+                                if name.endswith(cls.EXTENSIONS))
+            elif glob.has_magic(source):
+                files += sorted(glob.glob(source))
+            else:
+                files.append(source)
+
+        return list(dict.fromkeys(files)) # Remove repetições mantendo a ordem
+
+    def run(self, files: list):
+        """Verifica os arquivos em paralelo.
+
+        Parâmetros
+        ----------
+        - files (list): Caminhos dos arquivos de grafos.
+
+        Retorno
+        -------
+        - results (list): Resultado de cada arquivo, na ordem recebida.
+        """
+
+        results = [None] * len(files)
+        interrupted = self.__run_shared(files, results)
+        if interrupted: # Algum processo foi encerrado e derrubou o executor
+            self.__run_isolated(files, interrupted, results)
+
+        return results
+
+    def __run_shared(self, files: list, results: list):
+        # Verifica todos os arquivos em um único executor e retorna as
+        # posições dos arquivos interrompidos pela queda do executor
+        interrupted = []
+        with ProcessPoolExecutor(max_workers=self.__workers) as executor:
+            futures = [executor.submit(check_file, filename, self.__backend, self.__timeout)
+                       for filename in files]
+            for i, future in enumerate(futures):
+                try:
+                    results[i] = future.result()
+                except BrokenProcessPool: # Não indica qual arquivo encerrou o processo
+                    interrupted.append(i)
+                except Exception as error:
+                    results[i] = self.__error(files[i], error)
+
+        return interrupted
+
+    def __run_isolated(self, files: list, positions: list, results: list):
+        # Repete cada arquivo em um executor de um único processo, com até
+        # workers executores ao mesmo tempo: a queda de um processo afeta
+        # apenas o arquivo que o encerrou
+        pending = deque(positions)
+        running = dict() # Futuro -> (posição do arquivo, executor)
+        while pending or running:
+            while pending and len(running) < self.__workers:
+                i = pending.popleft()
+                executor = ProcessPoolExecutor(max_workers=1)
+                future = executor.submit(check_file, files[i], self.__backend, self.__timeout)
+                running[future] = (i, executor)
+
+            done = wait(running, return_when=FIRST_COMPLETED).done
+            for future in done:
+                i, executor = running.pop(future)
+                executor.shutdown()
+                try:
+                    results[i] = future.result()
+                except Exception as error: # Ex.: processo encerrado pelo sistema
+                    results[i] = self.__error(files[i], error)
+
+    def __error(self, filename: str, error: Exception):
+        # Resultado de um arquivo cuja verificação não retornou
+        return {"file": filename, "status": "error",
+                "error": "{}: {}".format(type(error).__name__, error)}
+
+class FileTimeout(Exception):
+    """Exceção lançada quando um arquivo excede o tempo máximo."""
+
+
+def _raise_timeout(signum, frame):
+    raise FileTimeout()
+
+def check_file(filename: str, backend: str = "default", timeout: float = None):
+    """Verifica as condições eulerianas e hamiltonianas de um arquivo
+    de grafo, sem exibir nada no terminal. Executada nos processos do
+    BatchRunner.
+
+    Parâmetros
+    ----------
+    - filename (str): Nome do arquivo de entrada.
+    - backend (str): Estrutura utilizada para o grafo.
+    - timeout (float): Tempo máximo, em segundos. Se omitido, não há limite.
+
+    Retorno
+    -------
+    - result (dict): Situação ("ok", "error" ou "timeout"), condições
+    verificadas, tamanho do circuito e tempo de cada etapa.
+    """
+
+    result = {"file": filename, "status": "ok", "seconds": dict()}
+    seconds = result["seconds"]
+    # O alarme interrompe a verificação onde ela estiver (apenas em sistemas Unix)
+    use_alarm = timeout is not None and hasattr(signal, "setitimer")
+    if use_alarm:
+        previous_handler = signal.signal(signal.SIGALRM, _raise_timeout)
+        signal.setitimer(signal.ITIMER_REAL, timeout)
+    try:
+        start = time.perf_counter()
+        graph = Graph(filename, backend)
+        seconds["load"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        circuit = graph.find_eulerian_circuit()
+        result["is_connected"] = graph.is_connected()
+        result["is_eulerian"] = graph.is_eulerian()
+        result["circuit_length"] = None if circuit is None else len(circuit)
+        seconds["eulerian"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        result["may_be_hamiltonian"] = graph.find_toughness_violator() is None
+        seconds["hamiltonian"] = time.perf_counter() - start
+    except FileTimeout:
+        result["status"] = "timeout"
+    except Exception as error:
+        result["status"] = "error"
+        result["error"] = "{}: {}".format(type(error).__name__, error)
+    finally:
+        if use_alarm:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            signal.signal(signal.SIGALRM, previous_handler)
+
+    return result
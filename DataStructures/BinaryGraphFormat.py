@@ -0,0 +1,112 @@
+import mmap
+import struct
+import sys
+from array import array
+from DataStructures.GraphStructures.EdgeIndex import EdgeIndex
+
+class BinaryGraphFormat:
+    """Classe que abstrai o formato binário de arquivos de grafos.
+
+    O arquivo começa com um cabeçalho fixo (identificador, versão,
+    indicadores, |V|, quantidade de posições e |A|), seguido dos
+    vetores de deslocamentos (int64), de vizinhos e de identificadores
+    de arestas (int32, ou int64 se indicado). Os vetores podem ser
+    mapeados diretamente em memória (mmap), sem cópia nem conversão,
+    e vários processos que abrem o mesmo arquivo compartilham as
+    mesmas páginas.
+    """
+
+    MAGIC = b"EDAGRAPH"
+    VERSION = 1
+    # Identificador, versão, indicadores, |V|, posições e |A|
+    HEADER = struct.Struct("<8sIIQQQ")
+
+    # Indicadores do cabeçalho
+    FLAG_ADJACENCY_LIST = 1 # Vetores no formato de lista de adjacência (CSR)
+    FLAG_WIDE_IDS = 2 # Vizinhos e arestas com 64 bits
+    FLAG_BIG_ENDIAN = 4 # Vetores gravados em big-endian
+
+    @classmethod
+    def is_binary(cls, prefix: bytes):
+        # Retorna se o prefixo do arquivo começa com o identificador do formato
+        return prefix.startswith(cls.MAGIC)
+
+    @classmethod
+    def write(cls, filename: str, offsets, neighbors):
+        """Grava um grafo no formato binário a partir dos vetores
+        da lista de adjacência, calculando os identificadores das arestas.
+
+        Parâmetros
+        ----------
+        - filename (str): Nome do arquivo de saída.
+        - offsets (array): Deslocamentos do início da lista de cada vértice.
+        - neighbors (array): Vértices adjacentes de todos os vértices.
+        """
+
+        edge_index = EdgeIndex(offsets, neighbors)
+        num_vertices = len(offsets) - 1
+        num_edges = edge_index.get_num_edges()
+        # Identificadores de 64 bits apenas quando não cabem em 32 bits
+        wide = max(num_vertices, num_edges) >= 2**31
+        typecode = 'q' if wide else 'i'
+
+        flags = cls.FLAG_ADJACENCY_LIST
+        if wide:
+            flags |= cls.FLAG_WIDE_IDS
+        if sys.byteorder == "big":
+            flags |= cls.FLAG_BIG_ENDIAN
+
+        with open(filename, "wb") as file:
+            file.write(cls.HEADER.pack(cls.MAGIC, cls.VERSION, flags,
+                                       num_vertices, len(neighbors), num_edges))
+            array('q', offsets).tofile(file)
+            array(typecode, neighbors).tofile(file)
+            array(typecode, edge_index.get_edge_ids()).tofile(file)
+
+    @classmethod
+    def read(cls, filename: str):
+        """Mapeia um arquivo binário em memória e retorna os seus
+        vetores como visões do mapeamento, sem copiá-los.
+
+        Parâmetros
+        ----------
+        - filename (str): Nome do arquivo de entrada.
+
+        Retorno
+        -------
+        - offsets (memoryview): Deslocamentos do início da lista de cada vértice.
+        - neighbors (memoryview): Vértices adjacentes de todos os vértices.
+        - edge_ids (memoryview): Identificador da aresta de cada posição.
+        - num_edges (int): Quantidade de arestas do grafo.
+        """
+
+        with open(filename, "rb") as file:
+            mapping = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, flags, num_vertices, num_slots, num_edges = \
+            cls.HEADER.unpack_from(mapping, 0)
+        if magic != cls.MAGIC or version != cls.VERSION:
+            raise ValueError("O arquivo {} não está no formato binário " \
+                             "de grafos (versão {})".format(filename, cls.VERSION))
+        if not flags & cls.FLAG_ADJACENCY_LIST:
+            raise ValueError("Representação do arquivo {} não suportada".format(filename))
+        if bool(flags & cls.FLAG_BIG_ENDIAN) != (sys.byteorder == "big"):
+            raise ValueError("O arquivo {} foi gravado com outra ordem de bytes".format(filename))
+
+        typecode = 'q' if flags & cls.FLAG_WIDE_IDS else 'i'
+        item_size = struct.calcsize(typecode)
+        expected_size = cls.HEADER.size + 8 * (num_vertices + 1) + 2 * item_size * num_slots
+        if len(mapping) != expected_size:
+            raise ValueError("O arquivo {} está incompleto ou corrompido".format(filename))
+
+        # Visões dos vetores diretamente sobre as páginas mapeadas
+        view = memoryview(mapping)
+        start = cls.HEADER.size
+        end = start + 8 * (num_vertices + 1)
+        offsets = view[start:end].cast('q')
+        start, end = end, end + item_size * num_slots
+        neighbors = view[start:end].cast(typecode)
+        start, end = end, end + item_size * num_slots
+        edge_ids = view[start:end].cast(typecode)
+
+        return offsets, neighbors, edge_ids, num_edges
@@ -0,0 +1,52 @@
+from array import array
+from itertools import islice
+
+class CircuitWriter:
+    """Classe que abstrai a escrita de um circuito em um fluxo de
+    saída (terminal ou arquivo) em blocos grandes, sem montar o
+    texto do circuito inteiro em memória.
+
+    No formato texto, os vértices são separados por " -> ", como
+    em "0 -> 1 -> 0". No formato binário, o circuito é gravado como
+    um vetor contíguo de inteiros de 32 bits.
+
+    Parâmetros
+    ----------
+        - stream: Fluxo de saída (texto, ou binário se binary=True).
+        - binary (bool): Indica se o circuito é gravado no formato binário.
+        - block_size (int): Quantidade de vértices escritos por bloco.
+    """
+
+    SEPARATOR = " -> "
+
+    def __init__(self, stream, binary: bool = False, block_size: int = 1 << 16):
+        self.__stream = stream
+        self.__binary = binary
+        self.__block_size = block_size
+
+    def write(self, circuit):
+        """Escreve o circuito no fluxo de saída, bloco a bloco.
+
+        Parâmetros
+        ----------
+        - circuit (array | iterable): Vértices do circuito, em ordem.
+        """
+
+        if self.__binary:
+            if not isinstance(circuit, array) or circuit.typecode != 'i':
+                circuit = array('i', circuit)
+            self.__stream.write(memoryview(circuit)) # Sem copiar o vetor
+            self.__stream.flush()
+            return
+
+        vertices = iter(circuit)
+        separator = ""
+        while True:
+            block = list(islice(vertices, self.__block_size))
+            if not block: # Fim do circuito
+                break
+            # O separador liga o bloco atual ao bloco anterior
+            self.__stream.write(separator + self.SEPARATOR.join(map(str, block)))
+            separator = self.SEPARATOR
+        self.__stream.write("\n")
+        self.__stream.flush()
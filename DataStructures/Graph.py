@@ -1,28 +1,123 @@
-from itertools import combinations
+import sys
+import time
+from array import array
+from itertools import combinations, count
 from DataStructures.Stack import Stack
+from DataStructures.UnionFind import UnionFind
+from DataStructures.Hierholzer import Hierholzer
+from DataStructures.HamiltonianSolver import HamiltonianSolver
+from DataStructures.ToughnessPrecheck import ToughnessPrecheck
+from DataStructures.ParallelToughnessSearch import ParallelToughnessSearch
+from DataStructures.AnytimeToughnessSearch import AnytimeToughnessSearch
+from DataStructures.RandomizedToughnessSearch import RandomizedToughnessSearch
+from DataStructures.GraphReader import GraphReader
+from DataStructures.CircuitWriter import CircuitWriter
+from DataStructures.Profiler import PROFILER
 from DataStructures.GraphStructures.AdjacencyList import AdjacencyList
 from DataStructures.GraphStructures.AdjacencyMatrix import AdjacencyMatrix
 from DataStructures.GraphStructures.IncidenceMatrix import IncidenceMatrix
+from DataStructures.GraphStructures.CompressedSparseRow import CompressedSparseRow
+from DataStructures.GraphStructures.BitsetAdjacency import BitsetAdjacency
+try:
+    from DataStructures.GraphStructures.NumpyAdjacencyMatrix import NumpyAdjacencyMatrix
+except ImportError: # NumPy é opcional
+    NumpyAdjacencyMatrix = None
 
 class Graph:
     """Classe que abstrai a implementação de um grafo
     de maneira encapsulada.
 
+    Invariantes derivadas do grafo (graus, vértices de grau ímpar,
+    vizinhos, componentes e o último circuito euleriano) ficam em
+    cache. Cada alteração do estado de trabalho (travessias e grafos
+    induzidos) inicia uma nova época, e o cache só é usado na época
+    em que foi preenchido. Reiniciar o estado volta à época 0, a do
+    grafo original, cujo cache é mantido enquanto o grafo existir.
+    Os vizinhos não ficam em cache nas estruturas em vetores
+    contíguos, que os percorrem em O(grau) e cujo objetivo é ocupar
+    pouca memória.
+
     Parâmetros
     ----------
         - filename (str): Nome do arquivo de entrada
+        - backend (str): Estrutura utilizada para o grafo. "default" usa
+        as estruturas originais e "compact" usa estruturas em vetores
+        contíguos (CSR para listas de adjacência e NumPy para matrizes
+        de adjacência, caso esteja instalado). "bitset" representa a
+        vizinhança de cada vértice de listas de adjacência como uma
+        máscara de bits, para os algoritmos que avaliam subconjuntos.
+        - cache_neighbors (bool): Mantém em cache a lista de vizinhos de
+        cada vértice consultado. Útil apenas para matrizes, em que cada
+        consulta percorre uma linha inteira; como o cache repete a
+        vizinhança do grafo, fica desativado por padrão.
     """
 
-    def __init__(self, filename: str):
-        # Leitura do arquivo
-        file = open(filename, "r")
-        lines_of_file = file.readlines()
-        file.close()
+    # Tentativas da busca aleatória de subconjuntos quando nenhum limite é informado
+    DEFAULT_RESTARTS = 1000
+
+    # Estruturas de listas de adjacência de cada backend
+    ADJACENCY_LISTS = {"default": AdjacencyList, "compact": CompressedSparseRow,
+                       "bitset": BitsetAdjacency}
+
+    def __init__(self, filename: str, backend: str = "default", cache_neighbors: bool = False):
+        if backend not in self.ADJACENCY_LISTS:
+            raise ValueError("Estrutura desconhecida: {}".format(backend))
+        self.__backend = backend
 
         # Indica se o grafo é lista de adjacência
         self.__is_adjacency_list = False
-        # Cria a instância do grafo de acordo com os dados
-        self.__graph = self.create_graph(lines_of_file)
+        # Época do estado de trabalho: 0 é o grafo original, sem alterações
+        self.__epochs = count(1)
+        self.__epoch = 0
+        self.__base_cache = dict() # Invariantes do grafo original
+        self.__cache = dict() # Invariantes da época atual, se diferente de 0
+        self.__cache_epoch = 0
+        # Leitura do arquivo e criação da instância do grafo de acordo com os dados
+        with PROFILER.phase("load"):
+            self.__graph = self.read_graph(GraphReader(filename))
+        self.__cache_neighbors = cache_neighbors
+
+    def read_graph(self, reader: GraphReader):
+        """Cria a instância do grafo a partir do leitor do arquivo
+        de entrada. Arquivos binários são mapeados em memória sem
+        cópia, listas de adjacência são lidas em blocos
+        diretamente para vetores compactos, e matrizes são convertidas
+        de uma só vez para um vetor tipado. A leitura linha a linha
+        fica apenas como alternativa caso a conversão em bloco falhe.
+
+        Parâmetros
+        ----------
+        - reader (GraphReader): Leitor do arquivo de entrada.
+
+        Retorno
+        -------
+        - graph (AdjacencyList | AdjacencyMatrix | IncidenceMatrix | CompressedSparseRow |
+        BitsetAdjacency | NumpyAdjacencyMatrix): Instância do grafo.
+        """
+
+        file_format = reader.sniff_format()
+        if file_format == "binary": # Vetores mapeados em memória, já com as arestas identificadas
+            offsets, neighbors, edge_ids, num_edges = reader.read_binary()
+            self.__is_adjacency_list = True
+            adjacency_list = self.ADJACENCY_LISTS[self.__backend]
+            return adjacency_list.from_arrays(offsets, neighbors, edge_ids, num_edges)
+        if file_format == "adjacency_list":
+            offsets, neighbors = reader.read_adjacency_list()
+            self.__is_adjacency_list = True
+            return self.ADJACENCY_LISTS[self.__backend].from_arrays(offsets, neighbors)
+
+        try:
+            num_rows, num_columns, values = reader.read_matrix()
+        except ValueError: # Conversão em bloco falhou: segue pelas linhas do arquivo
+            return self.create_graph(reader.read_lines())
+
+        if num_columns == num_rows: # Se as linhas são iguais as colunas
+            # É matriz de adjacência (|V| x |V|)
+            if self.__backend == "compact" and NumpyAdjacencyMatrix is not None:
+                return NumpyAdjacencyMatrix.from_values(num_rows, values)
+            return AdjacencyMatrix.from_values(num_rows, values)
+        # Se não, é matriz de incidência (|V| x |A|)
+        return IncidenceMatrix.from_values(num_rows, num_columns, values)
 
     def create_graph(self, lines: list):
         """Cria a instância do grafo de acordo com
@@ -34,16 +129,20 @@ class Graph:
 
         Retorno
         -------
-        - graph (AdjacencyList | AdjacencyMatrix | IncidenceMatrix): Instância do grafo.
+        - graph (AdjacencyList | AdjacencyMatrix | IncidenceMatrix | CompressedSparseRow |
+        BitsetAdjacency | NumpyAdjacencyMatrix): Instância do grafo.
         """
 
         if ',' in lines[0]: # Se o arquivo de entrada possui vírgulas
             # É lista de adjacência
-            graph = AdjacencyList(lines)
+            graph = self.ADJACENCY_LISTS[self.__backend](lines)
             self.__is_adjacency_list = True
         elif len(lines[0].replace("\n", "").split(" ")) == len(lines): # Se as linhas são iguais as colunas
             # É matriz de adjacência (|V| x |V|)
-            graph = AdjacencyMatrix(lines)
+            if self.__backend == "compact" and NumpyAdjacencyMatrix is not None:
+                graph = NumpyAdjacencyMatrix(lines)
+            else:
+                graph = AdjacencyMatrix(lines)
         else: # Se não, é o último caso
             # É matriz de incidência (|V| x |A|)
             graph = IncidenceMatrix(lines)
@@ -51,13 +150,41 @@ class Graph:
         return graph
     
     def set_graph(self):
-        """Inicializa uma cópia do grafo para ser usada no algoritmo.
-        Pelo fato da estrutura sofrer alteração, trabalha em cima de
-        uma cópia para não alterar o grafo original e manter os dados.
+        """Inicializa o estado de trabalho do grafo para ser usado no
+        algoritmo. O grafo original nunca é copiado: as alterações
+        ficam em uma camada de trabalho, e reiniciá-la custa apenas
+        o proporcional ao que o algoritmo anterior alterou.
         """
 
+        if PROFILER.enabled:
+            PROFILER.count("set_graph")
         # Implementação encapsulada de acordo com a ED utilizada
         self.__graph.set_graph()
+        self.__epoch = 0 # O estado volta a ser o do grafo original
+
+    def __mutate(self):
+        # Inicia uma nova época após uma alteração do estado de trabalho
+        self.__epoch = next(self.__epochs)
+
+    def __current_cache(self):
+        # Retorna o cache das invariantes da época atual
+        if self.__epoch == 0:
+            return self.__base_cache
+        if self.__cache_epoch != self.__epoch: # Cache de uma época anterior
+            self.__cache = dict()
+            self.__cache_epoch = self.__epoch
+        return self.__cache
+
+    def __cached(self, key, compute):
+        # Retorna a invariante do cache, calculando-a apenas na primeira consulta da época
+        cache = self.__current_cache()
+        if key in cache:
+            if PROFILER.enabled:
+                PROFILER.count("cache_hits")
+            return cache[key]
+        value = compute()
+        cache[key] = value
+        return value
     
     def get_list_of_vertices(self):
         """Retorna a lista de vértices de um grafo.
@@ -79,50 +206,125 @@ class Graph:
 
         Retorno
         -------
-        - neighbors (list): Lista contendo os vizinhos de v.
+        - neighbors (list): Lista contendo os vizinhos de v, sem
+        repetições. A lista pode estar em cache e não deve ser alterada.
         """
 
-        # Implementação encapsulada de acordo com a ED utilizada
-        return self.__graph.find_neighbors(v)
+        if not self.__cache_neighbors: # Vizinhos percorridos diretamente na ED utilizada
+            return self.__graph.find_neighbors(v)
 
-    def dfs(self, v: int, visited: list):
+        neighbors_of = self.__current_cache().setdefault("neighbors", dict())
+        neighbors = neighbors_of.get(v)
+        if neighbors is None:
+            # Implementação encapsulada de acordo com a ED utilizada
+            neighbors = self.__graph.find_neighbors(v)
+            neighbors_of[v] = neighbors
+        return neighbors
+
+    def dfs(self, v: int, visited: dict, labels: dict = None, label: int = 0):
         """Algoritmo de busca em profundidade.
+        Utiliza uma pilha explícita no lugar da recursão, para que
+        grafos com muitos vértices (ex.: caminhos longos) não
+        estourem o limite de recursão do Python.
         
         Parâmetros
         ----------
         - v (int): Vértice de entrada.
-        - visited (list): Lista de booleanos dos vértices visitados.
+        - visited (dict): Dicionário de booleanos dos vértices visitados.
+        - labels (dict): Dicionário opcional que recebe o rótulo
+        do componente de cada vértice alcançado.
+        - label (int): Rótulo atribuído aos vértices alcançados.
         """
 
+        stack = Stack()
         visited[v] = True
-        neighbors_of_v = self.find_neighbors(v)
-        for w in neighbors_of_v: # Para cada vértice adjacente de v
-            if not visited[w]:
-                self.dfs(w, visited)
-
-    def depth_first_search_components(self):
-        """Inicializa o algoritmo de busca em profundidade.
-        Calcula o número de componentes de um grafo.
-        
+        stack.stack_up(v)
+        while not stack.is_empty():
+            u = stack.unstack()
+            if labels is not None:
+                labels[u] = label
+            for w in self.find_neighbors(u): # Para cada vértice adjacente de u
+                if not visited[w]:
+                    # Marca ao empilhar para que cada vértice entre na pilha uma única vez
+                    visited[w] = True
+                    stack.stack_up(w)
+
+    def union_find_components(self):
+        """Calcula os componentes de um grafo utilizando
+        conjuntos disjuntos (union-find) sobre as arestas.
+
         Retorno
         -------
         - count_components (int): Quantidade de componentes de um grafo.
+        - labels (dict): Dicionário contendo o rótulo do componente de cada vértice.
         """
 
+        vertices = self.get_list_of_vertices()
+        if not vertices:
+            return 0, dict()
+
+        sets = UnionFind(max(vertices) + 1)
+        for v in vertices: # Para cada vértice v do grafo
+            for w in self.find_neighbors(v): # Une v a cada vértice adjacente
+                sets.union(v, w)
+
+        # Rotula os componentes na ordem em que aparecem na lista de vértices
+        labels = dict()
+        label_of_root = dict()
+        for v in vertices:
+            root = sets.find(v)
+            if root not in label_of_root:
+                label_of_root[root] = len(label_of_root)
+            labels[v] = label_of_root[root]
+
+        return len(label_of_root), labels
+
+    def connected_components(self, method: str = None):
+        """Calcula os componentes de um grafo e o rótulo
+        do componente de cada vértice.
+
+        Parâmetros
+        ----------
+        - method (str): "dfs" para busca em profundidade com pilha
+        explícita ou "union_find" para conjuntos disjuntos. Se omitido,
+        usa o cálculo próprio da ED utilizada, quando existir, ou "dfs".
+
+        Retorno
+        -------
+        - count_components (int): Quantidade de componentes de um grafo.
+        - labels (dict): Dicionário contendo o rótulo do componente de cada vértice.
+        """
+
+        count_components, labels = self.__cached(("components", method),
+                                                 lambda: self.__connected_components(method))
+        return count_components, dict(labels) # Cópia: os rótulos em cache não são alterados
+
+    def __connected_components(self, method: str):
+        # Calcula os componentes sem consultar o cache
+        if method is None:
+            if hasattr(self.__graph, "connected_components"):
+                # Implementação encapsulada de acordo com a ED utilizada
+                return self.__graph.connected_components()
+            method = "dfs"
+        if method == "union_find":
+            return self.union_find_components()
+        if method != "dfs":
+            raise ValueError("Método de componentes desconhecido: {}".format(method))
+
         count_components = 0
         vertices = self.get_list_of_vertices()
         # Inicializa o dicionário de visitados
         visited = dict()
         for v in vertices:
             visited[v] = False
-        
+
+        labels = dict()
         for v in vertices: # Para cada vértice v do grafo
             if not visited[v]:
-                self.dfs(v, visited)
+                self.dfs(v, visited, labels, count_components)
                 count_components += 1
-        
-        # print("Número de componentes: {}".format(count_components))
-        return count_components
+
+        return count_components, labels
 
     def is_connected(self):
         """Retorna se um grafo é conectado.
@@ -133,8 +335,9 @@ class Graph:
         - is_connected (bool): Booleano indicando se um grafo é conectado ou não.
         """
 
-        # Implementação encapsulada de acordo com a ED utilizada
-        return self.depth_first_search_components() == 1
+        with PROFILER.phase("is_connected"):
+            return self.__cached(("components", None),
+                                 lambda: self.__connected_components(None))[0] == 1
 
     def is_eulerian(self):
         """Retorna se um grafo é euleriano.
@@ -145,8 +348,56 @@ class Graph:
         - is_eulerian (bool): Booleano indicando se um grafo é euleriano ou não.
         """
 
-        # Implementação encapsulada de acordo com a ED utilizada
-        return self.__graph.is_eulerian()
+        with PROFILER.phase("is_eulerian"):
+            # Os graus são sempre os do grafo original
+            if "odd_vertices" in self.__base_cache: # Paridade já conhecida pelos graus
+                return not self.__base_cache["odd_vertices"]
+            # Implementação encapsulada de acordo com a ED utilizada
+            return self.__base_cached("is_eulerian", self.__graph.is_eulerian)
+
+    def get_degrees(self):
+        """Retorna o grau de cada vértice do grafo original.
+        Um laço soma 2 ao grau do seu vértice.
+
+        Retorno
+        -------
+        - degrees (dict): Dicionário contendo o grau de cada vértice.
+        """
+
+        return dict(self.__base_cached("degrees", self.__compute_degrees))
+
+    def __compute_degrees(self):
+        # Calcula os graus a partir da estrutura de incidência das arestas
+        offsets, targets, edge_ids, num_edges = self.get_incidence_arrays()
+        degrees = dict()
+        for v in range(len(offsets) - 1):
+            degree = offsets[v+1] - offsets[v]
+            for slot in range(offsets[v], offsets[v+1]):
+                if targets[slot] == v: # Laço: conta como 2
+                    degree += 1
+            degrees[v] = degree
+        return degrees
+
+    def get_odd_vertices(self):
+        """Retorna os vértices de grau ímpar do grafo original.
+
+        Retorno
+        -------
+        - odd_vertices (set): Conjunto dos vértices de grau ímpar.
+        """
+
+        odd_vertices = self.__base_cached("odd_vertices",
+            lambda: frozenset(v for v, degree in self.get_degrees().items() if degree % 2 != 0))
+        return set(odd_vertices)
+
+    def __base_cached(self, key, compute):
+        # Invariantes do grafo original, independentes do estado de trabalho
+        cache = self.__base_cache
+        if key not in cache:
+            cache[key] = compute()
+        elif PROFILER.enabled:
+            PROFILER.count("cache_hits")
+        return cache[key]
     
     def count_edges(self):
         """Retorna a quantidade de arestas que incidem em cada vértice.
@@ -158,7 +409,7 @@ class Graph:
         """
 
         # Implementação encapsulada de acordo com a ED utilizada
-        return self.__graph.count_edges()
+        return dict(self.__base_cached("count_edges", self.__graph.count_edges))
 
     def traverse(self, u: int):
         """Atravessa uma aresta (u,v) do grafo.
@@ -172,69 +423,113 @@ class Graph:
         - v (int): Vértice de destino.
         """
 
+        self.__mutate() # A aresta atravessada deixa de existir no estado de trabalho
         # Implementação encapsulada de acordo com a ED utilizada
         return self.__graph.traverse(u)
 
-    def get_eulerian_circuit(self, initial_v: int = 0):
-        """Retorna um circuito euleriano para um dado grafo.
+    def get_incidence_arrays(self):
+        """Retorna a estrutura de incidência das arestas do grafo,
+        em que cada aresta não direcionada possui um identificador.
+
+        Retorno
+        -------
+        - offsets (array): Deslocamentos do início da lista de cada vértice.
+        - targets (array): Vértice alcançado por cada posição.
+        - edge_ids (array): Identificador da aresta de cada posição.
+        - num_edges (int): Quantidade de arestas do grafo.
+        """
+
+        # Implementação encapsulada de acordo com a ED utilizada
+        return self.__graph.get_incidence_arrays()
+
+    def find_eulerian_circuit(self, initial_v: int = 0):
+        """Retorna um circuito euleriano para um dado grafo,
+        sem exibi-lo.
         
         Parâmetros
         ----------
         - initial_v (int): Vértice de partida do circuito.
+
+        Retorno
+        -------
+        - circuit (array | None): Vetor de inteiros com os vértices do
+        circuito euleriano, ou None caso o grafo não possua um.
         """
 
-        # Inicializa uma cópia do grafo para ser usada no algoritmo
-        self.set_graph() # Alterações serão feitas
-        
+        # Reinicia o estado de trabalho do grafo
+        self.set_graph()
+
         # Requisitos para encontrar um circuito euleriano
-        if not self.is_connected():
-            print("O grafo não é conectado, " \
-                  "portanto não possui um circuito euleriano!")
-        elif not self.is_eulerian():
-            print("O grafo não possui todos os vértices com grau par, " \
-                  "portanto não possui um circuito euleriano!")
-        else:
-            final_circuit = Stack() # Pilha contendo os vértices do circuito final
-            current_circuit = Stack() # Pilha contendo os vértices do circuito intermediário
-            
-            # Dicionário contendo a quantidade de arestas de cada vértice
-            count_remaining_edges = self.count_edges()
-            
-            current_v = initial_v
-            current_circuit.stack_up(current_v)
-            while not current_circuit.is_empty(): # Enquanto houver um circuito a ser explorado
-                # Se o vértice atual possui aresta para ser explorada
-                if count_remaining_edges[current_v] > 0:
-                    current_circuit.stack_up(current_v) # Empilha o vértice atual
-                    
-                    # Busca o próximo vértice (atravessa uma aresta)
-                    next_v = self.traverse(current_v)
-                    
-                    # Após atravessar a aresta, ela não pode mais ser considerada (Atravessa somente uma vez)
-                    count_remaining_edges[current_v] -= 1 # Diminui a qtde de arestas restantes do vértice atual
-                    if current_v != next_v: # Se a aresta é um laço não precisa diminuir duas vezes
-                        count_remaining_edges[next_v] -= 1 # Diminui a qtde de arestas restantes do próximo vértice
-                    
-                    current_v = next_v # Atribui o próximo vértice como sendo o vértice atual
-                else: # Se o vértice atual não possui mais arestas para serem exploradas
-                    final_circuit.stack_up(current_v) # Empilha o vértice atual (Terminou um circuito)
-                    current_v = current_circuit.unstack() # O vértice atual passa a ser o vértice anterior
-                    # Busca um novo circuito a partir do vértice anterior
-            
-            # Exibe o circuito euleriano encontrado desempilhando os vértices do circuito final
+        if not self.is_connected() or not self.is_eulerian():
+            return None
+
+        with PROFILER.phase("eulerian_circuit"):
+            circuit = self.__base_cache.get("circuit")
+            if circuit is None:
+                # Algoritmo de Hierholzer sobre as arestas identificadas, independente da ED
+                circuit = Hierholzer(*self.get_incidence_arrays()).find_circuit(initial_v)
+                self.__base_cache["circuit"] = circuit
+                return array('i', circuit) # Cópia: o circuito em cache não é alterado
+            if PROFILER.enabled:
+                PROFILER.count("cache_hits")
+            return self.__rotate_circuit(circuit, initial_v)
+
+    def __rotate_circuit(self, circuit: array, initial_v: int):
+        """Retorna o circuito em cache começando em outro vértice.
+        Um circuito fechado c[0], ..., c[m] = c[0] passa por initial_v
+        em alguma posição i, e c[i:m] + c[0:i] + [initial_v] é um
+        circuito euleriano que começa e termina em initial_v.
+        """
+
+        if circuit[0] == initial_v:
+            return array('i', circuit)
+        try:
+            i = circuit.index(initial_v)
+        except ValueError: # initial_v não pertence ao circuito (ex.: grafo sem arestas)
+            return Hierholzer(*self.get_incidence_arrays()).find_circuit(initial_v)
+        rotated = circuit[i:-1]
+        rotated.extend(circuit[:i])
+        rotated.append(initial_v)
+        return rotated
+
+    def get_eulerian_circuit(self, initial_v: int = 0, writer: CircuitWriter = None):
+        """Retorna e exibe um circuito euleriano para um dado grafo.
+        
+        Parâmetros
+        ----------
+        - initial_v (int): Vértice de partida do circuito.
+        - writer (CircuitWriter): Escritor utilizado para gravar o circuito.
+        Se omitido, o circuito é exibido no terminal no formato texto.
+
+        Retorno
+        -------
+        - circuit (array | None): Vetor de inteiros com os vértices do
+        circuito euleriano, ou None caso o grafo não possua um.
+        """
+
+        circuit = self.find_eulerian_circuit(initial_v)
+        if circuit is None:
+            if not self.is_connected():
+                print("O grafo não é conectado, " \
+                      "portanto não possui um circuito euleriano!")
+            else:
+                print("O grafo não possui todos os vértices com grau par, " \
+                      "portanto não possui um circuito euleriano!")
+            return None
+
+        if writer is None: # Exibe o circuito euleriano encontrado no terminal
             print("Circuito euleriano encontrado: ", end="")
-            eulerian_circuit = ""
-            while not final_circuit.is_empty():
-                v = final_circuit.unstack()
-                eulerian_circuit += "{} -> ".format(v)
-            eulerian_circuit = eulerian_circuit[:-4]
-            print(eulerian_circuit)
+            writer = CircuitWriter(sys.stdout)
+        with PROFILER.phase("output"):
+            writer.write(circuit)
+
+        return circuit
     
     def is_adjacency_list(self):
         """Retorna se o grafo é uma lista de adjacência.
-        Método utilizado apenas para verificar a ED utilizada
-        antes de fazer o algoritmo de verificação de grafos
-        hamiltonianos.
+        Todas as EDs implementam o grafo induzido G-S, então a
+        verificação de grafos hamiltonianos não depende mais deste
+        método.
         
         Retorno
         -------
@@ -261,30 +556,575 @@ class Graph:
 
         return result
 
-    def is_hamiltonian(self):
-        """Retorna se um grafo é hamiltoniano ou não.
-        
+    def get_subsets_of_v(self, max_size: int = None):
+        """Gera, sob demanda, os subconjuntos não vazios dos vértices
+        de um grafo em ordem crescente de tamanho. Diferente do
+        conjunto potência, apenas uma combinação fica em memória por vez.
+
+        Parâmetros
+        ----------
+        - max_size (int): Tamanho máximo dos subconjuntos gerados.
+        Se omitido, gera até |V|-1 (subconjuntos próprios).
+
         Retorno
         -------
-        - is_hamiltonian (bool): Booleano indicando se o grafo
-        é hamiltoniano ou não.
+        - subsets (generator): Gerador de tuplas contendo os vértices
+        de cada subconjunto.
         """
 
-        # Inicializa uma cópia do grafo para ser usada no algoritmo
-        self.set_graph() # Alterações serão feitas
+        vertices = self.get_list_of_vertices()
+        if max_size is None:
+            max_size = len(vertices) - 1
+        for size in range(1, max_size + 1): # 1,2,...,max_size
+            yield from combinations(vertices, size)
 
-        any_S = self.get_powerset_of_v()
-        any_S.pop(0) # Remove o conjunto vazio
-        any_S.pop() # Remove o conjunto que é igual a V
+    def find_toughness_violator(self, method: str = "gray_code", precheck: bool = True,
+                                workers: int = None):
+        """Busca um subconjunto próprio não vazio S c V que viole
+        a condição necessária w(G-S) <= |S| de grafos hamiltonianos.
+        Como w(G-S) <= |V|-|S|, somente subconjuntos com
+        |S| <= (|V|-1)/2 podem violar a condição, e os demais não
+        são avaliados.
+
+        Parâmetros
+        ----------
+        - method (str): "gray_code" para a avaliação incremental em
+        ordem de código de Gray, "enumeration" para enumerar os
+        subconjuntos por tamanho, recriando G-S a cada um, ou
+        "parallel" para dividir os subconjuntos entre vários processos.
+        - precheck (bool): Indica se as verificações polinomiais
+        (desconexão, grau mínimo, articulações, bipartição e
+        separadores de 2 vértices) são feitas antes da busca exponencial.
+        - workers (int): Quantidade de processos do método "parallel".
+        Se omitido, usa a quantidade de núcleos da máquina.
 
-        for s in any_S: # Para qualquer subconjunto próprio não vazio S c V
+        Retorno
+        -------
+        - s (tuple | None): Subconjunto S encontrado que viola a
+        condição, ou None caso nenhum subconjunto a viole.
+        """
+
+        if precheck:
+            violator = self.precheck_toughness_violator()
+            if violator is not None:
+                return violator
+
+        if method == "gray_code":
+            return self.gray_code_toughness_violator()
+        if method == "parallel":
+            return self.parallel_toughness_violator(workers)
+        if method != "enumeration":
+            raise ValueError("Método de enumeração desconhecido: {}".format(method))
+
+        # Reinicia o estado de trabalho do grafo
+        self.set_graph() # Alterações serão feitas
+
+        max_size = (len(self.get_list_of_vertices()) - 1) // 2
+        for s in self.get_subsets_of_v(max_size): # Para cada S que pode violar a condição
+            if PROFILER.enabled:
+                PROFILER.count("subsets_examined")
             self.__graph.set_induced_graph(s) # Grafo induzido G-S
-            # Busca em profundidade para encontrar o número de componentes do grafo induzido G-S
-            num_components = self.depth_first_search_components() # w(G-S)
+            self.__mutate()
+            if hasattr(self.__graph, "count_components"):
+                # Contagem própria da ED utilizada (ex.: máscaras de bits)
+                num_components = self.__graph.count_components() # w(G-S)
+            else:
+                # Componentes do grafo induzido G-S, pelo mesmo cache da época atual
+                num_components = self.__cached(("components", None),
+                                               lambda: self.__connected_components(None))[0] # w(G-S)
             if num_components > len(s): # Se w(G-S) <= |S|, continua verificando
-                print("O grafo não é hamiltoniano!")
-                return False
+                self.set_graph()
+                return s
+
+        self.set_graph()
+        return None
+
+    def precheck_toughness_violator(self, deadline: float = None, tiers: tuple = None):
+        """Busca um subconjunto S que viole w(G-S) <= |S| apenas com
+        verificações polinomiais, cuja testemunha é confirmada antes
+        de ser devolvida. Não encontrar S não garante que o grafo
+        satisfaça a condição.
+
+        Parâmetros
+        ----------
+        - deadline (float): Instante (time.perf_counter) a partir do
+        qual as verificações restantes são puladas. Se omitido, não há limite.
+        - tiers (tuple): Verificações feitas, entre as de
+        ToughnessPrecheck.TIERS. Se omitido, faz todas.
+
+        Retorno
+        -------
+        - s (tuple | None): Subconjunto S encontrado que viola a
+        condição, ou None caso nenhuma verificação encontre um.
+        """
+
+        # Reinicia o estado de trabalho do grafo
+        self.set_graph()
+
+        vertices, adjacency = self.__indexed_adjacency()
+        precheck = ToughnessPrecheck(adjacency, self.__masks())
+        tier, violator = precheck.find_violator(deadline, tiers)
+        if violator is None:
+            return None
+        if PROFILER.enabled: # Verificação que encontrou a violação
+            PROFILER.count("precheck_" + tier)
+        return tuple(vertices[i] for i in violator)
+
+    def gray_code_toughness_violator(self):
+        """Busca um subconjunto S que viole w(G-S) <= |S| visitando
+        os subconjuntos em ordem de código de Gray, de modo que dois
+        subconjuntos consecutivos diferem em apenas um vértice.
+
+        O grafo induzido G-S não é recriado: seus componentes são
+        mantidos em conjuntos disjuntos com desfazer. Inserir um
+        vértice em G-S une-o aos seus vizinhos já presentes, em
+        O(grau(v) log |V|), e retirá-lo desfaz apenas essas uniões.
+        Com o backend "bitset", os componentes são máscaras de
+        vértices, e inserir um vértice funde, com um E e um OU por
+        componente, os que tocam a sua máscara de vizinhos.
+
+        Retorno
+        -------
+        - s (tuple | None): Primeiro subconjunto S encontrado que viola
+        a condição, ou None caso nenhum subconjunto a viole.
+        """
+
+        # Reinicia o estado de trabalho do grafo
+        self.set_graph()
+
+        vertices = self.get_list_of_vertices()
+        max_size = (len(vertices) - 1) // 2
+        if max_size < 1: # Não há subconjunto que possa violar a condição
+            return None
+
+        masks = self.__masks()
+        if masks is not None: # Vértices já numerados de 0 a n-1 nas máscaras
+            search = _BitsetGrayCodeSearch(masks, max_size)
+        else:
+            vertices, adjacency = self.__indexed_adjacency()
+            search = _GrayCodeSearch(adjacency, max_size)
+        violator = search.run()
+        if violator is None:
+            return None
+        return tuple(vertices[i] for i in violator)
+
+    def parallel_toughness_violator(self, workers: int = None):
+        """Busca um subconjunto S que viole w(G-S) <= |S| dividindo
+        os subconjuntos, por tamanho, em intervalos avaliados em
+        vários processos. A busca para assim que algum processo
+        encontra uma violação.
+
+        Parâmetros
+        ----------
+        - workers (int): Quantidade de processos. Se omitido, usa a
+        quantidade de núcleos da máquina.
+
+        Retorno
+        -------
+        - s (tuple | None): Subconjunto S encontrado que viola a
+        condição, ou None caso nenhum subconjunto a viole.
+        """
+
+        # Reinicia o estado de trabalho do grafo
+        self.set_graph()
+
+        vertices, adjacency = self.__indexed_adjacency()
+        max_size = (len(vertices) - 1) // 2
+        if max_size < 1: # Não há subconjunto que possa violar a condição
+            return None
+
+        violator, examined = ParallelToughnessSearch(adjacency, max_size, workers).run()
+        if PROFILER.enabled:
+            PROFILER.count("subsets_examined", examined)
+        if violator is None:
+            return None
+        return tuple(vertices[i] for i in violator)
+
+    def anytime_toughness_violator(self, time_budget: float = None, subset_budget: int = None,
+                                   checkpoint: str = None, report=None, report_interval: float = 10.0,
+                                   precheck: bool = True):
+        """Busca um subconjunto S que viole w(G-S) <= |S| com limite
+        de tempo ou de subconjuntos avaliados, relatando o progresso e
+        gravando a posição da busca em um checkpoint, a partir do qual
+        uma nova execução continua.
+
+        Parâmetros
+        ----------
+        - time_budget (float): Tempo máximo da busca, em segundos.
+        - subset_budget (int): Quantidade máxima de subconjuntos avaliados.
+        - checkpoint (str): Arquivo JSON com a posição da busca.
+        - report (callable): Função chamada com o progresso (subconjuntos
+        avaliados, total e subconjuntos por segundo).
+        - report_interval (float): Intervalo entre relatos e gravações
+        do checkpoint, em segundos.
+        - precheck (bool): Indica se as verificações polinomiais são
+        feitas antes da busca. Com limite de tempo, apenas as de tempo
+        linear são feitas, e o tempo delas conta no limite.
+
+        Retorno
+        -------
+        - s (tuple | None): Subconjunto S encontrado que viola a
+        condição, ou None caso nenhum subconjunto avaliado a viole.
+        - complete (bool): Indica se a resposta é definitiva.
+        - examined (int): Quantidade de subconjuntos avaliados.
+        """
+
+        start_time = time.perf_counter()
+        deadline = None if time_budget is None else start_time + time_budget
+        if precheck:
+            tiers = None if time_budget is None else ToughnessPrecheck.LINEAR_TIERS
+            violator = self.precheck_toughness_violator(deadline, tiers)
+            if violator is not None:
+                return violator, True, 0
+
+        # Reinicia o estado de trabalho do grafo
+        self.set_graph()
+
+        vertices, adjacency = self.__indexed_adjacency()
+        max_size = (len(vertices) - 1) // 2
+        if time_budget is not None: # Desconta o tempo das verificações polinomiais
+            time_budget = max(0.0, deadline - time.perf_counter())
+        search = AnytimeToughnessSearch(adjacency, max_size, time_budget, subset_budget,
+                                        checkpoint, report, report_interval)
+        violator, complete, examined = search.run()
+        if PROFILER.enabled:
+            PROFILER.count("subsets_examined", examined)
+        if violator is None:
+            return None, complete, examined
+        return tuple(vertices[i] for i in violator), complete, examined
+
+    def randomized_toughness_violator(self, seed: int = None, time_budget: float = None,
+                                      restarts: int = None, precheck: bool = True):
+        """Busca um subconjunto S que viole w(G-S) <= |S| com
+        tentativas aleatórias e busca local, em tempo limitado. Um S
+        encontrado prova que o grafo não é hamiltoniano, mas não
+        encontrar S não prova que ele satisfaça a condição.
+
+        Parâmetros
+        ----------
+        - seed (int): Semente do gerador aleatório.
+        - time_budget (float): Tempo máximo da busca, em segundos.
+        - restarts (int): Quantidade máxima de tentativas. Se nenhum
+        limite for informado, usa DEFAULT_RESTARTS tentativas.
+        - precheck (bool): Indica se as verificações polinomiais são
+        feitas antes da busca. Com limite de tempo, apenas as de tempo
+        linear são feitas, e o tempo delas conta no limite.
+
+        Retorno
+        -------
+        - s (tuple | None): Subconjunto S encontrado que viola a
+        condição, ou None caso nenhuma tentativa encontre um.
+        - num_components (int | None): w(G-S) do S encontrado.
+        - attempts (int): Quantidade de tentativas feitas.
+        """
+
+        start_time = time.perf_counter()
+        deadline = None if time_budget is None else start_time + time_budget
+        if precheck:
+            tiers = None if time_budget is None else ToughnessPrecheck.LINEAR_TIERS
+            violator = self.precheck_toughness_violator(deadline, tiers)
+            if violator is not None:
+                self.__graph.set_induced_graph(violator) # Certificado: w(G-S)
+                self.__mutate()
+                num_components = self.connected_components()[0]
+                self.set_graph()
+                return violator, num_components, 0
+
+        # Reinicia o estado de trabalho do grafo
+        self.set_graph()
+
+        if time_budget is None and restarts is None:
+            restarts = self.DEFAULT_RESTARTS
+        vertices, adjacency = self.__indexed_adjacency()
+        search = RandomizedToughnessSearch(adjacency, (len(vertices) - 1) // 2, seed)
+        if time_budget is not None: # Desconta o tempo das verificações polinomiais
+            time_budget = max(0.0, deadline - time.perf_counter())
+        violator, num_components, attempts, examined = search.run(time_budget, restarts)
+        if PROFILER.enabled:
+            PROFILER.count("subsets_examined", examined)
+        if violator is None:
+            return None, None, attempts
+        return tuple(vertices[i] for i in violator), num_components, attempts
+
+    def __indexed_adjacency(self):
+        # Vizinhos de cada vértice representados pelas suas posições na lista de vértices
+        vertices = self.get_list_of_vertices()
+        index_of = dict()
+        for i in range(len(vertices)):
+            index_of[vertices[i]] = i
+        adjacency = [[index_of[w] for w in self.find_neighbors(v)] for v in vertices]
+        return vertices, adjacency
+
+    def __masks(self):
+        # Máscaras de vizinhos da ED utilizada, caso ela as tenha (backend "bitset")
+        if hasattr(self.__graph, "get_masks"):
+            return self.__graph.get_masks()
+        return None
+
+    def find_hamiltonian_cycle(self, method: str = None):
+        """Busca exatamente um ciclo hamiltoniano, sem exibi-lo.
+        Diferente de is_hamiltonian, que verifica apenas uma condição
+        necessária, a resposta é definitiva e vem acompanhada do ciclo.
+
+        Parâmetros
+        ----------
+        - method (str): "dp" para a programação dinâmica sobre máscaras
+        de bits ou "backtracking" para a busca com retrocesso. Se
+        omitido, a programação dinâmica é usada em grafos pequenos.
+
+        Retorno
+        -------
+        - cycle (list | None): Vértices do ciclo hamiltoniano, começando
+        e terminando no mesmo vértice, ou None caso o grafo não possua um.
+        """
+
+        # Reinicia o estado de trabalho do grafo
+        self.set_graph()
+
+        def find_cycle():
+            vertices, adjacency = self.__indexed_adjacency()
+            cycle = HamiltonianSolver(adjacency).find_cycle(method)
+            if cycle is None:
+                return None
+            return [vertices[i] for i in cycle]
+
+        cycle = self.__cached(("hamiltonian_cycle", method), find_cycle)
+        return None if cycle is None else list(cycle)
+
+    def get_hamiltonian_cycle(self, method: str = None):
+        """Busca exatamente um ciclo hamiltoniano e o exibe.
+
+        Parâmetros
+        ----------
+        - method (str): Método de busca (ver find_hamiltonian_cycle).
+
+        Retorno
+        -------
+        - cycle (list | None): Vértices do ciclo hamiltoniano, ou None
+        caso o grafo não possua um.
+        """
+
+        with PROFILER.phase("hamiltonian_cycle"):
+            cycle = self.find_hamiltonian_cycle(method)
+        if cycle is None:
+            print("O grafo não possui um ciclo hamiltoniano!")
+            return None
+
+        print("Ciclo hamiltoniano encontrado: ", end="")
+        CircuitWriter(sys.stdout).write(cycle)
+        return cycle
+
+    def is_hamiltonian(self, method: str = "gray_code", workers: int = None,
+                       time_budget: float = None, subset_budget: int = None,
+                       checkpoint: str = None, report=None, report_interval: float = 10.0,
+                       seed: int = None, restarts: int = None):
+        """Retorna se um grafo é hamiltoniano ou não.
+
+        Parâmetros
+        ----------
+        - method (str): Método de busca (ver find_toughness_violator),
+        "anytime" para a busca com limites e checkpoint (ver
+        anytime_toughness_violator) ou "randomized" para a busca
+        aleatória (ver randomized_toughness_violator).
+        - workers (int): Quantidade de processos do método "parallel".
+        - time_budget (float): Tempo máximo dos métodos "anytime" e
+        "randomized", em segundos.
+        - subset_budget (int): Quantidade máxima de subconjuntos do método "anytime".
+        - checkpoint (str): Arquivo de checkpoint do método "anytime".
+        - report (callable): Função de progresso do método "anytime".
+        - report_interval (float): Intervalo entre relatos e checkpoints
+        do método "anytime", em segundos.
+        - seed (int): Semente do método "randomized".
+        - restarts (int): Quantidade máxima de tentativas do método "randomized".
+        
+        Retorno
+        -------
+        - is_hamiltonian (bool | None): Booleano indicando se o grafo
+        é hamiltoniano ou não, ou None caso a busca tenha esgotado o
+        limite sem resposta definitiva.
+        """
+
+        with PROFILER.phase("is_hamiltonian"):
+            if method == "anytime":
+                violator, complete, examined = self.anytime_toughness_violator(
+                    time_budget, subset_budget, checkpoint, report, report_interval)
+            elif method == "randomized":
+                violator, num_components, attempts = self.randomized_toughness_violator(
+                    seed, time_budget, restarts)
+                complete = violator is not None # Apenas uma violação é definitiva
+            else:
+                violator, complete = self.find_toughness_violator(method, workers=workers), True
+        if method == "randomized" and not complete:
+            print("Nenhum subconjunto violador encontrado após {} tentativas: " \
+                  "resultado inconclusivo!".format(attempts))
+            return None
+        if not complete:
+            print("Resultado inconclusivo após {} subconjuntos avaliados!".format(examined))
+            return None
+        if method == "randomized": # Certificado da violação
+            print("Subconjunto S com |S| = {} e w(G-S) = {}: {}".format(
+                len(violator), num_components, ", ".join(map(str, violator))))
+        if violator is not None:
+            print("O grafo não é hamiltoniano!")
+            return False
         
         print("O grafo pode ser hamiltoniano!")
         return True
 
+
+class _GrayCodeSearch:
+    """Estado da busca de subconjuntos em ordem de código de Gray
+    utilizada por Graph.gray_code_toughness_violator.
+
+    O bit i indica se o vértice i pertence a S. A visita do nível i
+    percorre o nível i+1, inverte o bit i e percorre o nível i+1
+    novamente, gerando o código de Gray refletido.
+
+    Parâmetros
+    ----------
+        - adjacency (list): Vizinhos de cada vértice (0, 1, ..., n-1).
+        - max_size (int): Tamanho máximo de S.
+    """
+
+    def __init__(self, adjacency: list, max_size: int):
+        self.__adjacency = adjacency
+        self.__max_size = max_size
+        self.__n = len(adjacency)
+        self.__in_s = [False] * self.__n # Bit de cada vértice no código de Gray
+        self.__kept = [False] * self.__n # Vértices presentes em G-S
+        self.__sets = UnionFind(self.__n, rollback=True)
+
+    def run(self):
+        """Executa a busca.
+
+        Retorno
+        -------
+        - s (list | None): Índices dos vértices de S que viola a
+        condição, ou None caso nenhum subconjunto a viole.
+        """
+
+        return self.__visit()
+
+    def __visit(self):
+        # Percorre a árvore do código de Gray com pilha explícita (sem limite de recursão).
+        # Cada nível guarda o vértice i, |S| e w(G-S) até i, a metade em
+        # andamento (0 ou 1; 2 quando as duas foram percorridas) e o
+        # checkpoint da união de i a G-S, a ser desfeita ao fim da metade.
+        n = self.__n
+        in_s = self.__in_s
+        kept = self.__kept
+        sets = self.__sets
+        frames = [[0, 0, 0, 0, None]]
+        while frames:
+            frame = frames[-1]
+            i, size_s, num_components, half, checkpoint = frame
+            if half > 0: # Volta de uma metade: desfaz a entrada de i em G-S
+                if not in_s[i]:
+                    kept[i] = False
+                    sets.rollback(checkpoint) # Retira o vértice i de G-S
+                if half == 1: # Inverte o bit i entre as duas metades
+                    in_s[i] = not in_s[i]
+                else:
+                    frames.pop()
+                    continue
+
+            frame[3] = half + 1
+            if in_s[i]: # Vértice i em S: não entra em G-S
+                size_next, components_next = size_s + 1, num_components
+            else: # Vértice i em G-S: une aos vizinhos já presentes
+                frame[4] = sets.checkpoint()
+                kept[i] = True
+                components_next = num_components + 1
+                for j in self.__adjacency[i]:
+                    if kept[j] and sets.union(i, j):
+                        components_next -= 1
+                size_next = size_s
+
+            if size_next > self.__max_size: # S grande demais para violar a condição
+                continue
+            if i + 1 == n: # S completo: verifica w(G-S) > |S|
+                if PROFILER.enabled:
+                    PROFILER.count("subsets_examined")
+                if size_next > 0 and components_next > size_next:
+                    return [j for j in range(n) if in_s[j]]
+                continue
+            frames.append([i + 1, size_next, components_next, 0, None])
+
+        return None
+
+
+class _BitsetGrayCodeSearch:
+    """Estado da busca de subconjuntos em ordem de código de Gray
+    utilizada por Graph.gray_code_toughness_violator com as máscaras
+    de vizinhos do backend "bitset".
+
+    A ordem de visita é a mesma de _GrayCodeSearch, mas cada nível
+    guarda as máscaras dos componentes de G-S até o vértice i. Como
+    cada nível cria a sua própria lista, voltar de uma metade não
+    precisa desfazer nada.
+
+    Parâmetros
+    ----------
+        - masks (list): Máscara dos vizinhos de cada vértice (0, 1, ..., n-1).
+        - max_size (int): Tamanho máximo de S.
+    """
+
+    def __init__(self, masks: list, max_size: int):
+        self.__masks = masks
+        self.__max_size = max_size
+        self.__n = len(masks)
+        self.__in_s = [False] * self.__n # Bit de cada vértice no código de Gray
+
+    def run(self):
+        """Executa a busca.
+
+        Retorno
+        -------
+        - s (list | None): Índices dos vértices de S que viola a
+        condição, ou None caso nenhum subconjunto a viole.
+        """
+
+        return self.__visit()
+
+    def __visit(self):
+        # Pilha explícita como em _GrayCodeSearch: cada nível guarda o vértice i,
+        # |S| e os componentes de G-S até i, e a metade em andamento
+        n = self.__n
+        masks = self.__masks
+        in_s = self.__in_s
+        frames = [[0, 0, [], 0]]
+        while frames:
+            frame = frames[-1]
+            i, size_s, components, half = frame
+            if half == 2: # As duas metades foram percorridas
+                frames.pop()
+                continue
+            if half == 1: # Inverte o bit i entre as duas metades
+                in_s[i] = not in_s[i]
+
+            frame[3] = half + 1
+            if in_s[i]: # Vértice i em S: não entra em G-S
+                size_next, components_next = size_s + 1, components
+            else: # Vértice i em G-S: funde os componentes que tocam os seus vizinhos
+                neighbors = masks[i]
+                merged = 1 << i
+                components_next = []
+                for component in components:
+                    if component & neighbors:
+                        merged |= component
+                    else:
+                        components_next.append(component)
+                components_next.append(merged)
+                size_next = size_s
+
+            if size_next > self.__max_size: # S grande demais para violar a condição
+                continue
+            if i + 1 == n: # S completo: verifica w(G-S) > |S|
+                if PROFILER.enabled:
+                    PROFILER.count("subsets_examined")
+                if size_next > 0 and len(components_next) > size_next:
+                    return [j for j in range(n) if in_s[j]]
+                continue
+            frames.append([i + 1, size_next, components_next, 0])
+
+        return None
@@ -0,0 +1,149 @@
+import warnings
+from array import array
+try:
+    import numpy as np
+except ImportError: # NumPy é opcional
+    np = None
+from DataStructures.BinaryGraphFormat import BinaryGraphFormat
+
+class GraphReader:
+    """Classe que abstrai a leitura do arquivo de entrada de um grafo.
+    O formato é identificado a partir de um prefixo limitado do
+    arquivo, e listas de adjacência são lidas em blocos binários
+    grandes, convertidas diretamente para vetores compactos de
+    inteiros, sem manter as linhas do arquivo em memória. Matrizes
+    são convertidas de uma só vez para um vetor tipado.
+
+    Parâmetros
+    ----------
+        - filename (str): Nome do arquivo de entrada.
+        - chunk_size (int): Tamanho, em bytes, de cada bloco lido.
+    """
+
+    # Tamanho do prefixo utilizado para identificar o formato do arquivo
+    SNIFF_SIZE = 1 << 16
+
+    def __init__(self, filename: str, chunk_size: int = 1 << 22):
+        self.__filename = filename
+        self.__chunk_size = chunk_size
+
+    def sniff_format(self):
+        """Identifica o formato do arquivo a partir do seu prefixo.
+        Arquivos binários começam com um identificador próprio, e
+        listas de adjacência separam os vértices por vírgulas, o que
+        nunca ocorre nas matrizes. Se a matriz é de adjacência ou de
+        incidência só é decidido após a leitura, comparando a
+        quantidade de linhas e de colunas.
+
+        Retorno
+        -------
+        - format (str): "binary", "adjacency_list" ou "matrix".
+        """
+
+        with open(self.__filename, "rb") as file:
+            prefix = file.read(self.SNIFF_SIZE)
+
+        if BinaryGraphFormat.is_binary(prefix):
+            return "binary"
+        if b',' in prefix: # Se o arquivo de entrada possui vírgulas
+            return "adjacency_list"
+        return "matrix"
+
+    def read_lines(self):
+        """Retorna as linhas do arquivo de entrada.
+
+        Retorno
+        -------
+        - lines (list): Linhas do arquivo lido de entrada.
+        """
+
+        with open(self.__filename, "r") as file:
+            return file.readlines()
+
+    def read_adjacency_list(self):
+        """Lê uma lista de adjacência em blocos, convertendo os
+        vértices diretamente para vetores contíguos: os vizinhos de v
+        ficam em neighbors[offsets[v]:offsets[v+1]]. Cada linha do
+        arquivo corresponde a um vértice, como em readlines().
+
+        Retorno
+        -------
+        - offsets (array): Deslocamentos do início da lista de cada vértice.
+        - neighbors (array): Vértices adjacentes de todos os vértices.
+        """
+
+        offsets = array('q', [0])
+        neighbors = array('i')
+        remainder = b''
+        with open(self.__filename, "rb") as file:
+            while True:
+                chunk = file.read(self.__chunk_size)
+                if not chunk: # Fim do arquivo
+                    break
+                lines = (remainder + chunk).split(b'\n')
+                remainder = lines.pop() # A última linha pode continuar no próximo bloco
+                for line in lines:
+                    # Vírgulas viram espaços para que split() descarte os campos vazios
+                    neighbors.extend(map(int, line.replace(b',', b' ').split()))
+                    offsets.append(len(neighbors))
+
+        if remainder: # Última linha sem quebra de linha
+            neighbors.extend(map(int, remainder.replace(b',', b' ').split()))
+            offsets.append(len(neighbors))
+
+        return offsets, neighbors
+
+    def read_binary(self):
+        """Mapeia em memória um arquivo no formato binário, sem copiar
+        nem converter os seus vetores.
+
+        Retorno
+        -------
+        - offsets (memoryview): Deslocamentos do início da lista de cada vértice.
+        - neighbors (memoryview): Vértices adjacentes de todos os vértices.
+        - edge_ids (memoryview): Identificador da aresta de cada posição.
+        - num_edges (int): Quantidade de arestas do grafo.
+        """
+
+        return BinaryGraphFormat.read(self.__filename)
+
+    def read_matrix(self):
+        """Lê uma matriz (de adjacência ou de incidência) convertendo
+        todo o corpo do arquivo para um vetor tipado de uma só vez,
+        sem criar uma lista por linha. Com o NumPy instalado, a
+        conversão é feita inteiramente em C.
+
+        Retorno
+        -------
+        - num_rows (int): Quantidade de linhas da matriz.
+        - num_columns (int): Quantidade de colunas da matriz.
+        - values (array | numpy.ndarray): Valores da matriz, linha por linha.
+        """
+
+        with open(self.__filename, "rb") as file:
+            data = file.read()
+
+        end_of_first_line = data.find(b'\n')
+        first_line = data if end_of_first_line < 0 else data[:end_of_first_line]
+        num_columns = len(first_line.split())
+        # Cada quebra de linha encerra uma linha; a última pode não ter quebra
+        num_rows = data.count(b'\n')
+        if data and not data.endswith(b'\n'):
+            num_rows += 1
+
+        if np is not None:
+            with warnings.catch_warnings():
+                # Valores inválidos interrompem a conversão em vez de gerar um aviso
+                warnings.simplefilter("error", DeprecationWarning)
+                try:
+                    values = np.fromstring(data, dtype=np.int32, sep=' ')
+                except DeprecationWarning as error:
+                    raise ValueError(str(error))
+        else:
+            values = array('i', map(int, data.split()))
+
+        if num_columns == 0 or len(values) != num_rows * num_columns:
+            raise ValueError("A matriz do arquivo {} não possui {} linhas " \
+                             "com {} colunas".format(self.__filename, num_rows, num_columns))
+
+        return num_rows, num_columns, values
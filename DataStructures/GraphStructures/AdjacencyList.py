@@ -1,36 +1,80 @@
-import copy
+from array import array
+from DataStructures.GraphStructures.EdgeIndex import EdgeIndex
+from DataStructures.GraphStructures.WorkingState import WorkingState
+from DataStructures.Profiler import PROFILER
 
 class AdjacencyList:
     """Classe que abstrai a lista de adjacência
     de um grafo e suas operações.
 
+    Os vizinhos de cada vértice v ficam nos vetores contíguos, em
+    targets[offsets[v]:offsets[v+1]], que são a única cópia do grafo
+    original; as alterações ficam no estado de trabalho.
+
     Parâmetros
     ----------
         - lines (list): Linhas do arquivo de entrada.
     """
 
     def __init__(self, lines: list):
-        v = 0
-        self.__graph = dict()
+        offsets = array('q', [0])
+        targets = array('i')
         for line in lines:
             vertices = line.replace("\n", "").split(",")
             # Converte os vértices para inteiros
-            final_vertices = []
             for u in vertices:
                 if u != '':
-                    final_vertices.append(int(u))
-            self.__graph[v] = final_vertices # Atribui os vértices de v
-            v += 1
-        self.set_graph()
-        # print("Grafo: {}".format(self.__graph))
+                    targets.append(int(u))
+            offsets.append(len(targets))
+        self.__set_structure(offsets, targets)
+
+    @classmethod
+    def from_arrays(cls, offsets, targets, edge_ids=None, num_edges: int = None):
+        """Cria a lista de adjacência a partir de vetores contíguos,
+        em que os vizinhos de v ficam em targets[offsets[v]:offsets[v+1]].
+
+        Parâmetros
+        ----------
+        - offsets (array): Deslocamentos do início da lista de cada vértice.
+        - targets (array): Vértices adjacentes de todos os vértices.
+        - edge_ids (array): Identificador da aresta de cada posição, caso
+        já tenha sido calculado (ex.: arquivo binário).
+        - num_edges (int): Quantidade de arestas, junto com edge_ids.
+
+        Retorno
+        -------
+        - graph (AdjacencyList): Instância do grafo.
+        """
+
+        graph = cls.__new__(cls)
+        graph.__set_structure(offsets, targets, edge_ids, num_edges)
+        return graph
+
+    def __set_structure(self, offsets, targets, edge_ids=None, num_edges: int = None):
+        # Os vetores recebidos (inclusive os mapeados em memória) são usados sem cópia
+        self.__offsets = offsets
+        self.__targets = targets
+        self.__num_vertices = len(offsets) - 1
+
+        # Identificador da aresta de cada posição das listas de adjacência
+        if edge_ids is None:
+            edge_index = EdgeIndex(offsets, targets)
+            edge_ids, num_edges = edge_index.get_edge_ids(), edge_index.get_num_edges()
+        self.__edge_ids = edge_ids
+        self.__incidence = (offsets, targets, edge_ids, num_edges)
+
+        # Estado de trabalho: a lista original nunca é copiada nem alterada
+        self.__state = WorkingState(self.__num_vertices, num_edges,
+                                    array('q', bytes(8 * self.__num_vertices)))
 
     def set_graph(self):
-        """Inicializa uma cópia do grafo para ser usada no algoritmo.
-        Pelo fato da estrutura sofrer alteração, trabalha em cima de
-        uma cópia para não alterar o grafo original e manter os dados.
+        """Inicializa o estado de trabalho do grafo para ser usado
+        no algoritmo. A lista original não é copiada: as arestas
+        atravessadas e os vértices removidos são apenas marcados, e
+        reiniciar desfaz somente as marcas feitas desde então.
         """
 
-        self.__graph_copy = copy.deepcopy(self.__graph)
+        self.__state.reset()
     
     def get_list_of_vertices(self):
         """Retorna a lista de vértices de um grafo.
@@ -40,23 +84,22 @@ class AdjacencyList:
         - vertices (list): Lista contendo os vértices do grafo.
         """
 
-        return list(self.__graph_copy.keys())
+        removed = self.__state.get_removed_vertices()
+        return [v for v in range(self.__num_vertices) if not removed[v]]
     
     def set_induced_graph(self, s: tuple):
         """Cria um grafo induzido G-S a partir de um conjunto S,
         representado pela tupla recebida como parâmetro.
+        Os vértices de S são apenas marcados como removidos.
         
         Parâmetros
         ----------
         - s (tuple): Tupla contendo os vértices do conjunto S.
         """
 
-        self.__graph_copy = copy.deepcopy(self.__graph)
+        self.__state.reset()
         for v in s:
-            adj_vertices = self.__graph_copy.pop(v)
-            for w in adj_vertices:
-                if w != v:
-                    self.__graph_copy[w].remove(v)
+            self.__state.remove_vertex(v)
 
     def find_neighbors(self, v: int):
         """Retorna os vizinhos de um vértice v.
@@ -70,14 +113,44 @@ class AdjacencyList:
         - neighbors (list): Lista contendo os vizinhos de v.
         """
 
+        edge_ids = self.__edge_ids
+        used = self.__state.get_used_edges()
+        removed = self.__state.get_removed_vertices()
+        targets = self.__targets
+        first_position, end = self.__offsets[v], self.__offsets[v+1]
         neighbors = []
-        for w in self.__graph_copy[v]: # Para cada vértice adjacente a v
-            # Se w não é igual a v e w não foi adicionado na lista de vizinhos
-            if w != v and w not in neighbors:
+        seen = set() # Vizinhos já adicionados, com consulta em O(1)
+        for slot in range(first_position, end): # Para cada vértice adjacente a v
+            w = targets[slot]
+            # Ignora laços, vértices removidos e arestas já atravessadas
+            if w == v or removed[w] or used[edge_ids[slot]]:
+                continue
+            # Se w não foi adicionado na lista de vizinhos
+            if w not in seen:
+                seen.add(w)
                 neighbors.append(w) # w é vizinho de v
         
+        if PROFILER.enabled: # Chamadas e posições percorridas
+            PROFILER.count("find_neighbors")
+            PROFILER.count("neighbor_scan_length", end - first_position)
         return neighbors
 
+    def get_incidence_arrays(self):
+        """Retorna a estrutura de incidência das arestas do grafo
+        original: para cada vértice v, as posições
+        offsets[v]:offsets[v+1] indicam o vértice alcançado e o
+        identificador de cada aresta incidente a v.
+
+        Retorno
+        -------
+        - offsets (array): Deslocamentos do início da lista de cada vértice.
+        - targets (array): Vértice alcançado por cada posição.
+        - edge_ids (array): Identificador da aresta de cada posição.
+        - num_edges (int): Quantidade de arestas do grafo.
+        """
+
+        return self.__incidence
+
     def is_eulerian(self):
         """Retorna se um grafo é euleriano.
         Ou seja, se possui todos os vértices com grau par.
@@ -87,11 +160,13 @@ class AdjacencyList:
         - is_eulerian (bool): Booleano indicando se um grafo é euleriano ou não.
         """
 
-        for v, adj_vertices in self.__graph.items(): # Para cada vértice e seus vértices adjacentes
-            degree = len(adj_vertices) # O grau equivale ao tamanho da lista de vértices adjacentes
+        targets = self.__targets
+        for v in range(self.__num_vertices): # Para cada vértice e seus vértices adjacentes
+            # O grau equivale ao tamanho da lista de vértices adjacentes
+            degree = self.__offsets[v+1] - self.__offsets[v]
             count_loop = 0
-            for w in adj_vertices:
-                if v == w:
+            for slot in range(self.__offsets[v], self.__offsets[v+1]):
+                if v == targets[slot]:
                     count_loop += 1
             if count_loop >= 1: # Indica laço: Conta como 2
                 degree += count_loop # Adiciona a quantidade de v novamente
@@ -110,9 +185,9 @@ class AdjacencyList:
         """
 
         count_edges_of_vertices = dict()
-        for v in self.__graph.keys(): # Para cada vértice do grafo
+        for v in range(self.__num_vertices): # Para cada vértice do grafo
             # A quantidade de arestas é o tamanho da lista de vértices adjacentes de v
-            count_edges_of_vertices[v] = len(self.__graph[v])
+            count_edges_of_vertices[v] = self.__offsets[v+1] - self.__offsets[v]
         
         return count_edges_of_vertices
     
@@ -128,11 +203,22 @@ class AdjacencyList:
         - next_v (int): Vértice de destino.
         """
 
-        # O próximo vértice é sempre o primeiro da lista de adjacência do vértice atual
-        next_v = self.__graph_copy[curr_v][0]
-        # Remove a aresta (u,v) e (v,u) quando u e v são vértices diferentes
-        self.__graph_copy[curr_v].remove(next_v)
-        if curr_v != next_v: # Se for um laço, não precisa remover duas vezes
-            self.__graph_copy[next_v].remove(curr_v)
+        if PROFILER.enabled:
+            PROFILER.count("traverse")
+
+        # O próximo vértice é sempre o primeiro da lista cuja aresta ainda não foi usada
+        edge_ids = self.__edge_ids
+        used = self.__state.get_used_edges()
+        position = self.__state.get_cursor(curr_v)
+        degree = self.__offsets[curr_v+1] - self.__offsets[curr_v]
+        while position < degree and used[edge_ids[self.__offsets[curr_v] + position]]:
+            position += 1
+        if position == degree: # As posições seguintes pertencem ao próximo vértice
+            raise ValueError("O vértice {} não possui arestas a atravessar".format(curr_v))
+        self.__state.set_cursor(curr_v, position + 1)
+        next_v = self.__targets[self.__offsets[curr_v] + position]
+
+        # Marca a aresta (u,v) como usada para ambos os vértices
+        self.__state.use_edge(edge_ids[self.__offsets[curr_v] + position])
         
         return next_v
@@ -1,31 +1,88 @@
-import copy
+from array import array
+from DataStructures.GraphStructures.EdgeIndex import EdgeIndex
+from DataStructures.GraphStructures.WorkingState import WorkingState
+from DataStructures.Profiler import PROFILER
 
 class AdjacencyMatrix:
     """Classe que abstrai a matriz de adjacência
     de um grafo e suas operações.
 
+    A matriz fica em um único vetor tipado de inteiros, linha por
+    linha: a posição (u,v) é u*|V| + v. Uma linha é lida como uma
+    fatia do vetor, sem cópia.
+
     Parâmetros
     ----------
         - lines (list): Linhas do arquivo de entrada.
     """
 
     def __init__(self, lines: list):
-        self.__graph = []
+        values = array('i')
         for line in lines:
             temp_line = line.replace("\n", "").split(" ")
-            # Converte os valores da matriz para inteiros
-            temp_line = [int(e) for e in temp_line]
-            self.__graph.append(temp_line) # Adiciona uma linha na matriz
+            # Converte os valores da matriz para inteiros e adiciona a linha ao vetor
+            values.extend(int(e) for e in temp_line)
+        self.__set_structure(len(lines), values)
+
+    @classmethod
+    def from_values(cls, num_vertices: int, values):
+        """Cria a matriz de adjacência a partir de um vetor com os
+        valores da matriz, linha por linha.
+
+        Parâmetros
+        ----------
+        - num_vertices (int): Quantidade de vértices (linhas e colunas).
+        - values (array | numpy.ndarray): Valores da matriz.
+
+        Retorno
+        -------
+        - graph (AdjacencyMatrix): Instância do grafo.
+        """
+
+        graph = cls.__new__(cls)
+        graph.__set_structure(num_vertices, values)
+        return graph
+
+    def __set_structure(self, num_vertices: int, values):
+        # O vetor recebido é usado sem cópia (memoryview lê array e numpy.ndarray como int)
+        self.__values = memoryview(values)
+        self.__num_vertices = num_vertices
+        self.__incidence = None # Estrutura de incidência, calculada uma única vez
+        # Vértices removidos e cursores, desfeitos pelo histórico em vez de realocados
+        self.__state = WorkingState(num_vertices, 0, array('q', bytes(8 * num_vertices)))
         self.set_graph()
-        # print("Grafo: {}".format(self.__graph))
     
     def set_graph(self):
-        """Inicializa uma cópia do grafo para ser usada no algoritmo.
-        Pelo fato da estrutura sofrer alteração, trabalha em cima de
-        uma cópia para não alterar o grafo original e manter os dados.
+        """Inicializa o estado de trabalho do grafo para ser usado
+        no algoritmo. A matriz original não é copiada: as arestas
+        atravessadas ficam registradas em uma camada esparsa
+        (vértice -> vizinho -> quantidade removida), e reiniciar
+        descarta somente o que foi registrado desde então.
+        Os vértices retirados pelo grafo induzido e a coluna a partir
+        da qual o próximo vizinho de cada vértice é buscado ficam no
+        estado de trabalho, que desfaz apenas as marcas feitas.
         """
 
-        self.__graph_copy = copy.deepcopy(self.__graph)
+        self.__removed_edges = dict()
+        self.__state.reset()
+
+    def __row(self, u: int):
+        # Linha u da matriz, como fatia do vetor (sem cópia)
+        n = self.__num_vertices
+        return self.__values[u*n:(u+1)*n]
+
+    def __remaining_edges(self, u: int, v: int):
+        # Quantidade de arestas (u,v) ainda não atravessadas
+        value = self.__values[u*self.__num_vertices + v]
+        removed_of_u = self.__removed_edges.get(u)
+        if removed_of_u is None:
+            return value
+        return value - removed_of_u.get(v, 0)
+
+    def __remove_edge(self, u: int, v: int):
+        # Registra a remoção de uma aresta (u,v) na camada de trabalho
+        removed_of_u = self.__removed_edges.setdefault(u, dict())
+        removed_of_u[v] = removed_of_u.get(v, 0) + 1
     
     def get_list_of_vertices(self):
         """Retorna a lista de vértices de um grafo.
@@ -35,7 +92,23 @@ class AdjacencyMatrix:
         - vertices (list): Lista contendo os vértices do grafo.
         """
 
-        return list(range(len(self.__graph_copy)))
+        removed = self.__state.get_removed_vertices()
+        return [v for v in range(self.__num_vertices) if not removed[v]]
+
+    def set_induced_graph(self, s: tuple):
+        """Cria um grafo induzido G-S a partir de um conjunto S,
+        representado pela tupla recebida como parâmetro.
+        A matriz não é copiada: os vértices de S são apenas marcados
+        como removidos.
+
+        Parâmetros
+        ----------
+        - s (tuple): Tupla contendo os vértices do conjunto S.
+        """
+
+        self.set_graph()
+        for v in s:
+            self.__state.remove_vertex(v)
 
     def find_neighbors(self, v: int):
         """Retorna os vizinhos de um vértice v.
@@ -49,14 +122,48 @@ class AdjacencyMatrix:
         - neighbors (list): Lista contendo os vizinhos de v.
         """
 
+        removed = self.__state.get_removed_vertices()
         neighbors = []
-        for w in range(len(self.__graph_copy[v])): # Para cada vértice adjacente a v
-            # Se w não é igual a v e existe uma ou mais arestas ligando v e w
-            if (self.__graph_copy[v][w] >= 1) and w != v:
+        for w in range(self.__num_vertices): # Para cada vértice adjacente a v
+            # Se w não é igual a v, não foi removido e existe uma ou mais arestas ligando v e w
+            if (self.__remaining_edges(v, w) >= 1) and w != v and not removed[w]:
                 neighbors.append(w) # w é vizinho de v
         
+        if PROFILER.enabled: # Chamadas e posições percorridas
+            PROFILER.count("find_neighbors")
+            PROFILER.count("neighbor_scan_length", self.__num_vertices)
         return neighbors
 
+    def get_incidence_arrays(self):
+        """Retorna a estrutura de incidência das arestas do grafo
+        original: para cada vértice v, as posições
+        offsets[v]:offsets[v+1] indicam o vértice alcançado e o
+        identificador de cada aresta incidente a v.
+
+        Retorno
+        -------
+        - offsets (array): Deslocamentos do início da lista de cada vértice.
+        - targets (array): Vértice alcançado por cada posição.
+        - edge_ids (array): Identificador da aresta de cada posição.
+        - num_edges (int): Quantidade de arestas do grafo.
+        """
+
+        if self.__incidence is not None: # A matriz original nunca é alterada
+            return self.__incidence
+
+        offsets = array('q', [0])
+        targets = array('i')
+        for u in range(self.__num_vertices): # Para cada vértice do grafo
+            row = self.__row(u)
+            for v in range(self.__num_vertices): # Cada aresta (u,v) ocupa uma posição
+                for i in range(row[v]):
+                    targets.append(v)
+            offsets.append(len(targets))
+        edge_index = EdgeIndex(offsets, targets)
+
+        self.__incidence = (offsets, targets, edge_index.get_edge_ids(), edge_index.get_num_edges())
+        return self.__incidence
+
     def is_eulerian(self):
         """Retorna se um grafo é euleriano.
         Ou seja, se possui todos os vértices com grau par.
@@ -66,13 +173,14 @@ class AdjacencyMatrix:
         - is_eulerian (bool): Booleano indicando se um grafo é euleriano ou não.
         """
 
-        for u in range(len(self.__graph)): # Para cada vértice do grafo
+        for u in range(self.__num_vertices): # Para cada vértice do grafo
+            row = self.__row(u)
             degree_of_u = 0
-            for v in range(len(self.__graph[u])): # Para cada vértice adjacente a u
-                if self.__graph[u][v] >= 1 and u == v: # Se u igual a v, o laço conta como 2
-                    degree_of_u += self.__graph[u][v] * 2 # Indica laço
+            for v in range(self.__num_vertices): # Para cada vértice adjacente a u
+                if row[v] >= 1 and u == v: # Se u igual a v, o laço conta como 2
+                    degree_of_u += row[v] * 2 # Indica laço
                 else: # Se não, basta somar a quantidade de arestas que incidem em u a partir de v
-                    degree_of_u += self.__graph[u][v]
+                    degree_of_u += row[v]
             
             if degree_of_u % 2 != 0: # Verifica se o vértice u possui grau ímpar
                 return False # Retorna falso caso u tenha grau ímpar
@@ -88,11 +196,9 @@ class AdjacencyMatrix:
         """
 
         count_edges_of_vertices = dict()
-        for u in range(len(self.__graph)): # Para cada vértice do grafo
-            count = 0
-            for v in range(len(self.__graph[u])): # Para cada vértice adjacente de u
-                count += self.__graph[u][v] # Soma os valores que indicam que há aresta ligando u e v
-            count_edges_of_vertices[u] = count
+        for u in range(self.__num_vertices): # Para cada vértice do grafo
+            # Soma os valores que indicam que há aresta ligando u e cada vértice adjacente
+            count_edges_of_vertices[u] = sum(self.__row(u))
         
         return count_edges_of_vertices
     
@@ -107,17 +213,22 @@ class AdjacencyMatrix:
         -------
         - next_v (int): Vértice de destino.
         """
+
+        if PROFILER.enabled:
+            PROFILER.count("traverse")
         
-        # O próximo vértice é sempre o primeiro vértice adjacente encontrado na matriz
-        for w in range(len(self.__graph_copy[curr_v])): # Para cada vértice adjacente ao vértice atual
+        # O próximo vértice é sempre o primeiro vértice adjacente encontrado na matriz.
+        # As colunas antes do cursor já não possuem arestas, então a busca começa nele
+        for w in range(self.__state.get_cursor(curr_v), self.__num_vertices):
             # Se existe uma ou mais arestas ligando o vértice atual e o próximo
-            if self.__graph_copy[curr_v][w] >= 1:
+            if self.__remaining_edges(curr_v, w) >= 1:
                 next_v = w # w passa a ser o próximo vértice
                 break
+        self.__state.set_cursor(curr_v, next_v)
         
         # Remove a aresta (u,v) e (v,u) quando u e v são vértices diferentes
-        self.__graph_copy[curr_v][next_v] -= 1
+        self.__remove_edge(curr_v, next_v)
         if curr_v != next_v: # Se for um laço, não precisa remover duas vezes
-            self.__graph_copy[next_v][curr_v] -= 1
+            self.__remove_edge(next_v, curr_v)
         
         return next_v
@@ -0,0 +1,305 @@
+from array import array
+from DataStructures.GraphStructures.CompressedSparseRow import CompressedSparseRow
+from DataStructures.Profiler import PROFILER
+
+class BitsetAdjacency:
+    """Classe que abstrai a lista de adjacência de um grafo
+    representada por conjuntos de bits e suas operações.
+
+    A vizinhança de cada vértice v é um inteiro do Python cujo bit w
+    indica a aresta (v,w), e os vértices presentes no grafo induzido
+    G-S formam outra máscara. Remover S, buscar os vizinhos em G-S e
+    expandir a fronteira da busca de componentes são operações
+    E/OU sobre palavras inteiras, e não vértice a vértice, o que
+    acelera os algoritmos que avaliam muitos subconjuntos.
+
+    As arestas (paralelas, laços e as já atravessadas) ficam nos
+    vetores CSR, usados pelas operações do circuito euleriano.
+    Depois de uma travessia, os vizinhos passam a ser buscados
+    nesses vetores, que conhecem as arestas usadas.
+
+    Parâmetros
+    ----------
+        - lines (list): Linhas do arquivo de entrada.
+    """
+
+    def __init__(self, lines: list):
+        # Vértices adjacentes de v ficam em neighbors[offsets[v]:offsets[v+1]]
+        offsets = array('q', [0])
+        neighbors = array('i')
+        for line in lines:
+            for u in line.split(","):
+                if u.strip() != '':
+                    neighbors.append(int(u))
+            offsets.append(len(neighbors))
+        self.__set_structure(offsets, neighbors)
+
+    @classmethod
+    def from_arrays(cls, offsets, neighbors, edge_ids=None, num_edges: int = None):
+        """Cria o grafo a partir dos vetores contíguos: os vizinhos
+        de v ficam em neighbors[offsets[v]:offsets[v+1]].
+
+        Parâmetros
+        ----------
+        - offsets (array): Deslocamentos do início da lista de cada vértice.
+        - neighbors (array): Vértices adjacentes de todos os vértices.
+        - edge_ids (array): Identificador da aresta de cada posição, caso
+        já tenha sido calculado (ex.: arquivo binário).
+        - num_edges (int): Quantidade de arestas, junto com edge_ids.
+
+        Retorno
+        -------
+        - graph (BitsetAdjacency): Instância do grafo.
+        """
+
+        graph = cls.__new__(cls)
+        graph.__set_structure(offsets, neighbors, edge_ids, num_edges)
+        return graph
+
+    def __set_structure(self, offsets, neighbors, edge_ids=None, num_edges: int = None):
+        # Arestas e estado de trabalho das travessias
+        self.__edges = CompressedSparseRow.from_arrays(offsets, neighbors, edge_ids, num_edges)
+        self.__num_vertices = len(offsets) - 1
+
+        # Máscara dos vizinhos de cada vértice, sem laços
+        masks = self.masks_of(neighbors[offsets[v]:offsets[v+1]] for v in range(self.__num_vertices))
+        self.__masks = [mask & ~(1 << v) for v, mask in enumerate(masks)]
+
+        self.__all_vertices = (1 << self.__num_vertices) - 1
+        self.__present = self.__all_vertices # Vértices de G-S
+        self.__traversed = False # Indica se alguma aresta foi atravessada
+
+    @staticmethod
+    def masks_of(adjacency):
+        """Retorna a máscara dos vizinhos de cada vértice, em que o
+        bit w indica a aresta até w. Vizinhos repetidos ligam o mesmo bit.
+
+        Parâmetros
+        ----------
+        - adjacency (list): Vizinhos de cada vértice (0, 1, ..., n-1).
+
+        Retorno
+        -------
+        - masks (list): Máscara dos vizinhos de cada vértice.
+        """
+
+        masks = []
+        for neighbors in adjacency:
+            mask = 0
+            for w in neighbors:
+                mask |= 1 << w
+            masks.append(mask)
+        return masks
+
+    @staticmethod
+    def vertices_of(mask: int):
+        """Retorna os vértices de uma máscara, em ordem crescente.
+
+        Parâmetros
+        ----------
+        - mask (int): Máscara de vértices.
+
+        Retorno
+        -------
+        - vertices (list): Vértices cujos bits estão ligados.
+        """
+
+        # A representação binária invertida tem o bit v na posição v
+        return [v for v, bit in enumerate(bin(mask)[:1:-1]) if bit == "1"]
+
+    @staticmethod
+    def components_of(masks: list, present: int):
+        """Separa os vértices presentes em componentes por expansão de
+        fronteira: cada passo une, com OU, as vizinhanças da fronteira
+        e mantém, com E, apenas os vértices ainda não alcançados.
+        Cada vértice entra na fronteira uma única vez.
+
+        Parâmetros
+        ----------
+        - masks (list): Máscara dos vizinhos de cada vértice.
+        - present (int): Máscara dos vértices considerados.
+
+        Retorno
+        -------
+        - components (list): Máscara de cada componente, na ordem do
+        seu menor vértice.
+        """
+
+        components = []
+        remaining = present
+        while remaining:
+            frontier = remaining & -remaining # Menor vértice ainda não alcançado
+            remaining ^= frontier
+            component = frontier
+            while frontier:
+                reached = 0
+                while frontier: # Vizinhanças de todos os vértices da fronteira
+                    lowest = frontier & -frontier
+                    reached |= masks[lowest.bit_length() - 1]
+                    frontier ^= lowest
+                frontier = reached & remaining
+                remaining ^= frontier
+                component |= frontier
+            components.append(component)
+
+        return components
+
+    def set_graph(self):
+        """Inicializa o estado de trabalho do grafo para ser usado
+        no algoritmo. A estrutura original nunca é alterada: basta
+        desmarcar as arestas atravessadas e voltar a máscara de
+        vértices presentes para todos os vértices.
+        """
+
+        self.__edges.set_graph()
+        self.__present = self.__all_vertices
+        self.__traversed = False
+
+    def get_list_of_vertices(self):
+        """Retorna a lista de vértices de um grafo.
+
+        Retorno
+        -------
+        - vertices (list): Lista contendo os vértices do grafo.
+        """
+
+        return self.vertices_of(self.__present)
+
+    def set_induced_graph(self, s: tuple):
+        """Cria um grafo induzido G-S a partir de um conjunto S,
+        representado pela tupla recebida como parâmetro.
+        Os vértices de S são apenas retirados da máscara de vértices presentes.
+
+        Parâmetros
+        ----------
+        - s (tuple): Tupla contendo os vértices do conjunto S.
+        """
+
+        self.__edges.set_induced_graph(s)
+        removed = 0
+        for v in s:
+            removed |= 1 << v
+        self.__present = self.__all_vertices & ~removed
+        self.__traversed = False
+
+    def find_neighbors(self, v: int):
+        """Retorna os vizinhos de um vértice v.
+
+        Parâmetros
+        ----------
+        - v (int): Vértice de entrada.
+
+        Retorno
+        -------
+        - neighbors (list): Lista contendo os vizinhos de v.
+        """
+
+        if self.__traversed: # Apenas os vetores CSR conhecem as arestas usadas
+            return self.__edges.find_neighbors(v)
+
+        if PROFILER.enabled:
+            PROFILER.count("find_neighbors")
+        return self.vertices_of(self.__masks[v] & self.__present)
+
+    def connected_components(self):
+        """Calcula os componentes do grafo com a expansão de fronteira
+        sobre as máscaras de vizinhos.
+
+        Retorno
+        -------
+        - count_components (int): Quantidade de componentes de um grafo.
+        - labels (dict): Dicionário contendo o rótulo do componente de cada vértice.
+        """
+
+        components = self.components_of(self.__current_masks(), self.__present)
+        labels = dict()
+        for label in range(len(components)):
+            for v in self.vertices_of(components[label]):
+                labels[v] = label
+        # Rótulos na ordem dos vértices, como nas demais estruturas
+        return len(components), dict(sorted(labels.items()))
+
+    def count_components(self):
+        """Calcula apenas a quantidade de componentes do grafo,
+        sem rotular os vértices.
+
+        Retorno
+        -------
+        - count_components (int): Quantidade de componentes de um grafo.
+        """
+
+        return len(self.components_of(self.__current_masks(), self.__present))
+
+    def __current_masks(self):
+        # Máscaras de vizinhos considerando as arestas já atravessadas
+        if not self.__traversed:
+            return self.__masks
+        masks = [0] * self.__num_vertices
+        for v in self.vertices_of(self.__present):
+            for w in self.__edges.find_neighbors(v):
+                masks[v] |= 1 << w
+        return masks
+
+    def get_masks(self):
+        """Retorna as máscaras de vizinhos do grafo original, sem laços.
+        A lista é a própria estrutura e não deve ser alterada.
+
+        Retorno
+        -------
+        - masks (list): Máscara dos vizinhos de cada vértice.
+        """
+
+        return self.__masks
+
+    def get_incidence_arrays(self):
+        """Retorna a estrutura de incidência das arestas do grafo
+        original: para cada vértice v, as posições
+        offsets[v]:offsets[v+1] indicam o vértice alcançado e o
+        identificador de cada aresta incidente a v.
+
+        Retorno
+        -------
+        - offsets (array): Deslocamentos do início da lista de cada vértice.
+        - targets (array): Vértice alcançado por cada posição.
+        - edge_ids (array): Identificador da aresta de cada posição.
+        - num_edges (int): Quantidade de arestas do grafo.
+        """
+
+        return self.__edges.get_incidence_arrays()
+
+    def is_eulerian(self):
+        """Retorna se um grafo é euleriano.
+        Ou seja, se possui todos os vértices com grau par.
+
+        Retorno
+        -------
+        - is_eulerian (bool): Booleano indicando se um grafo é euleriano ou não.
+        """
+
+        return self.__edges.is_eulerian()
+
+    def count_edges(self):
+        """Retorna a quantidade de arestas que incidem em cada vértice.
+
+        Retorno
+        -------
+        - count_edges_of_vertices (dict): Dicionário contendo
+        a quantidade de arestas de cada vértice.
+        """
+
+        return self.__edges.count_edges()
+
+    def traverse(self, curr_v: int):
+        """Atravessa uma aresta (u,v) do grafo.
+
+        Parâmetros
+        ----------
+        - curr_v (int): Vértice de origem.
+
+        Retorno
+        -------
+        - next_v (int): Vértice de destino.
+        """
+
+        self.__traversed = True
+        return self.__edges.traverse(curr_v)
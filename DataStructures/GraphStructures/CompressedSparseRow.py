@@ -0,0 +1,211 @@
+from array import array
+from DataStructures.GraphStructures.EdgeIndex import EdgeIndex
+from DataStructures.GraphStructures.WorkingState import WorkingState
+from DataStructures.Profiler import PROFILER
+
+class CompressedSparseRow:
+    """Classe que abstrai a lista de adjacência de um grafo
+    no formato compacto de linhas esparsas comprimidas (CSR)
+    e suas operações.
+
+    Os vizinhos de todos os vértices ficam em um único vetor
+    contíguo de inteiros, e o vetor de deslocamentos indica onde
+    começa a lista de cada vértice. Cada posição do vetor de
+    vizinhos também guarda o identificador da aresta, para que
+    as arestas percorridas sejam marcadas sem alterar a estrutura.
+
+    Parâmetros
+    ----------
+        - lines (list): Linhas do arquivo de entrada.
+    """
+
+    def __init__(self, lines: list):
+        # Vértices adjacentes de v ficam em neighbors[offsets[v]:offsets[v+1]]
+        offsets = array('q', [0])
+        neighbors = array('i')
+        for line in lines:
+            for u in line.split(","):
+                if u.strip() != '':
+                    neighbors.append(int(u))
+            offsets.append(len(neighbors))
+        self.__set_structure(offsets, neighbors)
+
+    @classmethod
+    def from_arrays(cls, offsets, neighbors, edge_ids=None, num_edges: int = None):
+        """Cria o grafo diretamente a partir dos vetores contíguos,
+        sem copiá-los: os vizinhos de v ficam em
+        neighbors[offsets[v]:offsets[v+1]].
+
+        Parâmetros
+        ----------
+        - offsets (array): Deslocamentos do início da lista de cada vértice.
+        - neighbors (array): Vértices adjacentes de todos os vértices.
+        - edge_ids (array): Identificador da aresta de cada posição, caso
+        já tenha sido calculado (ex.: arquivo binário).
+        - num_edges (int): Quantidade de arestas, junto com edge_ids.
+
+        Retorno
+        -------
+        - graph (CompressedSparseRow): Instância do grafo.
+        """
+
+        graph = cls.__new__(cls)
+        graph.__set_structure(offsets, neighbors, edge_ids, num_edges)
+        return graph
+
+    def __set_structure(self, offsets, neighbors, edge_ids=None, num_edges: int = None):
+        self.__offsets = offsets
+        self.__neighbors = neighbors
+        self.__num_vertices = len(offsets) - 1
+
+        # Identificador da aresta de cada posição do vetor de vizinhos
+        if edge_ids is None:
+            edge_index = EdgeIndex(self.__offsets, self.__neighbors)
+            edge_ids, num_edges = edge_index.get_edge_ids(), edge_index.get_num_edges()
+        self.__edge_of = edge_ids
+        self.__num_edges = num_edges
+        # Estado de trabalho: os vetores originais nunca são copiados nem alterados
+        self.__state = WorkingState(self.__num_vertices, self.__num_edges, self.__offsets[:-1])
+
+    def set_graph(self):
+        """Inicializa o estado de trabalho do grafo para ser usado
+        no algoritmo. A estrutura original nunca é alterada: as
+        arestas atravessadas e os vértices removidos são apenas
+        marcados, e reiniciar desfaz somente as marcas feitas desde então.
+        """
+
+        self.__state.reset()
+
+    def get_list_of_vertices(self):
+        """Retorna a lista de vértices de um grafo.
+
+        Retorno
+        -------
+        - vertices (list): Lista contendo os vértices do grafo.
+        """
+
+        removed = self.__state.get_removed_vertices()
+        return [v for v in range(self.__num_vertices) if not removed[v]]
+
+    def set_induced_graph(self, s: tuple):
+        """Cria um grafo induzido G-S a partir de um conjunto S,
+        representado pela tupla recebida como parâmetro.
+        Os vértices de S são apenas marcados como removidos.
+
+        Parâmetros
+        ----------
+        - s (tuple): Tupla contendo os vértices do conjunto S.
+        """
+
+        self.__state.reset()
+        for v in s:
+            self.__state.remove_vertex(v)
+
+    def find_neighbors(self, v: int):
+        """Retorna os vizinhos de um vértice v.
+
+        Parâmetros
+        ----------
+        - v (int): Vértice de entrada.
+
+        Retorno
+        -------
+        - neighbors (list): Lista contendo os vizinhos de v.
+        """
+
+        used = self.__state.get_used_edges()
+        removed = self.__state.get_removed_vertices()
+        neighbors = []
+        seen = set()
+        for slot in range(self.__offsets[v], self.__offsets[v+1]): # Para cada vértice adjacente a v
+            w = self.__neighbors[slot]
+            # Ignora laços, vértices removidos, arestas usadas e vizinhos repetidos
+            if w == v or w in seen or removed[w] or used[self.__edge_of[slot]]:
+                continue
+            seen.add(w)
+            neighbors.append(w) # w é vizinho de v
+
+        if PROFILER.enabled: # Chamadas e posições percorridas
+            PROFILER.count("find_neighbors")
+            PROFILER.count("neighbor_scan_length", self.__offsets[v+1] - self.__offsets[v])
+        return neighbors
+
+    def get_incidence_arrays(self):
+        """Retorna a estrutura de incidência das arestas do grafo
+        original: para cada vértice v, as posições
+        offsets[v]:offsets[v+1] indicam o vértice alcançado e o
+        identificador de cada aresta incidente a v.
+
+        Retorno
+        -------
+        - offsets (array): Deslocamentos do início da lista de cada vértice.
+        - targets (array): Vértice alcançado por cada posição.
+        - edge_ids (array): Identificador da aresta de cada posição.
+        - num_edges (int): Quantidade de arestas do grafo.
+        """
+
+        return self.__offsets, self.__neighbors, self.__edge_of, self.__num_edges
+
+    def is_eulerian(self):
+        """Retorna se um grafo é euleriano.
+        Ou seja, se possui todos os vértices com grau par.
+
+        Retorno
+        -------
+        - is_eulerian (bool): Booleano indicando se um grafo é euleriano ou não.
+        """
+
+        offsets = self.__offsets
+        neighbors = self.__neighbors
+        for v in range(self.__num_vertices): # Para cada vértice do grafo
+            degree = offsets[v+1] - offsets[v]
+            for slot in range(offsets[v], offsets[v+1]):
+                if neighbors[slot] == v: # Indica laço: Conta como 2
+                    degree += 1
+
+            if degree % 2 != 0: # Verifica se o vértice v possui grau ímpar
+                return False # Retorna falso caso v tenha grau ímpar
+        return True # Retorna verdadeiro caso todos os vértices tenham grau par
+
+    def count_edges(self):
+        """Retorna a quantidade de arestas que incidem em cada vértice.
+
+        Retorno
+        -------
+        - count_edges_of_vertices (dict): Dicionário contendo
+        a quantidade de arestas de cada vértice.
+        """
+
+        count_edges_of_vertices = dict()
+        for v in range(self.__num_vertices): # Para cada vértice do grafo
+            # A quantidade de arestas é o tamanho da lista de vértices adjacentes de v
+            count_edges_of_vertices[v] = self.__offsets[v+1] - self.__offsets[v]
+
+        return count_edges_of_vertices
+
+    def traverse(self, curr_v: int):
+        """Atravessa uma aresta (u,v) do grafo.
+
+        Parâmetros
+        ----------
+        - curr_v (int): Vértice de origem.
+
+        Retorno
+        -------
+        - next_v (int): Vértice de destino.
+        """
+
+        if PROFILER.enabled:
+            PROFILER.count("traverse")
+
+        # O próximo vértice é sempre o primeiro da lista cuja aresta ainda não foi usada
+        used = self.__state.get_used_edges()
+        slot = self.__state.get_cursor(curr_v)
+        while used[self.__edge_of[slot]]:
+            slot += 1
+        self.__state.set_cursor(curr_v, slot + 1)
+
+        # Marca a aresta (u,v) como usada para ambos os vértices
+        self.__state.use_edge(self.__edge_of[slot])
+
+        return self.__neighbors[slot]
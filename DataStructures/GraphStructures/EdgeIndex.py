@@ -0,0 +1,55 @@
+from array import array
+
+class EdgeIndex:
+    """Classe que atribui um identificador a cada aresta de um grafo
+    armazenado em listas de adjacência contíguas (CSR): os vizinhos
+    de v ficam em neighbors[offsets[v]:offsets[v+1]].
+
+    A k-ésima ocorrência de v na lista de u corresponde à k-ésima
+    ocorrência de u na lista de v (mesma aresta), e cada ocorrência
+    de v na própria lista é um laço.
+
+    Parâmetros
+    ----------
+        - offsets (array): Deslocamentos do início da lista de cada vértice.
+        - neighbors (array): Vértices adjacentes de todos os vértices.
+    """
+
+    def __init__(self, offsets, neighbors):
+        num_vertices = len(offsets) - 1
+        # Posições de cada lista ordenadas pelo vértice adjacente
+        order = array('q')
+        for v in range(num_vertices):
+            order.extend(sorted(range(offsets[v], offsets[v+1]), key=neighbors.__getitem__))
+
+        # Próxima posição (ordenada) ainda não pareada de cada lista
+        fill = array('q', offsets[:-1])
+        self.__edge_of = array('i', [-1]) * len(neighbors)
+        num_edges = 0
+        for u in range(num_vertices):
+            for k in range(offsets[u], offsets[u+1]):
+                slot = order[k]
+                v = neighbors[slot]
+                if v < u: # Aresta já pareada a partir da lista de v
+                    continue
+                if v != u: # Pareia com a próxima ocorrência de u na lista de v
+                    mirror = order[fill[v]] if fill[v] < offsets[v+1] else -1
+                    if mirror < 0 or neighbors[mirror] != u:
+                        raise ValueError("A lista de adjacência não é simétrica " \
+                                         "na aresta ({},{})".format(u, v))
+                    fill[v] += 1
+                    self.__edge_of[mirror] = num_edges
+                self.__edge_of[slot] = num_edges
+                num_edges += 1
+
+        if -1 in self.__edge_of: # Alguma ocorrência não foi pareada
+            raise ValueError("A lista de adjacência não é simétrica")
+        self.__num_edges = num_edges
+
+    def get_edge_ids(self):
+        # Retorna o identificador da aresta de cada posição do vetor de vizinhos
+        return self.__edge_of
+
+    def get_num_edges(self):
+        # Retorna a quantidade de arestas do grafo
+        return self.__num_edges
@@ -1,31 +1,130 @@
-import copy
+from array import array
+try:
+    import numpy as np
+except ImportError: # NumPy é opcional
+    np = None
+from DataStructures.GraphStructures.WorkingState import WorkingState
+from DataStructures.Profiler import PROFILER
 
 class IncidenceMatrix:
     """Classe que abstrai a matriz de incidência
     de um grafo e suas operações.
 
+    A matriz fica em um único vetor tipado de inteiros, linha por
+    linha: a posição (u,e) é u*|A| + e. As extremidades de cada
+    aresta e as arestas incidentes a cada vértice são calculadas
+    uma única vez, em bloco com o NumPy, quando instalado.
+
     Parâmetros
     ----------
         - lines (list): Linhas do arquivo de entrada.
     """
 
     def __init__(self, lines: list):
-        self.__graph = []
+        values = array('i')
         for line in lines:
             temp_line = line.replace("\n", "").split(" ")
-            # Converte os valores da matriz para inteiros
-            temp_line = [int(e) for e in temp_line]
-            self.__graph.append(temp_line) # Adiciona uma linha na matriz
-        self.set_graph()
-        # print("Grafo: {}".format(self.__graph))
-    
+            # Converte os valores da matriz para inteiros e adiciona a linha ao vetor
+            values.extend(int(e) for e in temp_line)
+        num_edges = len(values) // len(lines) if lines else 0
+        self.__set_structure(len(lines), num_edges, values)
+
+    @classmethod
+    def from_values(cls, num_vertices: int, num_edges: int, values):
+        """Cria a matriz de incidência a partir de um vetor com os
+        valores da matriz, linha por linha.
+
+        Parâmetros
+        ----------
+        - num_vertices (int): Quantidade de vértices (linhas).
+        - num_edges (int): Quantidade de arestas (colunas).
+        - values (array | numpy.ndarray): Valores da matriz.
+
+        Retorno
+        -------
+        - graph (IncidenceMatrix): Instância do grafo.
+        """
+
+        graph = cls.__new__(cls)
+        graph.__set_structure(num_vertices, num_edges, values)
+        return graph
+
+    def __set_structure(self, num_vertices: int, num_edges: int, values):
+        # O vetor recebido é usado sem cópia (memoryview lê array e numpy.ndarray como int)
+        self.__values = memoryview(values)
+        self.__num_vertices = num_vertices
+        self.__num_edges = num_edges
+        self.__set_edge_index()
+        # Estado de trabalho: a matriz original nunca é copiada nem alterada.
+        # O cursor de cada vértice é uma posição de incident_edges
+        self.__state = WorkingState(num_vertices, num_edges, self.__incident_offsets[:-1])
+
+    def __set_edge_index(self):
+        """Cria o índice das arestas a partir da matriz: as duas
+        extremidades de cada aresta e, para cada vértice, as arestas
+        incidentes a ele, na ordem das colunas, nas posições
+        incident_offsets[u]:incident_offsets[u+1] de incident_edges.
+        Assim, encontrar o outro vértice de uma aresta não exige
+        percorrer a coluna inteira.
+        """
+
+        n, num_edges = self.__num_vertices, self.__num_edges
+        if np is not None: # Em bloco: posições não nulas da matriz, linha por linha
+            matrix = np.asarray(self.__values).reshape(n, num_edges)
+            rows, columns = np.nonzero(matrix)
+            counts = matrix[rows, columns]
+            incidences = np.bincount(columns, weights=counts, minlength=num_edges)
+            invalid = np.flatnonzero(incidences != 2)
+            if len(invalid): # Cada aresta liga exatamente duas extremidades
+                raise ValueError("A coluna {} da matriz de incidência " \
+                                 "não representa uma aresta".format(invalid[0]))
+            # Extremidades em ordem de coluna (e de linha, dentro da coluna);
+            # um laço (valor 2) tem o próprio u nas duas extremidades
+            order = np.argsort(columns, kind="stable")
+            endpoints = np.repeat(rows[order], counts[order]).astype(np.int32)
+            self.__endpoints = array('i', endpoints.tobytes())
+            degrees = np.bincount(rows, minlength=n)
+            self.__incident_offsets = array('q', np.concatenate(([0], np.cumsum(degrees)))
+                                            .astype(np.int64).tobytes())
+            self.__incident_edges = array('i', columns.astype(np.int32).tobytes())
+            return
+
+        # Sem o NumPy: percorre a matriz célula a célula
+        values = self.__values
+        endpoints = [[] for e in range(num_edges)]
+        self.__incident_offsets = array('q', [0])
+        self.__incident_edges = array('i')
+        for u in range(n): # Para cada vértice do grafo
+            for e in range(num_edges): # Para cada aresta incidente a u
+                value = values[u*num_edges + e]
+                if value == 0:
+                    continue
+                self.__incident_edges.append(e)
+                # Um laço (valor 2) tem o próprio u nas duas extremidades
+                for i in range(value):
+                    endpoints[e].append(u)
+            self.__incident_offsets.append(len(self.__incident_edges))
+
+        self.__endpoints = array('i')
+        for e in range(num_edges):
+            if len(endpoints[e]) != 2: # Cada aresta liga exatamente duas extremidades
+                raise ValueError("A coluna {} da matriz de incidência " \
+                                 "não representa uma aresta".format(e))
+            self.__endpoints.extend(endpoints[e])
+
+    def __other_endpoint(self, e: int, v: int):
+        # Retorna a extremidade da aresta e que não é v (ou v, se for laço)
+        u, w = self.__endpoints[2*e], self.__endpoints[2*e + 1]
+        return w if u == v else u
+
     def set_graph(self):
-        """Inicializa uma cópia do grafo para ser usada no algoritmo.
-        Pelo fato da estrutura sofrer alteração, trabalha em cima de
-        uma cópia para não alterar o grafo original e manter os dados.
+        """Inicializa o estado de trabalho do grafo para ser usado
+        no algoritmo. A matriz original nunca é alterada: as arestas
+        atravessadas e os vértices removidos são apenas marcados,
+        e reiniciar desfaz somente as marcas feitas desde então.
         """
 
-        self.__graph_copy = copy.deepcopy(self.__graph)
+        self.__state.reset()
     
     def get_list_of_vertices(self):
         """Retorna a lista de vértices de um grafo.
@@ -35,7 +134,23 @@ class IncidenceMatrix:
         - vertices (list): Lista contendo os vértices do grafo.
         """
 
-        return list(range(len(self.__graph_copy)))
+        removed = self.__state.get_removed_vertices()
+        return [v for v in range(self.__num_vertices) if not removed[v]]
+
+    def set_induced_graph(self, s: tuple):
+        """Cria um grafo induzido G-S a partir de um conjunto S,
+        representado pela tupla recebida como parâmetro.
+        A matriz não é copiada: os vértices de S são apenas marcados
+        como removidos.
+
+        Parâmetros
+        ----------
+        - s (tuple): Tupla contendo os vértices do conjunto S.
+        """
+
+        self.__state.reset()
+        for v in s:
+            self.__state.remove_vertex(v)
 
     def find_neighbors(self, v: int):
         """Retorna os vizinhos de um vértice v.
@@ -49,18 +164,49 @@ class IncidenceMatrix:
         - neighbors (list): Lista contendo os vizinhos de v.
         """
 
+        used = self.__state.get_used_edges()
+        removed = self.__state.get_removed_vertices()
         neighbors = []
-        for e in range(len(self.__graph_copy[v])): # Para cada aresta incidente a v
-            if self.__graph_copy[v][e] == 1: # Se e é incidente a v
-                for w in range(len(self.__graph_copy)): # Para cada vértice do grafo
-                    # Verifica quem é o outro vértice que liga em e que não seja v
-                    # e não esteja adicionado na lista de vizinhos de v
-                    if self.__graph_copy[w][e] == 1 and w != v and w not in neighbors:
-                        neighbors.append(w) # w é vizinho de v
-                        break
+        seen = set()
+        first_position, end = self.__incident_offsets[v], self.__incident_offsets[v+1]
+        for e in self.__incident_edges[first_position:end]: # Para cada aresta incidente a v
+            if used[e]: # Arestas atravessadas não ligam mais os vértices
+                continue
+            w = self.__other_endpoint(e, v)
+            # Se w não é igual a v, não foi removido e não foi adicionado na lista de vizinhos
+            if w != v and not removed[w] and w not in seen:
+                seen.add(w)
+                neighbors.append(w) # w é vizinho de v
         
+        if PROFILER.enabled: # Chamadas e posições percorridas
+            PROFILER.count("find_neighbors")
+            PROFILER.count("neighbor_scan_length", end - first_position)
         return neighbors
 
+    def get_incidence_arrays(self):
+        """Retorna a estrutura de incidência das arestas do grafo
+        original: para cada vértice v, as posições
+        offsets[v]:offsets[v+1] indicam o vértice alcançado e o
+        identificador de cada aresta incidente a v.
+
+        Retorno
+        -------
+        - offsets (array): Deslocamentos do início da lista de cada vértice.
+        - targets (array): Vértice alcançado por cada posição.
+        - edge_ids (array): Identificador da aresta de cada posição.
+        - num_edges (int): Quantidade de arestas do grafo.
+        """
+
+        # Cada aresta incidente ocupa uma posição, na ordem das arestas incidentes a cada vértice
+        offsets = self.__incident_offsets
+        edge_ids = self.__incident_edges
+        targets = array('i')
+        for u in range(self.__num_vertices): # Para cada vértice do grafo
+            for e in edge_ids[offsets[u]:offsets[u+1]]:
+                targets.append(self.__other_endpoint(e, u))
+
+        return offsets, targets, edge_ids, self.__num_edges
+
     def is_eulerian(self):
         """Retorna se um grafo é euleriano.
         Ou seja, se possui todos os vértices com grau par.
@@ -70,10 +216,12 @@ class IncidenceMatrix:
         - is_eulerian (bool): Booleano indicando se um grafo é euleriano ou não.
         """
 
-        for u in range(len(self.__graph)): # Para cada vértice do grafo
+        offsets = self.__incident_offsets
+        for u in range(self.__num_vertices): # Para cada vértice do grafo
+            row = u * self.__num_edges
             degree_of_u = 0
-            for e in range(len(self.__graph[u])): # Para cada aresta incidente a u
-                degree_of_u += self.__graph[u][e] # Basta somar quantas arestas incidem em u
+            for e in self.__incident_edges[offsets[u]:offsets[u+1]]: # Para cada aresta incidente a u
+                degree_of_u += self.__values[row + e] # Basta somar quantas vezes a aresta incide em u
             
             if degree_of_u % 2 != 0: # Verifica se o vértice u possui grau ímpar
                 return False # Retorna falso caso u tenha grau ímpar
@@ -89,14 +237,9 @@ class IncidenceMatrix:
         """
 
         count_edges_of_vertices = dict()
-        for u in range(len(self.__graph)): # Para cada vértice do grafo
-            count = 0
-            for v in range(len(self.__graph[u])): # Para cada aresta incidente a u
-                if self.__graph[u][v] == 2: # Um laço conta como uma aresta incidindo duas vezes em u
-                    count += 1 # Conta a aresta apenas uma vez
-                else: # Soma os valores que indicam que há aresta incidindo em u
-                    count += self.__graph[u][v]
-            count_edges_of_vertices[u] = count
+        for u in range(self.__num_vertices): # Para cada vértice do grafo
+            # Um laço conta como uma aresta incidindo duas vezes em u, mas aparece uma vez na lista
+            count_edges_of_vertices[u] = self.__incident_offsets[u+1] - self.__incident_offsets[u]
         
         return count_edges_of_vertices
     
@@ -112,22 +255,25 @@ class IncidenceMatrix:
         - next_v (int): Vértice de destino.
         """
 
-        # O próximo vértice é sempre o primeiro vértice que tem a mesma aresta incidente encontrada na matriz
-        for edge in range(len(self.__graph_copy[curr_v])):
-            if self.__graph_copy[curr_v][edge] == 2:
-                # Se a aresta é um laço, o próximo vértice é igual ao atual
-                next_v = curr_v
-                break
-            elif self.__graph_copy[curr_v][edge] == 1: # Encontra aresta não visitada
-                for w in range(len(self.__graph_copy)): # Acha o vizinho desta aresta
-                    if self.__graph_copy[w][edge] == 1 and w != curr_v:
-                        next_v = w
-                        break
-                break
-        
-        # Remove a aresta (u,e) e (v,e) quando u e v são vértices diferentes
-        self.__graph_copy[curr_v][edge] = 0
-        if curr_v != next_v: # Se for um laço, não precisa remover duas vezes
-            self.__graph_copy[next_v][edge] = 0
+        if PROFILER.enabled:
+            PROFILER.count("traverse")
+
+        # A próxima aresta é sempre a primeira ainda não usada na ordem das colunas
+        # O cursor é uma posição de incident_edges, a partir de incident_offsets[curr_v]
+        incident_edges = self.__incident_edges
+        used = self.__state.get_used_edges()
+        position = self.__state.get_cursor(curr_v)
+        end = self.__incident_offsets[curr_v+1]
+        while position < end and used[incident_edges[position]]:
+            position += 1
+        if position == end: # As posições seguintes pertencem ao próximo vértice
+            raise ValueError("O vértice {} não possui arestas a atravessar".format(curr_v))
+        self.__state.set_cursor(curr_v, position + 1)
+        edge = incident_edges[position]
+
+        # O próximo vértice é a outra extremidade da aresta (ou o próprio, se for laço)
+        next_v = self.__other_endpoint(edge, curr_v)
+        # Marca a aresta como usada para ambos os vértices
+        self.__state.use_edge(edge)
         
         return next_v
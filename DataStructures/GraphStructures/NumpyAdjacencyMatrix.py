@@ -0,0 +1,246 @@
+import numpy as np
+from array import array
+from DataStructures.GraphStructures.EdgeIndex import EdgeIndex
+from DataStructures.GraphStructures.WorkingState import WorkingState
+from DataStructures.Profiler import PROFILER
+
+class NumpyAdjacencyMatrix:
+    """Classe que abstrai a matriz de adjacência de um grafo
+    armazenada em um vetor contíguo do NumPy e suas operações.
+    Graus, laços, paridade e vizinhos são calculados com operações
+    sobre linhas inteiras ou sobre a matriz inteira, sem laços
+    interpretados por elemento.
+
+    Parâmetros
+    ----------
+        - lines (list): Linhas do arquivo de entrada.
+    """
+
+    def __init__(self, lines: list):
+        self.__set_structure(np.array([line.split() for line in lines], dtype=np.int32))
+
+    @classmethod
+    def from_values(cls, num_vertices: int, values):
+        """Cria a matriz de adjacência a partir de um vetor com os
+        valores da matriz, linha por linha, sem convertê-los um a um.
+
+        Parâmetros
+        ----------
+        - num_vertices (int): Quantidade de vértices (linhas e colunas).
+        - values (array | numpy.ndarray): Valores da matriz.
+
+        Retorno
+        -------
+        - graph (NumpyAdjacencyMatrix): Instância do grafo.
+        """
+
+        graph = cls.__new__(cls)
+        values = np.asarray(values, dtype=np.int32)
+        graph.__set_structure(values.reshape(num_vertices, num_vertices))
+        return graph
+
+    def __set_structure(self, matrix):
+        self.__graph = matrix
+        if self.__graph.ndim != 2 or self.__graph.shape[0] != self.__graph.shape[1]:
+            raise ValueError("A matriz de adjacência deve ser quadrada")
+        self.__incidence = None # Estrutura de incidência, calculada uma única vez
+        # Matriz booleana das arestas do grafo original, calculada uma única vez
+        self.__adjacency = self.__graph >= 1
+        # Vértices removidos, desfeitos pelo histórico em vez de realocados,
+        # vistos pelo NumPy como um vetor booleano sobre a mesma memória
+        self.__state = WorkingState(len(self.__graph), 0, array('q', bytes(8 * len(self.__graph))))
+        self.__removed = np.frombuffer(self.__state.get_removed_vertices(), dtype=bool)
+        self.set_graph()
+
+    def set_graph(self):
+        """Inicializa o estado de trabalho do grafo para ser usado
+        no algoritmo. A matriz original não é copiada: as arestas
+        atravessadas ficam registradas em uma camada esparsa
+        (vértice -> vizinho -> quantidade removida), e reiniciar
+        descarta somente o que foi registrado desde então.
+        Os vértices retirados pelo grafo induzido ficam no estado de
+        trabalho, que desfaz apenas as marcas feitas.
+        """
+
+        self.__removed_edges = dict()
+        self.__state.reset()
+
+    def __remaining_row(self, v: int):
+        # Quantidade de arestas ainda não atravessadas entre v e cada vértice
+        removed_of_v = self.__removed_edges.get(v)
+        if removed_of_v is None:
+            return self.__graph[v]
+        row = self.__graph[v].copy()
+        for w, count in removed_of_v.items():
+            row[w] -= count
+        return row
+
+    def __remove_edge(self, u: int, v: int):
+        # Registra a remoção de uma aresta (u,v) na camada de trabalho
+        removed_of_u = self.__removed_edges.setdefault(u, dict())
+        removed_of_u[v] = removed_of_u.get(v, 0) + 1
+
+    def get_list_of_vertices(self):
+        """Retorna a lista de vértices de um grafo.
+
+        Retorno
+        -------
+        - vertices (list): Lista contendo os vértices do grafo.
+        """
+
+        return np.flatnonzero(~self.__removed).tolist()
+
+    def set_induced_graph(self, s: tuple):
+        """Cria um grafo induzido G-S a partir de um conjunto S,
+        representado pela tupla recebida como parâmetro.
+        A matriz não é copiada: os vértices de S são apenas marcados
+        como removidos.
+
+        Parâmetros
+        ----------
+        - s (tuple): Tupla contendo os vértices do conjunto S.
+        """
+
+        self.set_graph()
+        for v in s:
+            self.__state.remove_vertex(v)
+
+    def find_neighbors(self, v: int):
+        """Retorna os vizinhos de um vértice v.
+
+        Parâmetros
+        ----------
+        - v (int): Vértice de entrada.
+
+        Retorno
+        -------
+        - neighbors (list): Lista contendo os vizinhos de v.
+        """
+
+        # Vértices w presentes com uma ou mais arestas ligando v e w, exceto o próprio v
+        neighbors = np.flatnonzero((self.__remaining_row(v) >= 1) & ~self.__removed)
+        if PROFILER.enabled: # Chamadas e posições percorridas
+            PROFILER.count("find_neighbors")
+            PROFILER.count("neighbor_scan_length", len(self.__graph))
+        return neighbors[neighbors != v].tolist()
+
+    def __degrees(self):
+        # O grau soma as arestas da linha e conta o laço mais uma vez (laço conta como 2)
+        return self.__graph.sum(axis=1, dtype=np.int64) + np.diagonal(self.__graph)
+
+    def get_incidence_arrays(self):
+        """Retorna a estrutura de incidência das arestas do grafo
+        original: para cada vértice v, as posições
+        offsets[v]:offsets[v+1] indicam o vértice alcançado e o
+        identificador de cada aresta incidente a v.
+
+        Retorno
+        -------
+        - offsets (array): Deslocamentos do início da lista de cada vértice.
+        - targets (array): Vértice alcançado por cada posição.
+        - edge_ids (array): Identificador da aresta de cada posição.
+        - num_edges (int): Quantidade de arestas do grafo.
+        """
+
+        if self.__incidence is not None: # A matriz original nunca é alterada
+            return self.__incidence
+
+        # Cada aresta (u,v) ocupa uma posição, repetindo v conforme a multiplicidade
+        rows, columns = np.nonzero(self.__graph)
+        counts = self.__graph[rows, columns]
+        targets = array('i', np.repeat(columns, counts).astype(np.int32).tobytes())
+        degrees = self.__graph.sum(axis=1, dtype=np.int64)
+        offsets = array('q', np.concatenate(([0], np.cumsum(degrees))).astype(np.int64).tobytes())
+        edge_index = EdgeIndex(offsets, targets)
+
+        self.__incidence = (offsets, targets, edge_index.get_edge_ids(), edge_index.get_num_edges())
+        return self.__incidence
+
+    def is_eulerian(self):
+        """Retorna se um grafo é euleriano.
+        Ou seja, se possui todos os vértices com grau par.
+
+        Retorno
+        -------
+        - is_eulerian (bool): Booleano indicando se um grafo é euleriano ou não.
+        """
+
+        return not np.any(self.__degrees() % 2)
+
+    def count_edges(self):
+        """Retorna a quantidade de arestas que incidem em cada vértice.
+
+        Retorno
+        -------
+        - count_edges_of_vertices (dict): Dicionário contendo
+        a quantidade de arestas de cada vértice.
+        """
+
+        counts = self.__graph.sum(axis=1, dtype=np.int64).tolist()
+        return dict(enumerate(counts))
+
+    def connected_components(self):
+        """Calcula os componentes do grafo por expansão de fronteira:
+        cada passo da busca em largura é uma operação booleana entre
+        as linhas da fronteira e o vetor de visitados. A matriz
+        booleana do grafo original não é copiada: os vértices
+        removidos são filtrados pela máscara de presentes, e apenas as
+        linhas da fronteira com arestas atravessadas são recalculadas.
+
+        Retorno
+        -------
+        - count_components (int): Quantidade de componentes de um grafo.
+        - labels (dict): Dicionário contendo o rótulo do componente de cada vértice.
+        """
+
+        adjacency = self.__adjacency
+        num_vertices = len(adjacency)
+        present = ~self.__removed
+        vertices = np.flatnonzero(present)
+        labels = np.full(num_vertices, -1, dtype=np.int64)
+        count_components = 0
+        for v in vertices.tolist():
+            if labels[v] >= 0: # v já pertence a um componente
+                continue
+            frontier = np.zeros(num_vertices, dtype=bool)
+            frontier[v] = True
+            while frontier.any():
+                labels[frontier] = count_components
+                rows = adjacency[frontier]
+                if self.__removed_edges: # Aplica a camada de trabalho às linhas da fronteira
+                    for i, u in enumerate(np.flatnonzero(frontier).tolist()):
+                        if u in self.__removed_edges:
+                            rows[i] = self.__remaining_row(u) >= 1
+                # Vizinhos presentes de toda a fronteira ainda não rotulados
+                frontier = rows.any(axis=0) & (labels < 0) & present
+            count_components += 1
+
+        return count_components, dict(zip(vertices.tolist(), labels[vertices].tolist()))
+
+    def traverse(self, curr_v: int):
+        """Atravessa uma aresta (u,v) do grafo.
+
+        Parâmetros
+        ----------
+        - curr_v (int): Vértice de origem.
+
+        Retorno
+        -------
+        - next_v (int): Vértice de destino.
+        """
+
+        if PROFILER.enabled:
+            PROFILER.count("traverse")
+
+        # O próximo vértice é sempre o primeiro vértice adjacente encontrado na matriz
+        remaining = self.__remaining_row(curr_v) >= 1
+        if not remaining.any(): # argmax devolveria o vértice 0
+            raise ValueError("O vértice {} não possui arestas a atravessar".format(curr_v))
+        next_v = int(np.argmax(remaining))
+
+        # Remove a aresta (u,v) e (v,u) quando u e v são vértices diferentes
+        self.__remove_edge(curr_v, next_v)
+        if curr_v != next_v: # Se for um laço, não precisa remover duas vezes
+            self.__remove_edge(next_v, curr_v)
+
+        return next_v
@@ -0,0 +1,70 @@
+from array import array
+
+class WorkingState:
+    """Classe que abstrai o estado de trabalho de um grafo cujas
+    arestas possuem identificadores. Em vez de copiar a estrutura
+    original, os algoritmos marcam arestas usadas, avançam cursores
+    e removem vértices nesta camada, e cada alteração é registrada
+    em um histórico. Restaurar o estado inicial desfaz apenas o que
+    foi alterado, em tempo proporcional às alterações.
+
+    Parâmetros
+    ----------
+        - num_vertices (int): Quantidade de vértices do grafo.
+        - num_edges (int): Quantidade de arestas do grafo.
+        - first_positions (array): Posição inicial do cursor de cada vértice.
+    """
+
+    def __init__(self, num_vertices: int, num_edges: int, first_positions):
+        self.__first_positions = first_positions
+        # Posição da próxima aresta a ser avaliada na lista de cada vértice
+        self.__cursor = array('q', first_positions)
+        # Marca das arestas já atravessadas e dos vértices removidos
+        self.__used = bytearray(num_edges)
+        self.__removed = bytearray(num_vertices)
+        # Histórico das alterações feitas desde o último reset
+        self.__used_log = []
+        self.__cursor_log = []
+        self.__removed_log = []
+
+    def reset(self):
+        # Desfaz apenas as alterações registradas no histórico
+        for e in self.__used_log:
+            self.__used[e] = 0
+        for v in self.__cursor_log:
+            self.__cursor[v] = self.__first_positions[v]
+        for v in self.__removed_log:
+            self.__removed[v] = 0
+        self.__used_log.clear()
+        self.__cursor_log.clear()
+        self.__removed_log.clear()
+
+    def get_used_edges(self):
+        # Retorna as marcas das arestas usadas (somente leitura)
+        return self.__used
+
+    def get_removed_vertices(self):
+        # Retorna as marcas dos vértices removidos (somente leitura)
+        return self.__removed
+
+    def use_edge(self, e: int):
+        # Marca a aresta e como usada
+        if not self.__used[e]:
+            self.__used[e] = 1
+            self.__used_log.append(e)
+
+    def remove_vertex(self, v: int):
+        # Marca o vértice v como removido
+        if not self.__removed[v]:
+            self.__removed[v] = 1
+            self.__removed_log.append(v)
+
+    def get_cursor(self, v: int):
+        # Retorna a posição do cursor do vértice v
+        return self.__cursor[v]
+
+    def set_cursor(self, v: int, position: int):
+        # Avança o cursor do vértice v
+        if self.__cursor[v] == self.__first_positions[v]: # Primeira alteração de v
+            self.__cursor_log.append(v)
+        self.__cursor[v] = position
@@ -0,0 +1,201 @@
+class HamiltonianSolver:
+    """Classe que abstrai a busca exata de um ciclo hamiltoniano,
+    independente da ED utilizada: trabalha sobre os vizinhos de cada
+    vértice, numerados de 0 a n-1.
+
+    Para poucos vértices, usa programação dinâmica sobre máscaras de
+    bits (Held-Karp): alcance[S] é a máscara dos vértices v tais que
+    existe um caminho que parte de 0, visita exatamente S e termina
+    em v, em O(2^n . n) operações sobre inteiros.
+
+    Para grafos maiores, usa busca com retrocesso que estende um
+    caminho a partir do vértice de menor grau, com podas:
+    - grau: cada vértice fora do caminho precisa de dois vizinhos
+    ainda disponíveis (fora do caminho ou extremidades do caminho);
+    - arestas forçadas: um vizinho da extremidade com apenas dois
+    vizinhos disponíveis precisa ser o próximo do caminho;
+    - conectividade: os vértices fora do caminho precisam ser
+    alcançáveis a partir da extremidade sem passar pelo caminho.
+
+    Parâmetros
+    ----------
+        - adjacency (list): Vizinhos de cada vértice (0, 1, ..., n-1), sem repetições.
+    """
+
+    # Maior quantidade de vértices resolvida pela programação dinâmica
+    DP_MAX_VERTICES = 16
+
+    def __init__(self, adjacency: list):
+        self.__adjacency = adjacency
+        self.__n = len(adjacency)
+
+    def find_cycle(self, method: str = None):
+        """Busca um ciclo hamiltoniano.
+
+        Parâmetros
+        ----------
+        - method (str): "dp" para a programação dinâmica ou
+        "backtracking" para a busca com retrocesso. Se omitido, usa a
+        programação dinâmica até DP_MAX_VERTICES vértices.
+
+        Retorno
+        -------
+        - cycle (list | None): Vértices do ciclo, começando e terminando
+        no mesmo vértice, ou None caso o grafo não possua um.
+        """
+
+        if method is None:
+            method = "dp" if self.__n <= self.DP_MAX_VERTICES else "backtracking"
+        if method not in ("dp", "backtracking"):
+            raise ValueError("Método de busca desconhecido: {}".format(method))
+
+        # Um ciclo precisa de pelo menos 3 vértices, todos com grau 2 ou mais
+        if self.__n < 3 or min(len(neighbors) for neighbors in self.__adjacency) < 2:
+            return None
+        if method == "dp":
+            return self.__held_karp()
+        return self.__backtracking()
+
+    def __held_karp(self):
+        # Programação dinâmica sobre os subconjuntos que contêm o vértice 0
+        n = self.__n
+        adjacency_mask = [0] * n
+        for v in range(n):
+            for w in self.__adjacency[v]:
+                adjacency_mask[v] |= 1 << w
+
+        full = (1 << n) - 1
+        reach = [0] * (1 << n) # Máscara das extremidades possíveis de cada subconjunto
+        reach[1] = 1 # Caminho formado apenas pelo vértice 0
+        for mask in range(1, full + 1, 2): # Subconjuntos ímpares contêm o vértice 0
+            ends = reach[mask]
+            if not ends:
+                continue
+            for w in range(1, n):
+                # w fora do caminho e vizinho de alguma extremidade
+                if not mask >> w & 1 and ends & adjacency_mask[w]:
+                    reach[mask | 1 << w] |= 1 << w
+
+        # Extremidades do caminho completo que fecham o ciclo em 0
+        closing = reach[full] & adjacency_mask[0]
+        if not closing:
+            return None
+
+        # Reconstrói o caminho de trás para frente
+        v = closing.bit_length() - 1
+        mask = full
+        path = [v]
+        while v != 0:
+            previous_mask = mask & ~(1 << v)
+            candidates = reach[previous_mask] & adjacency_mask[v]
+            v = candidates.bit_length() - 1
+            mask = previous_mask
+            path.append(v)
+        path.reverse()
+        path.append(0)
+        return path
+
+    def __backtracking(self):
+        # Busca com retrocesso e pilha explícita (sem limite de recursão)
+        n = self.__n
+        adjacency = self.__adjacency
+        self.__neighbor_sets = [set(neighbors) for neighbors in adjacency]
+        start = min(range(n), key=lambda v: len(adjacency[v]))
+        self.__start = start
+        self.__visited = bytearray(n)
+        # Vizinhos disponíveis de cada vértice: fora do caminho ou extremidades do caminho
+        self.__available = [len(neighbors) for neighbors in adjacency]
+        self.__path = [start]
+        self.__visited[start] = 1
+
+        path = self.__path
+        frames = [self.__candidates(start)] # Candidatos a estender o caminho em cada nível
+        while frames:
+            candidates = frames[-1]
+            if not candidates: # Candidatos esgotados: retrocede
+                frames.pop()
+                if frames: # O caminho tem um vértice a mais do que os níveis restantes
+                    self.__retract()
+                continue
+
+            w = candidates.pop()
+            self.__extend(w)
+            if len(path) == n: # Caminho completo: fecha o ciclo se w é vizinho do início
+                if start in self.__neighbor_sets[w]:
+                    i = path.index(0) # O ciclo é devolvido a partir do vértice 0
+                    return path[i:] + path[:i] + [0]
+                self.__retract()
+            elif not self.__is_feasible():
+                self.__retract()
+            else:
+                frames.append(self.__candidates(w))
+
+        return None
+
+    def __extend(self, w: int):
+        # Acrescenta w ao caminho; a extremidade anterior deixa de estar disponível
+        u = self.__path[-1]
+        self.__path.append(w)
+        self.__visited[w] = 1
+        if u != self.__start:
+            for x in self.__adjacency[u]:
+                if not self.__visited[x]:
+                    self.__available[x] -= 1
+
+    def __retract(self):
+        # Retira a extremidade do caminho, desfazendo __extend
+        w = self.__path[-1]
+        u = self.__path[-2]
+        if u != self.__start:
+            for x in self.__adjacency[u]:
+                if not self.__visited[x]:
+                    self.__available[x] += 1
+        self.__path.pop()
+        self.__visited[w] = 0
+
+    def __is_feasible(self):
+        # Poda de grau: vértices fora do caminho precisam de dois vizinhos disponíveis
+        u = self.__path[-2]
+        visited = self.__visited
+        if u != self.__start:
+            for x in self.__adjacency[u]:
+                if not visited[x] and self.__available[x] < 2:
+                    return False
+
+        # O início precisa de um vizinho fora do caminho (ou da extremidade) para fechar o ciclo
+        head = self.__path[-1]
+        if not any(not visited[x] or x == head for x in self.__adjacency[self.__start]):
+            return False
+
+        # Poda de conectividade: a extremidade alcança todos os vértices fora do caminho
+        remaining = self.__n - len(self.__path)
+        reached = bytearray(self.__n)
+        stack = [head]
+        count = 0
+        while stack:
+            v = stack.pop()
+            for x in self.__adjacency[v]:
+                if not visited[x] and not reached[x]:
+                    reached[x] = 1
+                    count += 1
+                    stack.append(x)
+        return count == remaining
+
+    def __candidates(self, w: int):
+        """Retorna os próximos vértices possíveis após w, na ordem
+        inversa de tentativa (o último é tentado primeiro): vértices
+        com menos vizinhos disponíveis são tentados antes. Se um
+        vizinho tem apenas dois vizinhos disponíveis, um deles é w, e
+        ele precisa ser vizinho de w no ciclo.
+        """
+
+        candidates = [x for x in self.__adjacency[w] if not self.__visited[x]]
+        forced = [x for x in candidates if self.__available[x] == 2]
+        # O início ainda tem duas arestas livres no ciclo; os demais vértices, apenas uma
+        free_edges = 2 if w == self.__start else 1
+        if len(forced) > free_edges: # Mais vértices exigem uma aresta de w do que as livres
+            return []
+        if forced: # Pela simetria do ciclo, basta tentar um dos vizinhos forçados do início
+            return forced[:1]
+        candidates.sort(key=lambda x: self.__available[x], reverse=True)
+        return candidates
@@ -0,0 +1,70 @@
+from array import array
+
+class Hierholzer:
+    """Classe que abstrai o algoritmo de Hierholzer para encontrar
+    um circuito euleriano, independente da ED utilizada.
+
+    Trabalha sobre a estrutura de incidência das arestas: cada aresta
+    não direcionada possui um identificador, as arestas atravessadas
+    são marcadas em um vetor de bytes e cada vértice mantém um cursor
+    que só avança na sua lista de incidência. Assim, cada posição é
+    avaliada uma única vez e o trabalho total é O(|V|+|A|).
+
+    Parâmetros
+    ----------
+        - offsets (array): Deslocamentos do início da lista de cada vértice.
+        - targets (array): Vértice alcançado por cada posição.
+        - edge_ids (array): Identificador da aresta de cada posição.
+        - num_edges (int): Quantidade de arestas do grafo.
+    """
+
+    def __init__(self, offsets, targets, edge_ids, num_edges: int):
+        self.__offsets = offsets
+        self.__targets = targets
+        self.__edge_ids = edge_ids
+        self.__num_edges = num_edges
+
+    def find_circuit(self, initial_v: int = 0):
+        """Retorna um circuito euleriano a partir de um vértice.
+        Supõe que o grafo é conectado e possui todos os vértices
+        com grau par.
+
+        Parâmetros
+        ----------
+        - initial_v (int): Vértice de partida do circuito.
+
+        Retorno
+        -------
+        - circuit (array): Vetor de inteiros com os vértices do circuito,
+        começando e terminando em initial_v.
+        """
+
+        offsets = self.__offsets
+        targets = self.__targets
+        edge_ids = self.__edge_ids
+        # Posição da próxima aresta a ser avaliada na lista de cada vértice
+        cursor = array('q', offsets[:-1])
+        # Marca das arestas já atravessadas
+        used = bytearray(self.__num_edges)
+
+        circuit = array('i') # Vértices do circuito final (em ordem inversa)
+        # Pilha do circuito intermediário (lista simples para evitar uma chamada por vértice)
+        current_circuit = [initial_v]
+        while current_circuit: # Enquanto houver um circuito a ser explorado
+            current_v = current_circuit[-1]
+            position = cursor[current_v]
+            end = offsets[current_v+1]
+            # Avança o cursor sobre as arestas já atravessadas a partir do outro vértice
+            while position < end and used[edge_ids[position]]:
+                position += 1
+
+            if position < end: # O vértice atual possui aresta para ser explorada
+                used[edge_ids[position]] = 1 # Atravessa a aresta somente uma vez
+                cursor[current_v] = position + 1
+                current_circuit.append(targets[position])
+            else: # Terminou um circuito: o vértice vai para o circuito final
+                cursor[current_v] = position
+                circuit.append(current_circuit.pop())
+
+        circuit.reverse()
+        return circuit
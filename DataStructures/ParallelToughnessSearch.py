@@ -0,0 +1,166 @@
+import multiprocessing
+import os
+from math import comb
+from DataStructures.GraphStructures.BitsetAdjacency import BitsetAdjacency
+
+class ParallelToughnessSearch:
+    """Classe que abstrai a busca, em vários processos, de um
+    subconjunto S que viole w(G-S) <= |S|.
+
+    Os subconjuntos de cada tamanho k são numerados de 0 a C(n,k)-1
+    em ordem lexicográfica (sistema numérico combinatório), e cada
+    tarefa avalia um intervalo dessas posições: o primeiro
+    subconjunto é obtido diretamente da sua posição, e os seguintes,
+    pelo sucessor lexicográfico. Cada processo recebe uma única vez
+    as máscaras de vizinhos do grafo, somente para leitura, e conta
+    os componentes de G-S por expansão de fronteira sobre bits.
+    Um evento compartilhado interrompe todos os processos assim que
+    algum deles encontra uma violação.
+
+    Parâmetros
+    ----------
+        - adjacency (list): Vizinhos de cada vértice (0, 1, ..., n-1).
+        - max_size (int): Tamanho máximo de S.
+        - workers (int): Quantidade de processos. Se omitido, usa a
+        quantidade de núcleos da máquina.
+    """
+
+    # Tamanho mínimo de um intervalo e intervalos por processo em cada tamanho de S
+    MIN_CHUNK = 1 << 10
+    CHUNKS_PER_WORKER = 16
+    # Subconjuntos avaliados entre duas consultas ao evento de parada
+    STOP_CHECK_INTERVAL = 1 << 8
+
+    def __init__(self, adjacency: list, max_size: int, workers: int = None):
+        self.__n = len(adjacency)
+        self.__max_size = max_size
+        self.__workers = workers or os.cpu_count() or 1
+        self.__masks = BitsetAdjacency.masks_of(adjacency)
+
+    @staticmethod
+    def unrank(rank: int, n: int, k: int):
+        """Retorna o subconjunto de tamanho k de {0, ..., n-1} que
+        ocupa a posição rank na ordem lexicográfica.
+
+        Parâmetros
+        ----------
+        - rank (int): Posição do subconjunto (0 <= rank < C(n,k)).
+        - n (int): Quantidade de elementos.
+        - k (int): Tamanho do subconjunto.
+
+        Retorno
+        -------
+        - s (list): Elementos do subconjunto, em ordem crescente.
+        """
+
+        s = []
+        x = 0
+        for i in range(k):
+            # Pula os elementos x cujos subconjuntos (começando em x) ficam antes da posição
+            while rank >= comb(n - x - 1, k - i - 1):
+                rank -= comb(n - x - 1, k - i - 1)
+                x += 1
+            s.append(x)
+            x += 1
+        return s
+
+    def chunks(self):
+        """Divide os subconjuntos em intervalos de posições, em ordem
+        crescente de tamanho.
+
+        Retorno
+        -------
+        - chunks (list): Tuplas (k, início, fim) de cada intervalo.
+        """
+
+        chunks = []
+        for k in range(1, self.__max_size + 1):
+            total = comb(self.__n, k)
+            size = max(self.MIN_CHUNK, -(-total // (self.__workers * self.CHUNKS_PER_WORKER)))
+            for start in range(0, total, size):
+                chunks.append((k, start, min(start + size, total)))
+        return chunks
+
+    def run(self):
+        """Executa a busca.
+
+        Retorno
+        -------
+        - s (list | None): Índices dos vértices de S que viola a
+        condição, ou None caso nenhum subconjunto a viole.
+        - examined (int): Quantidade de subconjuntos avaliados.
+        """
+
+        context = multiprocessing.get_context()
+        stop = context.Event()
+        examined = 0
+        with context.Pool(self.__workers, initializer=_init_worker,
+                          initargs=(self.__masks, stop)) as pool:
+            for violator, count in pool.imap_unordered(_search_chunk, self.chunks()):
+                examined += count
+                if violator is not None:
+                    stop.set() # Interrompe os demais processos
+                    return violator, examined
+
+        return None, examined
+
+
+# Estado de cada processo da busca, definido uma única vez por _init_worker
+_worker_state = dict()
+
+def _init_worker(masks: list, stop):
+    _worker_state["masks"] = masks
+    _worker_state["stop"] = stop
+
+def _search_chunk(chunk: tuple):
+    # Avalia um intervalo nos processos da busca, consultando o evento de parada
+    k, start, end = chunk
+    return search_range(_worker_state["masks"], k, start, end, _worker_state["stop"])
+
+def search_range(masks: list, k: int, start: int, end: int, stop=None,
+                 stop_interval: int = None):
+    """Avalia os subconjuntos de tamanho k cujas posições, na ordem
+    lexicográfica, estão no intervalo [start, end).
+
+    Parâmetros
+    ----------
+    - masks (list): Máscara dos vizinhos de cada vértice.
+    - k (int): Tamanho de S.
+    - start (int): Posição do primeiro subconjunto.
+    - end (int): Posição seguinte à do último subconjunto.
+    - stop (Event): Evento que interrompe a avaliação, se informado.
+    Qualquer objeto com o método is_set (ex.: um prazo) serve.
+    - stop_interval (int): Subconjuntos avaliados entre duas consultas
+    a stop. Se omitido, usa STOP_CHECK_INTERVAL.
+
+    Retorno
+    -------
+    - s (list | None): Índices dos vértices de S que viola a condição.
+    - examined (int): Quantidade de subconjuntos avaliados.
+    """
+
+    n = len(masks)
+    all_vertices = (1 << n) - 1
+    s = ParallelToughnessSearch.unrank(start, n, k)
+    stop_interval = stop_interval or ParallelToughnessSearch.STOP_CHECK_INTERVAL
+    for examined in range(end - start):
+        if stop is not None and examined % stop_interval == 0 and stop.is_set():
+            return None, examined
+
+        removed = 0
+        for v in s:
+            removed |= 1 << v
+        if len(BitsetAdjacency.components_of(masks, all_vertices & ~removed)) > k: # w(G-S) > |S|
+            return s, examined + 1
+
+        # Sucessor lexicográfico: incrementa o último elemento que ainda pode crescer
+        i = k - 1
+        while i >= 0 and s[i] == n - k + i:
+            i -= 1
+        if i < 0:
+            break
+        s[i] += 1
+        for j in range(i + 1, k):
+            s[j] = s[j - 1] + 1
+
+    return None, end - start
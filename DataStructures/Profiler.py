@@ -0,0 +1,181 @@
+import json
+import time
+import tracemalloc
+try:
+    import resource
+except ImportError: # Indisponível fora de sistemas Unix
+    resource = None
+
+class Profiler:
+    """Classe que abstrai a instrumentação opcional das operações
+    do grafo: contadores, tempo de cada etapa e pico de memória.
+
+    Desativado, o custo nos trechos mais executados se resume a
+    testar o atributo enabled antes de contar, e as etapas usam um
+    contexto vazio compartilhado, de modo que a instrumentação pode
+    permanecer no código em execuções normais.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.__trace_memory = False
+        self.__null_phase = _NullPhase()
+        self.reset()
+
+    def enable(self, trace_memory: bool = False):
+        """Ativa a instrumentação.
+
+        Parâmetros
+        ----------
+        - trace_memory (bool): Indica se o pico de memória de cada
+        etapa é medido com o tracemalloc (mais lento).
+        """
+
+        self.enabled = True
+        self.__trace_memory = trace_memory
+        if trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    def disable(self):
+        # Desativa a instrumentação, mantendo os dados coletados
+        self.enabled = False
+        if self.__trace_memory:
+            tracemalloc.stop()
+            self.__trace_memory = False
+
+    def reset(self):
+        # Descarta os dados coletados
+        self.__counters = dict()
+        self.__phases = dict()
+        self.__snapshots = []
+        self.__peak_stack = [] # Pico de memória das etapas em andamento
+        self.__peak_memory = 0 # Maior pico de memória entre as etapas concluídas
+
+    def count(self, name: str, amount: int = 1):
+        """Incrementa um contador. Nos trechos mais executados, deve
+        ser chamado apenas se enabled for verdadeiro.
+
+        Parâmetros
+        ----------
+        - name (str): Nome do contador.
+        - amount (int): Valor somado ao contador.
+        """
+
+        self.__counters[name] = self.__counters.get(name, 0) + amount
+
+    def phase(self, name: str):
+        """Retorna um contexto que mede o tempo (e, se ativado, o pico
+        de memória) de uma etapa. Chamadas repetidas da mesma etapa
+        são acumuladas.
+
+        Parâmetros
+        ----------
+        - name (str): Nome da etapa.
+
+        Retorno
+        -------
+        - context: Contexto a ser usado em um bloco with.
+        """
+
+        if not self.enabled:
+            return self.__null_phase
+        return _Phase(self, name)
+
+    def snapshot(self, label: str):
+        """Registra a memória atual e o pico de memória até o momento.
+
+        Parâmetros
+        ----------
+        - label (str): Identificação do registro.
+        """
+
+        if not self.enabled:
+            return
+        entry = {"label": label, "max_rss_kb": self.__max_rss()}
+        if self.__trace_memory:
+            entry["current_bytes"], peak = tracemalloc.get_traced_memory()
+            # O pico do tracemalloc é zerado a cada etapa
+            entry["peak_bytes"] = max(peak, self.__peak_memory)
+        self.__snapshots.append(entry)
+
+    def begin_phase(self):
+        # Início de uma etapa: guarda o pico da etapa externa e zera o pico
+        if self.__trace_memory:
+            if self.__peak_stack:
+                self.__peak_stack[-1] = max(self.__peak_stack[-1], tracemalloc.get_traced_memory()[1])
+            tracemalloc.reset_peak()
+            self.__peak_stack.append(0)
+        return time.perf_counter()
+
+    def end_phase(self, name: str, start: float):
+        # Fim de uma etapa: acumula o tempo e o pico de memória
+        elapsed = time.perf_counter() - start
+        stats = self.__phases.setdefault(name, {"calls": 0, "seconds": 0.0})
+        stats["calls"] += 1
+        stats["seconds"] += elapsed
+        if self.__trace_memory and self.__peak_stack:
+            peak = max(self.__peak_stack.pop(), tracemalloc.get_traced_memory()[1])
+            stats["peak_memory_bytes"] = max(stats.get("peak_memory_bytes", 0), peak)
+            self.__peak_memory = max(self.__peak_memory, peak)
+            if self.__peak_stack: # O pico da etapa interna também é da etapa externa
+                self.__peak_stack[-1] = max(self.__peak_stack[-1], peak)
+            tracemalloc.reset_peak()
+
+    def report(self):
+        """Retorna os dados coletados.
+
+        Retorno
+        -------
+        - report (dict): Contadores, etapas, registros de memória e
+        pico de memória residente do processo.
+        """
+
+        return {"counters": dict(self.__counters), "phases": dict(self.__phases),
+                "snapshots": list(self.__snapshots), "max_rss_kb": self.__max_rss()}
+
+    def dump(self, stream):
+        """Grava os dados coletados em formato JSON.
+
+        Parâmetros
+        ----------
+        - stream: Fluxo de saída de texto.
+        """
+
+        json.dump(self.report(), stream, indent=1, sort_keys=True)
+        stream.write("\n")
+
+    def __max_rss(self):
+        # Pico de memória residente do processo, em kB, se disponível
+        if resource is None:
+            return None
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+class _Phase:
+    """Contexto de uma etapa medida pelo Profiler."""
+
+    def __init__(self, profiler: Profiler, name: str):
+        self.__profiler = profiler
+        self.__name = name
+
+    def __enter__(self):
+        self.__start = self.__profiler.begin_phase()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.__profiler.end_phase(self.__name, self.__start)
+        return False
+
+
+class _NullPhase:
+    """Contexto vazio utilizado quando a instrumentação está desativada."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+# Instância compartilhada por todas as estruturas
+PROFILER = Profiler()
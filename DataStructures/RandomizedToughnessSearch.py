@@ -0,0 +1,179 @@
+import random
+import time
+from collections import deque
+from DataStructures.GraphStructures.BitsetAdjacency import BitsetAdjacency
+
+class RandomizedToughnessSearch:
+    """Classe que abstrai a busca aleatória, com tempo limitado, de um
+    subconjunto S que viole w(G-S) <= |S|, para grafos grandes demais
+    para a busca exaustiva. Encontrar S prova que o grafo não é
+    hamiltoniano; não encontrar não prova nada.
+
+    Cada tentativa sorteia um S inicial com uma das estratégias:
+    - vértices de grau alto, sorteados com chance proporcional ao grau;
+    - vizinhanças de vértices de grau baixo, que ficam isolados em G-S;
+    - a borda de uma bola da busca em largura a partir de um vértice,
+    que separa o interior da bola do resto do grafo.
+    Em seguida, uma busca local acrescenta ou retira um vértice de S
+    por vez enquanto w(G-S) - |S| aumentar (ou, por poucos passos,
+    se mantiver). Os componentes de G-S são contados sobre as
+    máscaras de vizinhos, como na BitsetAdjacency. O prazo é
+    consultado a cada movimento avaliado, já que, em grafos grandes,
+    uma única busca local pode levar mais do que o tempo disponível.
+
+    Parâmetros
+    ----------
+        - adjacency (list): Vizinhos de cada vértice (0, 1, ..., n-1).
+        - max_size (int): Tamanho máximo de S.
+        - seed (int): Semente do gerador aleatório.
+    """
+
+    STRATEGIES = ("high_degree", "low_degree_neighborhood", "ball_boundary")
+    # Movimentos avaliados por passo da busca local e passos sem melhora permitidos
+    MOVE_SAMPLE = 32
+    PLATEAU_MOVES = 8
+
+    def __init__(self, adjacency: list, max_size: int, seed: int = None):
+        self.__adjacency = adjacency
+        self.__n = len(adjacency)
+        self.__max_size = max_size
+        self.__rng = random.Random(seed)
+        self.__masks = BitsetAdjacency.masks_of(adjacency)
+        self.__all_vertices = (1 << self.__n) - 1
+        self.__examined = 0
+
+    def run(self, time_budget: float = None, restarts: int = None):
+        """Executa tentativas até encontrar uma violação ou esgotar
+        o tempo ou a quantidade de tentativas.
+
+        Parâmetros
+        ----------
+        - time_budget (float): Tempo máximo, em segundos.
+        - restarts (int): Quantidade máxima de tentativas.
+
+        Retorno
+        -------
+        - s (list | None): Índices dos vértices de S que viola a
+        condição, ou None caso nenhuma tentativa encontre um.
+        - num_components (int | None): w(G-S) do S encontrado (certificado).
+        - attempts (int): Quantidade de tentativas feitas.
+        - examined (int): Quantidade de subconjuntos avaliados.
+        """
+
+        if self.__max_size < 1: # Não há subconjunto que possa violar a condição
+            return None, None, 0, 0
+
+        deadline = None if time_budget is None else time.perf_counter() + time_budget
+        attempts = 0
+        while restarts is None or attempts < restarts:
+            if deadline is not None and time.perf_counter() >= deadline:
+                break
+            attempts += 1
+            strategy = self.__rng.choice(self.STRATEGIES)
+            s = self.__local_search(self.__initial_set(strategy), deadline)
+            num_components = self.__num_components(s)
+            if num_components > self.__size(s): # w(G-S) > |S|
+                return BitsetAdjacency.vertices_of(s), num_components, attempts, self.__examined
+
+        return None, None, attempts, self.__examined
+
+    def __size(self, s: int):
+        # |S|: quantidade de bits ligados
+        return bin(s).count("1")
+
+    def __num_components(self, s: int):
+        # w(G-S) por expansão de fronteira sobre as máscaras
+        self.__examined += 1
+        return len(BitsetAdjacency.components_of(self.__masks, self.__all_vertices & ~s))
+
+    def __score(self, s: int):
+        return self.__num_components(s) - self.__size(s)
+
+    def __initial_set(self, strategy: str):
+        # Sorteia o S inicial de acordo com a estratégia
+        rng = self.__rng
+        n = self.__n
+        if strategy == "high_degree":
+            size = rng.randint(1, self.__max_size)
+            weights = [len(neighbors) for neighbors in self.__adjacency]
+            if not any(weights): # Sem arestas: todos os vértices têm a mesma chance
+                weights = None
+            s = 0
+            for v in rng.choices(range(n), weights=weights, k=size): # Repetições apenas diminuem S
+                s |= 1 << v
+        elif strategy == "low_degree_neighborhood":
+            # Vizinhanças do vértice de menor grau entre alguns sorteados, uma ou mais vezes
+            s = 0
+            isolated = 0
+            for i in range(rng.randint(1, 3)):
+                v = min(rng.sample(range(n), min(n, 4)), key=lambda x: len(self.__adjacency[x]))
+                if not (s | isolated) >> v & 1:
+                    s |= self.__masks[v]
+                    isolated |= 1 << v
+            s &= ~isolated
+        else: # Borda de uma bola da busca em largura: vértices à distância exatamente r
+            root = rng.randrange(n)
+            radius = rng.randint(1, 3)
+            distance = {root: 0}
+            queue = deque([root])
+            border = 0
+            while queue:
+                v = queue.popleft()
+                if distance[v] == radius:
+                    border |= 1 << v
+                    continue
+                for w in self.__adjacency[v]:
+                    if w not in distance:
+                        distance[w] = distance[v] + 1
+                        queue.append(w)
+            s = border
+
+        # Ajusta S ao tamanho permitido, retirando vértices sorteados
+        vertices = BitsetAdjacency.vertices_of(s)
+        if not vertices:
+            return 1 << rng.randrange(n)
+        if len(vertices) > self.__max_size:
+            s = 0
+            for v in rng.sample(vertices, self.__max_size):
+                s |= 1 << v
+        return s
+
+    def __local_search(self, s: int, deadline: float = None):
+        # Acrescenta ou retira um vértice por vez, mantendo o melhor w(G-S) - |S|,
+        # até um ótimo local ou o fim do prazo
+        rng = self.__rng
+        score = self.__score(s)
+        plateau = 0
+        while score <= 0:
+            # Candidatos a entrar: vizinhos de S; candidatos a sair: vértices de S
+            inside = BitsetAdjacency.vertices_of(s)
+            neighbors_of_s = 0
+            for v in inside:
+                neighbors_of_s |= self.__masks[v]
+            outside = BitsetAdjacency.vertices_of(neighbors_of_s & ~s)
+            moves = []
+            if len(inside) > 1:
+                moves += rng.sample(inside, min(len(inside), self.MOVE_SAMPLE))
+            if len(inside) < self.__max_size:
+                moves += rng.sample(outside, min(len(outside), self.MOVE_SAMPLE))
+
+            best_score, best_moves = None, []
+            for v in moves:
+                if deadline is not None and time.perf_counter() >= deadline:
+                    return s # Prazo esgotado: S atual é o melhor encontrado
+                candidate_score = self.__score(s ^ (1 << v))
+                if best_score is None or candidate_score > best_score:
+                    best_score, best_moves = candidate_score, [v]
+                elif candidate_score == best_score:
+                    best_moves.append(v)
+
+            if best_score is None or best_score < score:
+                break # Ótimo local
+            if best_score == score: # Sem melhora: poucos passos laterais
+                plateau += 1
+                if plateau > self.PLATEAU_MOVES:
+                    break
+            s ^= 1 << rng.choice(best_moves)
+            score = best_score
+
+        return s
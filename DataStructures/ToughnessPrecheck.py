@@ -0,0 +1,233 @@
+import time
+from collections import deque
+from DataStructures.GraphStructures.BitsetAdjacency import BitsetAdjacency
+
+class ToughnessPrecheck:
+    """Classe que abstrai as verificações polinomiais feitas antes da
+    busca exponencial por um subconjunto S que viole w(G-S) <= |S|.
+    Independente da ED utilizada, trabalha sobre os vizinhos de cada
+    vértice, numerados de 0 a n-1.
+
+    As verificações são feitas em ordem crescente de custo, e a
+    primeira que encontra uma violação interrompe as demais:
+    - desconexão: um vértice com vizinhos de um grafo desconexo, ou
+    qualquer vértice se nenhum tiver vizinhos (n >= 3);
+    - grau mínimo: o vizinho de um vértice de grau 1, ou outro vértice
+    qualquer se houver um vértice de grau 0;
+    - articulação: um vértice de corte, em uma passada de Tarjan;
+    - bipartição: a menor parte de um grafo conexo, bipartido e desbalanceado;
+    - separador de 2 vértices: {u,v} cuja remoção deixa 3 ou mais
+    componentes, com uma passada de Tarjan em G-u para cada u.
+
+    Toda testemunha é não vazia e é confirmada contando os
+    componentes de G-S antes de ser devolvida. É possível escolher
+    quais verificações são feitas e, com um prazo, as que ainda não
+    foram feitas quando ele se esgota são puladas, e a do separador
+    de 2 vértices, O(n(n+m)), é interrompida.
+
+    Parâmetros
+    ----------
+        - adjacency (list): Vizinhos de cada vértice (0, 1, ..., n-1), sem repetições.
+        - masks (list): Máscaras dos vizinhos de cada vértice, caso a ED
+        utilizada já as tenha (backend "bitset"). Com elas, os componentes
+        de G-S são contados por expansão de fronteira sobre bits.
+    """
+
+    # Verificações na ordem em que são feitas
+    TIERS = ("disconnected", "min_degree", "articulation_point",
+             "bipartite_imbalance", "two_vertex_separator")
+    # Verificações em tempo O(n+m), as únicas feitas antes de uma busca com limite de tempo
+    LINEAR_TIERS = TIERS[:-1]
+
+    def __init__(self, adjacency: list, masks: list = None):
+        self.__adjacency = adjacency
+        self.__masks = masks
+        self.__n = len(adjacency)
+
+    def find_violator(self, deadline: float = None, tiers: tuple = None):
+        """Executa as verificações em ordem.
+
+        Parâmetros
+        ----------
+        - deadline (float): Instante (time.perf_counter) a partir do
+        qual nenhuma verificação é feita. Se omitido, não há limite.
+        - tiers (tuple): Verificações feitas, entre as de TIERS. Se
+        omitido, faz todas.
+
+        Retorno
+        -------
+        - tier (str | None): Verificação que encontrou a violação.
+        - s (list | None): Índices dos vértices de S, ou None caso
+        nenhuma verificação encontre uma violação.
+        """
+
+        # Com menos de 3 vértices nenhum S próprio pode violar a condição
+        if self.__n < 3:
+            return None, None
+
+        self.__deadline = deadline
+        for tier, check in zip(self.TIERS, (self.__disconnected, self.__min_degree,
+                                            self.__articulation_point, self.__bipartite_imbalance,
+                                            self.__two_vertex_separator)):
+            if self.__expired():
+                break
+            if tiers is not None and tier not in tiers:
+                continue
+            s = check()
+            if s and self.count_components(s) > len(s): # S não vazio e w(G-S) > |S|
+                return tier, s
+
+        return None, None
+
+    def count_components(self, s: list):
+        """Calcula w(G-S) por busca em largura, ou sobre as máscaras
+        de vizinhos, caso tenham sido informadas.
+
+        Parâmetros
+        ----------
+        - s (list): Índices dos vértices de S.
+
+        Retorno
+        -------
+        - count_components (int): Quantidade de componentes de G-S.
+        """
+
+        if self.__masks is not None:
+            present = (1 << self.__n) - 1
+            for v in s:
+                present &= ~(1 << v)
+            return len(BitsetAdjacency.components_of(self.__masks, present))
+
+        visited = bytearray(self.__n)
+        for v in s:
+            visited[v] = 1
+        count_components = 0
+        for root in range(self.__n):
+            if visited[root]:
+                continue
+            count_components += 1
+            visited[root] = 1
+            queue = deque([root])
+            while queue:
+                v = queue.popleft()
+                for w in self.__adjacency[v]:
+                    if not visited[w]:
+                        visited[w] = 1
+                        queue.append(w)
+
+        return count_components
+
+    def __expired(self):
+        # Indica se o prazo das verificações se esgotou
+        return self.__deadline is not None and time.perf_counter() >= self.__deadline
+
+    def __disconnected(self):
+        # Em um grafo desconexo, remover um vértice de um componente com 2 ou mais
+        # vértices mantém todos os componentes; sem arestas, sobram n-1 >= 2 vértices isolados
+        if self.count_components([]) < 2:
+            return None
+        for v in range(self.__n):
+            if any(w != v for w in self.__adjacency[v]):
+                return [v]
+        return [0]
+
+    def __min_degree(self):
+        # O vizinho de um vértice de grau 1 separa o vértice do resto do grafo,
+        # e um vértice de grau 0 fica isolado de G-S para qualquer outro S = {u}
+        for v in range(self.__n):
+            if len(self.__adjacency[v]) == 1:
+                return [self.__adjacency[v][0]]
+            if len(self.__adjacency[v]) == 0:
+                return [1 if v == 0 else 0]
+        return None
+
+    def __articulation_point(self):
+        # Um vértice de corte deixa pelo menos 2 componentes
+        pieces = self.__pieces()
+        for v in range(self.__n):
+            if pieces[v] >= 2:
+                return [v]
+        return None
+
+    def __bipartite_imbalance(self):
+        # Removendo a menor parte, cada vértice da maior parte fica isolado.
+        # As partes só são únicas em um grafo conexo
+        if self.count_components([]) != 1:
+            return None
+        color = [-1] * self.__n
+        color[0] = 0
+        queue = deque([0])
+        while queue:
+            v = queue.popleft()
+            for w in self.__adjacency[v]:
+                if color[w] < 0:
+                    color[w] = 1 - color[v]
+                    queue.append(w)
+                elif color[w] == color[v]: # Ciclo ímpar: não é bipartido
+                    return None
+
+        parts = ([v for v in range(self.__n) if color[v] == 0],
+                 [v for v in range(self.__n) if color[v] == 1])
+        smaller, larger = sorted(parts, key=len)
+        if len(smaller) < len(larger):
+            return smaller
+        return None
+
+    def __two_vertex_separator(self):
+        # G é 2-conexo: G-u é conectado, e um vértice que divide G-u em 3 partes completa S
+        for u in range(self.__n):
+            if self.__expired(): # Uma passada de Tarjan por vértice: respeita o prazo entre elas
+                return None
+            pieces = self.__pieces(skip=u)
+            for v in range(self.__n):
+                if pieces[v] >= 3:
+                    return [u, v]
+        return None
+
+    def __pieces(self, skip: int = -1):
+        """Algoritmo de Tarjan (lowlink) com pilha explícita, ignorando
+        o vértice skip. Retorna, para cada vértice v, em quantas partes
+        o seu componente se divide ao remover v: a raiz de cada busca
+        se divide em uma parte por filho, e os demais vértices em uma
+        parte por filho c com low[c] >= disc[v], mais a parte do pai.
+        """
+
+        n = self.__n
+        adjacency = self.__adjacency
+        disc = [-1] * n
+        low = [0] * n
+        splits = [0] * n
+        roots = []
+        time = 0
+        for root in range(n):
+            if root == skip or disc[root] >= 0:
+                continue
+            roots.append(root)
+            disc[root] = low[root] = time
+            time += 1
+            stack = [(root, -1, iter(adjacency[root]))]
+            while stack:
+                v, parent, neighbors = stack[-1]
+                for w in neighbors:
+                    if w == skip:
+                        continue
+                    if disc[w] < 0: # Desce para o filho w
+                        disc[w] = low[w] = time
+                        time += 1
+                        stack.append((w, v, iter(adjacency[w])))
+                        break
+                    if w != parent: # Aresta de retorno
+                        low[v] = min(low[v], disc[w])
+                else: # Vizinhos de v esgotados: volta ao pai
+                    stack.pop()
+                    if parent >= 0:
+                        low[parent] = min(low[parent], low[v])
+                        if low[v] >= disc[parent]:
+                            splits[parent] += 1
+
+        pieces = [splits[v] + 1 for v in range(n)]
+        for root in roots: # A raiz não tem a parte do pai
+            pieces[root] -= 1
+        if skip >= 0:
+            pieces[skip] = 0
+        return pieces
@@ -0,0 +1,110 @@
+class UnionFind:
+    """Classe que abstrai a implementação de uma estrutura
+    de conjuntos disjuntos (union-find) utilizando listas contíguas,
+    com compressão de caminho e união por posto (rank).
+
+    No modo com desfazer (rollback), as uniões são registradas em
+    um histórico e podem ser desfeitas em ordem inversa. Nesse modo
+    a compressão de caminho é desativada, pois alteraria a estrutura
+    de forma que não pode ser desfeita em tempo constante.
+
+    Parâmetros
+    ----------
+        - size (int): Quantidade de elementos (0, 1, ..., size-1).
+        - rollback (bool): Indica se as uniões podem ser desfeitas.
+    """
+
+    def __init__(self, size: int, rollback: bool = False):
+        # Cada elemento começa como representante do seu próprio conjunto
+        self.__parent = list(range(size))
+        self.__rank = [0] * size
+        # Quantidade de conjuntos disjuntos
+        self.__count = size
+        # Histórico de uniões (apenas no modo com desfazer)
+        self.__rollback = rollback
+        self.__history = []
+
+    def find(self, v: int):
+        """Retorna o representante do conjunto que contém v.
+
+        Parâmetros
+        ----------
+        - v (int): Elemento de entrada.
+
+        Retorno
+        -------
+        - root (int): Representante do conjunto de v.
+        """
+
+        parent = self.__parent
+        root = v
+        while parent[root] != root: # Sobe até a raiz
+            root = parent[root]
+        if not self.__rollback:
+            while parent[v] != root: # Compressão de caminho
+                parent[v], v = root, parent[v]
+        return root
+
+    def union(self, u: int, v: int):
+        """Une os conjuntos que contêm u e v.
+
+        Parâmetros
+        ----------
+        - u (int): Primeiro elemento.
+        - v (int): Segundo elemento.
+
+        Retorno
+        -------
+        - united (bool): Booleano indicando se os conjuntos eram
+        distintos e foram unidos.
+        """
+
+        root_u = self.find(u)
+        root_v = self.find(v)
+        if root_u == root_v: # Já estão no mesmo conjunto
+            return False
+
+        # União por posto: a árvore mais baixa fica abaixo da mais alta
+        if self.__rank[root_u] < self.__rank[root_v]:
+            root_u, root_v = root_v, root_u
+        self.__parent[root_v] = root_u
+        increased_rank = self.__rank[root_u] == self.__rank[root_v]
+        if increased_rank:
+            self.__rank[root_u] += 1
+        if self.__rollback: # Registra a união para poder desfazê-la
+            self.__history.append((root_v, root_u, increased_rank))
+
+        self.__count -= 1
+        return True
+
+    def count_sets(self):
+        # Retorna a quantidade de conjuntos disjuntos
+        return self.__count
+
+    def checkpoint(self):
+        """Retorna um marcador do estado atual das uniões,
+        utilizado posteriormente para desfazê-las.
+
+        Retorno
+        -------
+        - checkpoint (int): Tamanho atual do histórico de uniões.
+        """
+
+        return len(self.__history)
+
+    def rollback(self, checkpoint: int):
+        """Desfaz, em ordem inversa, todas as uniões realizadas
+        após o marcador informado.
+
+        Parâmetros
+        ----------
+        - checkpoint (int): Marcador retornado por checkpoint().
+        """
+
+        history = self.__history
+        while len(history) > checkpoint:
+            root_v, root_u, increased_rank = history.pop()
+            self.__parent[root_v] = root_v
+            if increased_rank:
+                self.__rank[root_u] -= 1
+            self.__count += 1
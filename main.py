@@ -1,9 +1,110 @@
+import argparse
+import json
 import sys
 from DataStructures.Graph import Graph
+from DataStructures.CircuitWriter import CircuitWriter
+from DataStructures.Profiler import PROFILER
+from DataStructures.BatchRunner import BatchRunner
 
 if __name__ == "__main__":
-    filename = sys.argv[1] # Nome do arquivo
-    graph = Graph(filename) # Inicializa o grafo
-    graph.get_eulerian_circuit() # Exibe um circuito euleriano, caso exista
-    if graph.is_adjacency_list(): # Implementação apenas para a lista de adjacência
-        graph.is_hamiltonian() # Verifica a condição necessária para grafos hamiltonianos
+    parser = argparse.ArgumentParser()
+    parser.add_argument("filename", nargs="?", help="Nome do arquivo de entrada")
+    parser.add_argument("--backend", default="default", choices=["default", "compact", "bitset"],
+                        help="Estrutura utilizada para o grafo (bitset acelera a "
+                             "verificação hamiltoniana)")
+    parser.add_argument("--output", help="Arquivo em que o circuito euleriano é gravado")
+    parser.add_argument("--binary-output", action="store_true",
+                        help="Grava o circuito no formato binário (inteiros de 32 bits)")
+    parser.add_argument("--profile", nargs="?", const="-", metavar="ARQUIVO",
+                        help="Coleta contadores e tempos de cada etapa e os grava em JSON " \
+                             "no arquivo (ou no terminal, se omitido)")
+    parser.add_argument("--profile-memory", action="store_true",
+                        help="Inclui o pico de memória de cada etapa no --profile (mais lento)")
+    parser.add_argument("--hamiltonian-cycle", action="store_true",
+                        help="Busca exatamente um ciclo hamiltoniano e o exibe")
+    parser.add_argument("--hamiltonian-method", default="gray_code",
+                        choices=["gray_code", "enumeration", "parallel", "anytime", "randomized"],
+                        help="Busca de subconjuntos da verificação hamiltoniana")
+    parser.add_argument("--time-budget", type=float, metavar="SEGUNDOS",
+                        help="Tempo máximo da verificação hamiltoniana anytime ou randomized")
+    parser.add_argument("--subset-budget", type=int, metavar="N",
+                        help="Quantidade máxima de subconjuntos da verificação hamiltoniana anytime")
+    parser.add_argument("--checkpoint", metavar="ARQUIVO",
+                        help="Arquivo em que a verificação hamiltoniana anytime grava a sua " \
+                             "posição e a partir do qual continua")
+    parser.add_argument("--progress", nargs="?", const=10.0, type=float, metavar="SEGUNDOS",
+                        help="Exibe o progresso da verificação hamiltoniana anytime e grava o " \
+                             "checkpoint a cada intervalo (padrão: 10 segundos)")
+    parser.add_argument("--seed", type=int,
+                        help="Semente da verificação hamiltoniana randomized")
+    parser.add_argument("--restarts", type=int, metavar="N",
+                        help="Quantidade máxima de tentativas da verificação hamiltoniana randomized")
+    parser.add_argument("--batch", nargs="+", metavar="FONTE",
+                        help="Verifica em paralelo os arquivos de diretórios, padrões glob " \
+                             "ou listas (@lista.txt, um arquivo por linha)")
+    parser.add_argument("--workers", type=int,
+                        help="Quantidade de processos do --batch ou do --hamiltonian-method parallel")
+    parser.add_argument("--timeout", type=float,
+                        help="Tempo máximo, em segundos, de cada arquivo do --batch")
+    parser.add_argument("--batch-output", default="-", metavar="ARQUIVO",
+                        help="Arquivo JSON com os resultados do --batch ('-' para o terminal)")
+    args = parser.parse_args()
+    if (args.filename is None) == (args.batch is None):
+        parser.error("informe o arquivo de entrada ou --batch")
+    anytime_options = (args.subset_budget, args.checkpoint, args.progress)
+    if args.hamiltonian_method != "anytime" and any(option is not None for option in anytime_options):
+        parser.error("--subset-budget, --checkpoint e --progress exigem --hamiltonian-method anytime")
+    if args.hamiltonian_method != "randomized" and (args.seed is not None or args.restarts is not None):
+        parser.error("--seed e --restarts exigem --hamiltonian-method randomized")
+    if args.hamiltonian_method not in ("anytime", "randomized") and args.time_budget is not None:
+        parser.error("--time-budget exige --hamiltonian-method anytime ou randomized")
+    if args.progress is not None and args.progress <= 0:
+        parser.error("--progress exige um intervalo positivo")
+    if args.binary_output and not args.output:
+        parser.error("--binary-output exige --output")
+
+    if args.batch: # Verificação de vários arquivos em paralelo
+        files = BatchRunner.collect_files(args.batch)
+        results = BatchRunner(args.backend, args.workers, args.timeout).run(files)
+        if args.batch_output == "-":
+            json.dump(results, sys.stdout, indent=1)
+            print()
+        else:
+            with open(args.batch_output, "w") as output:
+                json.dump(results, output, indent=1)
+            statuses = [result["status"] for result in results]
+            print("{} arquivos verificados: {} ok, {} com erro e {} com tempo esgotado".format(
+                len(results), statuses.count("ok"), statuses.count("error"), statuses.count("timeout")))
+        sys.exit(0)
+
+    if args.profile: # Instrumentação opcional
+        PROFILER.enable(args.profile_memory)
+
+    graph = Graph(args.filename, args.backend) # Inicializa o grafo
+    if args.output: # Grava o circuito euleriano no arquivo, caso exista
+        with open(args.output, "wb" if args.binary_output else "w") as output:
+            circuit = graph.get_eulerian_circuit(writer=CircuitWriter(output, args.binary_output))
+        if circuit is not None:
+            print("Circuito euleriano com {} vértices gravado em {}".format(len(circuit), args.output))
+    else:
+        graph.get_eulerian_circuit() # Exibe um circuito euleriano, caso exista
+    report = None
+    if args.progress is not None: # Progresso da verificação hamiltoniana no terminal de erros
+        def report(examined, total, rate):
+            print("{} de {} subconjuntos avaliados ({:.2f}%), {:.0f} subconjuntos/s".format(
+                examined, total, 100 * examined / total, rate), file=sys.stderr)
+    # Verifica a condição necessária para grafos hamiltonianos
+    graph.is_hamiltonian(args.hamiltonian_method, args.workers, args.time_budget,
+                         args.subset_budget, args.checkpoint, report,
+                         10.0 if args.progress is None else args.progress,
+                         args.seed, args.restarts)
+    if args.hamiltonian_cycle: # Decisão exata, com o ciclo encontrado
+        graph.get_hamiltonian_cycle()
+
+    if args.profile: # Exibe ou grava os dados coletados
+        PROFILER.snapshot("end")
+        if args.profile == "-":
+            PROFILER.dump(sys.stdout)
+        else:
+            with open(args.profile, "w") as profile:
+                PROFILER.dump(profile)
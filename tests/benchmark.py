@@ -0,0 +1,176 @@
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+try:
+    import resource
+except ImportError: # Indisponível fora de sistemas Unix
+    resource = None
+
+# Permite importar o pacote DataStructures a partir da pasta tests
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from DataStructures.Graph import Graph
+from create_eulerian_graph import create_eulerian_graph
+from convert_adj_list import FORMATS, graph_to_file
+
+def generate_graphs(workdir: str, sizes: list, degrees: list, seed: int, distribution: str):
+    """Gera os grafos eulerianos da grade de tamanhos e graus médios,
+    com semente fixa, e os grava em todos os formatos.
+
+    Retorno
+    -------
+    - graphs (list): Lista de dicionários com os parâmetros e os arquivos de cada grafo.
+    """
+
+    graphs = []
+    for n_nodes in sizes:
+        for degree in degrees:
+            prefix = os.path.join(workdir, "grafo_{}_{}".format(n_nodes, degree))
+            # Semente reprodutível por ponto da grade
+            sources, targets = create_eulerian_graph(n_nodes, degree, seed + n_nodes * 1000 + degree,
+                                                     distribution)
+            graph_to_file(sources, targets, n_nodes, prefix, list(FORMATS))
+
+            files = dict()
+            for name, suffix in FORMATS.items():
+                files[name] = prefix + suffix
+            num_edges = len(sources)
+            if num_edges == n_nodes: # Matriz de incidência quadrada seria lida como de adjacência
+                del files["matriz_incid"]
+
+            graphs.append({"n_nodes": n_nodes, "degree": degree,
+                           "num_edges": num_edges, "files": files})
+    return graphs
+
+def run_phases(filename: str, backend: str, hamiltonian: bool):
+    """Executa e cronometra cada etapa sobre um arquivo de grafo.
+
+    Retorno
+    -------
+    - timings (dict): Tempo, em segundos, de cada etapa.
+    """
+
+    timings = dict()
+    start = time.perf_counter()
+    graph = Graph(filename, backend)
+    timings["load"] = time.perf_counter() - start
+
+    graph.set_graph()
+    start = time.perf_counter()
+    graph.is_connected()
+    timings["is_connected"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    graph.is_eulerian()
+    timings["is_eulerian"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    graph.find_eulerian_circuit()
+    timings["get_eulerian_circuit"] = time.perf_counter() - start
+
+    if hamiltonian:
+        start = time.perf_counter()
+        graph.find_toughness_violator()
+        timings["is_hamiltonian"] = time.perf_counter() - start
+
+    return timings
+
+def measure_memory(filename: str, backend: str, hamiltonian: bool):
+    """Executa as etapas com o tracemalloc ativo, em um processo
+    novo, para que o pico de memória residente (RSS) não inclua as
+    medições anteriores.
+
+    Retorno
+    -------
+    - peak_memory (int): Pico de memória alocada pelo Python, em bytes.
+    - max_rss (int | None): Pico de memória residente do processo, em kB.
+    """
+
+    run_phases(filename, backend, hamiltonian) # Aquece importações e caches do interpretador
+    tracemalloc.start()
+    run_phases(filename, backend, hamiltonian)
+    peak_memory = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss if resource else None
+    return peak_memory, max_rss
+
+def measure(filename: str, backend: str, hamiltonian: bool, repeat: int, pool):
+    """Mede o menor tempo de cada etapa entre as repetições e a
+    memória em uma execução à parte, para que o rastreamento não
+    distorça os tempos.
+
+    Retorno
+    -------
+    - result (dict): Tempos de cada etapa e picos de memória.
+    """
+
+    best = dict()
+    for i in range(repeat):
+        for phase, elapsed in run_phases(filename, backend, hamiltonian).items():
+            best[phase] = min(elapsed, best.get(phase, elapsed))
+
+    peak_memory, max_rss = pool.apply(measure_memory, (filename, backend, hamiltonian))
+    return {"seconds": best, "peak_memory_bytes": peak_memory, "max_rss_kb": max_rss}
+
+def current_commit():
+    # Retorna o commit atual do repositório, se disponível
+    try:
+        output = subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True,
+                                cwd=os.path.dirname(os.path.abspath(__file__)))
+        return output.stdout.strip() or None
+    except OSError:
+        return None
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", default="16,50,200,800",
+                        help="Quantidades de vértices, separadas por vírgula")
+    parser.add_argument("--degrees", default="4,16,64",
+                        help="Graus médios dos grafos gerados, separados por vírgula")
+    parser.add_argument("--distribution", default="uniform",
+                        help="Distribuição dos graus dos grafos gerados")
+    parser.add_argument("--seed", type=int, default=0, help="Semente dos grafos gerados")
+    parser.add_argument("--repeat", type=int, default=3, help="Repetições de cada medição")
+    parser.add_argument("--backends", default="default,compact",
+                        help="Estruturas avaliadas, separadas por vírgula")
+    parser.add_argument("--hamiltonian-max", type=int, default=16,
+                        help="Maior |V| em que is_hamiltonian é medido")
+    parser.add_argument("--output", default="-", help="Arquivo JSON de saída ('-' para o terminal)")
+    args = parser.parse_args()
+
+    sizes = [int(n) for n in args.sizes.split(",")]
+    degrees = [int(d) for d in args.degrees.split(",")]
+    backends = args.backends.split(",")
+
+    results = []
+    # Cada medição de memória usa um processo novo (maxtasksperchild=1)
+    context = multiprocessing.get_context("spawn")
+    with tempfile.TemporaryDirectory() as workdir, \
+         context.Pool(1, maxtasksperchild=1) as pool:
+        for graph in generate_graphs(workdir, sizes, degrees, args.seed, args.distribution):
+            hamiltonian = graph["n_nodes"] <= args.hamiltonian_max
+            for file_format, filename in graph["files"].items():
+                for backend in backends:
+                    result = measure(filename, backend, hamiltonian, args.repeat, pool)
+                    result.update({"n_nodes": graph["n_nodes"], "degree": graph["degree"],
+                                   "num_edges": graph["num_edges"], "format": file_format,
+                                   "backend": backend})
+                    results.append(result)
+                    print("{} {} {} {}: {}".format(graph["n_nodes"], graph["degree"],
+                                                   file_format, backend, result["seconds"]),
+                          file=sys.stderr)
+
+    report = {"commit": current_commit(), "python": platform.python_version(),
+              "seed": args.seed, "distribution": args.distribution, "repeat": args.repeat, "results": results}
+    text = json.dumps(report, indent=1, sort_keys=True)
+    if args.output == "-":
+        print(text)
+    else:
+        with open(args.output, "w") as output:
+            output.write(text + "\n")
@@ -1,65 +1,298 @@
+import argparse
+import os
 import sys
+from array import array
+try:
+    import numpy as np
+except ImportError: # NumPy é opcional
+    np = None
 
-def parse_graph(filename: str="graph_parsed", option: int=0):
-    file = open(filename + "_lista_adj.txt", "r")
-    lines_of_file = file.readlines()
-    file.close()
-
-    if option == 1: # Converte para matriz de incidência
-        edges = []
-        u = 0
-        for line in lines_of_file:
-            adj_vertices = line.replace("\n", "").split(",")
-            # Converte os valores da matriz para inteiros
-            final_vertices = []
-            for v in adj_vertices:
-                if v != '':
-                    final_vertices.append(int(v))
-            for v in final_vertices:
-                if (v,u) not in edges: # Não repete arestas
-                    edges.append((u,v)) # Armazena cada aresta do grafo
-            u += 1
-        
-        # |V| x |A|
-        graph = [[0 for e in range(len(edges))] for v in range(len(lines_of_file))]
-        for e in range(len(edges)):
-            u,v = edges[e]
-            graph[u][e] += 1
-            graph[v][e] += 1
-
-    else: # Converte para matriz de adjacência
-        # |V| x |V|
-        graph = [[0 for v in range(len(lines_of_file))] for v in range(len(lines_of_file))]
-        
-        u = 0
-        for line in lines_of_file:
-            adj_vertices = line.replace("\n", "").split(",")
-            # Converte os valores da matriz para inteiros
-            final_vertices = []
-            for v in adj_vertices:
-                if v != '':
-                    final_vertices.append(int(v))
-            for v in final_vertices:
-                graph[u][v] += 1
-            u += 1
-    
-    ext = "_matriz_incid.txt" if option == 1 else "_matriz_adj.txt"
-    output = open(filename + ext, "w")
-    for u in range(len(graph)):
-        for v in range(len(graph[u])):
-            if v == len(graph[u]) - 1:
-                output.write("{}".format(graph[u][v]))
+# Permite importar o pacote DataStructures a partir da pasta tests
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from DataStructures.GraphReader import GraphReader
+from DataStructures.BinaryGraphFormat import BinaryGraphFormat
+
+# Sufixo do arquivo gerado em cada formato
+FORMATS = {
+    "lista_adj": "_lista_adj.txt",
+    "matriz_adj": "_matriz_adj.txt",
+    "matriz_incid": "_matriz_incid.txt",
+    "binario": "_grafo.bin",
+}
+
+# Formato gerado por cada opção da linha de comando (sem opção: matriz de adjacência)
+OPTIONS = {None: "matriz_adj", 0: "matriz_adj", 1: "matriz_incid", 2: "binario"}
+
+def edges_from_adjacency_list(offsets, neighbors):
+    """Retorna as arestas de uma lista de adjacência. Cada aresta
+    (u,v) aparece nas listas de u e de v, e as ocorrências são
+    pareadas com um dicionário de arestas pendentes, em tempo
+    O(|V|+|A|): a ocorrência de u na lista de v consome uma aresta
+    (u,v) criada antes na lista de u. Cada ocorrência de u na
+    própria lista é um laço.
+
+    Retorno
+    -------
+    - sources (array): Primeira extremidade de cada aresta.
+    - targets (array): Segunda extremidade de cada aresta.
+    """
+
+    n_nodes = len(offsets) - 1
+    sources = array('i')
+    targets = array('i')
+    # Arestas (u,v) ainda sem a ocorrência de u na lista de v: u*|V|+v -> quantidade
+    pending = dict()
+    for u in range(n_nodes):
+        for slot in range(offsets[u], offsets[u+1]):
+            v = neighbors[slot]
+            key = v * n_nodes + u
+            count = pending.get(key, 0)
+            if count: # A aresta já foi criada a partir da lista de v
+                if count == 1:
+                    del pending[key]
+                else:
+                    pending[key] = count - 1
+                continue
+            sources.append(u)
+            targets.append(v)
+            if v != u:
+                key = u * n_nodes + v
+                pending[key] = pending.get(key, 0) + 1
+
+    return sources, targets
+
+def edges_from_adjacency_matrix(n_nodes: int, values):
+    """Retorna as arestas de uma matriz de adjacência, linha por
+    linha, considerando apenas o triângulo superior (com a diagonal).
+    A posição (u,v) indica a quantidade de arestas entre u e v.
+
+    Retorno
+    -------
+    - sources (array): Primeira extremidade de cada aresta.
+    - targets (array): Segunda extremidade de cada aresta.
+    """
+
+    if np is not None and isinstance(values, np.ndarray): # Conversão vetorizada
+        matrix = values.reshape(n_nodes, n_nodes)
+        rows, columns = np.nonzero(np.triu(matrix))
+        counts = matrix[rows, columns]
+        return (array('i', np.repeat(rows, counts).astype(np.int32).tobytes()),
+                array('i', np.repeat(columns, counts).astype(np.int32).tobytes()))
+
+    sources = array('i')
+    targets = array('i')
+    for u in range(n_nodes):
+        row = u * n_nodes
+        for v in range(u, n_nodes):
+            for i in range(values[row + v]): # Arestas paralelas se repetem
+                sources.append(u)
+                targets.append(v)
+
+    return sources, targets
+
+def edges_from_incidence_matrix(n_nodes: int, n_edges: int, values):
+    """Retorna as arestas de uma matriz de incidência, na ordem das
+    colunas. Cada coluna possui dois valores 1 (aresta entre dois
+    vértices) ou um valor 2 (laço).
+
+    Retorno
+    -------
+    - sources (array): Primeira extremidade de cada aresta.
+    - targets (array): Segunda extremidade de cada aresta.
+    """
+
+    sources = array('i', [-1]) * n_edges
+    targets = array('i', [-1]) * n_edges
+    if np is not None and isinstance(values, np.ndarray): # Posições não nulas, linha por linha
+        rows, columns = np.nonzero(values.reshape(n_nodes, n_edges))
+        incidences = zip(rows.tolist(), columns.tolist())
+    else:
+        incidences = ((u, e) for u in range(n_nodes) for e in range(n_edges)
+                      if values[u * n_edges + e])
+
+    for u, e in incidences:
+        for i in range(values[u * n_edges + e]): # Um laço incide duas vezes
+            if sources[e] < 0:
+                sources[e] = u
+            elif targets[e] < 0:
+                targets[e] = u
             else:
-                output.write("{} ".format(graph[u][v]))
-        output.write("\n")
-    output.close()
-            
+                raise ValueError("A coluna {} da matriz de incidência " \
+                                 "não representa uma aresta".format(e))
+    if -1 in targets:
+        raise ValueError("A coluna {} da matriz de incidência " \
+                         "não representa uma aresta".format(targets.index(-1)))
+
+    return sources, targets
+
+def read_edges(filename: str):
+    """Lê um grafo em qualquer formato suportado (lista de adjacência,
+    matriz de adjacência, matriz de incidência ou binário), identificado
+    da mesma forma que no main.py, e retorna as suas arestas.
+
+    Parâmetros
+    ----------
+    - filename (str): Nome do arquivo de entrada.
+
+    Retorno
+    -------
+    - sources (array): Primeira extremidade de cada aresta.
+    - targets (array): Segunda extremidade de cada aresta.
+    - n_nodes (int): Quantidade de vértices.
+    """
+
+    reader = GraphReader(filename)
+    file_format = reader.sniff_format()
+    if file_format == "binary":
+        offsets, neighbors, edge_ids, num_edges = reader.read_binary()
+        return edges_from_adjacency_list(offsets, neighbors) + (len(offsets) - 1,)
+    if file_format == "adjacency_list":
+        offsets, neighbors = reader.read_adjacency_list()
+        return edges_from_adjacency_list(offsets, neighbors) + (len(offsets) - 1,)
+
+    num_rows, num_columns, values = reader.read_matrix()
+    if num_rows == num_columns: # Matriz de adjacência (|V| x |V|)
+        return edges_from_adjacency_matrix(num_rows, values) + (num_rows,)
+    # Matriz de incidência (|V| x |A|)
+    return edges_from_incidence_matrix(num_rows, num_columns, values) + (num_rows,)
+
+def edges_to_adjacency_list(sources, targets, n_nodes: int):
+    """Converte a lista de arestas para vetores de lista de adjacência,
+    em que os vizinhos de v ficam, em ordem crescente, em
+    neighbors[offsets[v]:offsets[v+1]]. Um laço aparece uma vez na
+    lista do seu vértice, e arestas paralelas aparecem repetidas.
+
+    Retorno
+    -------
+    - offsets (array): Deslocamentos do início da lista de cada vértice.
+    - neighbors (array): Vértices adjacentes de todos os vértices.
+    """
+
+    counts = array('q', bytes(8 * (n_nodes + 1)))
+    for u, v in zip(sources, targets):
+        counts[u + 1] += 1
+        if u != v:
+            counts[v + 1] += 1
+    for v in range(n_nodes): # Soma acumulada dos graus
+        counts[v + 1] += counts[v]
+    offsets = counts
+
+    neighbors = array('i', bytes(4 * offsets[n_nodes]))
+    position = array('q', offsets[:-1])
+    for u, v in zip(sources, targets):
+        neighbors[position[u]] = v
+        position[u] += 1
+        if u != v:
+            neighbors[position[v]] = u
+            position[v] += 1
+    for v in range(n_nodes): # Vizinhos em ordem crescente
+        neighbors[offsets[v]:offsets[v+1]] = array('i', sorted(neighbors[offsets[v]:offsets[v+1]]))
+
+    return offsets, neighbors
+
+def write_rows(filename: str, rows, block_size: int = 1 << 10):
+    # Grava as linhas em blocos, sem montar o arquivo inteiro em memória
+    with open(filename, "w") as fp:
+        block = []
+        for row in rows:
+            block.append(row)
+            if len(block) == block_size:
+                fp.write("\n".join(block) + "\n")
+                block.clear()
+        if block:
+            fp.write("\n".join(block) + "\n")
+
+def graph_to_file(sources, targets, n_nodes: int, filename: str = "graph", formats: list = ("lista_adj",)):
+    """Grava o grafo nos formatos indicados, linha por linha.
+    As matrizes ocupam O(|V|^2) e O(|V|.|A|) no arquivo, mas apenas
+    uma linha fica em memória por vez.
+
+    Parâmetros
+    ----------
+    - sources (array): Primeira extremidade de cada aresta.
+    - targets (array): Segunda extremidade de cada aresta.
+    - n_nodes (int): Quantidade de vértices.
+    - filename (str): Nome do arquivo sem o sufixo do formato.
+    - formats (list): Formatos gravados ("lista_adj", "matriz_adj",
+    "matriz_incid" e/ou "binario").
+    """
+
+    for file_format in formats:
+        if file_format not in FORMATS:
+            raise ValueError("Formato desconhecido: {}".format(file_format))
+
+    if "lista_adj" in formats or "matriz_adj" in formats or "binario" in formats:
+        offsets, neighbors = edges_to_adjacency_list(sources, targets, n_nodes)
+
+    if "lista_adj" in formats:
+        write_rows(filename + FORMATS["lista_adj"],
+                   (",".join(map(str, neighbors[offsets[v]:offsets[v+1]])) for v in range(n_nodes)))
+
+    if "binario" in formats:
+        BinaryGraphFormat.write(filename + FORMATS["binario"], offsets, neighbors)
+
+    if "matriz_adj" in formats:
+        def adjacency_rows():
+            row = ["0"] * n_nodes
+            for v in range(n_nodes):
+                adjacent = neighbors[offsets[v]:offsets[v+1]]
+                count = dict()
+                for w in adjacent: # Laços e arestas paralelas somam 1 por ocorrência
+                    count[w] = count.get(w, 0) + 1
+                for w, c in count.items():
+                    row[w] = str(c)
+                yield " ".join(row)
+                for w in count: # Zera apenas as posições alteradas
+                    row[w] = "0"
+        write_rows(filename + FORMATS["matriz_adj"], adjacency_rows())
+
+    if "matriz_incid" in formats:
+        # Arestas incidentes a cada vértice, na ordem das colunas
+        incident = [array('i') for v in range(n_nodes)]
+        for e in range(len(sources)):
+            incident[sources[e]].append(e)
+            if sources[e] != targets[e]:
+                incident[targets[e]].append(e)
+
+        def incidence_rows():
+            row = ["0"] * len(sources)
+            for v in range(n_nodes):
+                for e in incident[v]: # Um laço é representado pelo valor 2
+                    row[e] = "2" if sources[e] == targets[e] else "1"
+                yield " ".join(row)
+                for e in incident[v]:
+                    row[e] = "0"
+        write_rows(filename + FORMATS["matriz_incid"], incidence_rows())
+
+def convert_graph(input_filename: str, output_filename: str, formats: list):
+    """Converte um grafo em qualquer formato para os formatos indicados.
+
+    Parâmetros
+    ----------
+    - input_filename (str): Nome do arquivo de entrada.
+    - output_filename (str): Nome dos arquivos de saída, sem o sufixo do formato.
+    - formats (list): Formatos gravados.
+    """
+
+    sources, targets, n_nodes = read_edges(input_filename)
+    graph_to_file(sources, targets, n_nodes, output_filename, formats)
+
+def parse_graph(filename: str="graph_parsed", option: int=0):
+    # Converte a lista de adjacência filename + "_lista_adj.txt" de acordo com a opção
+    convert_graph(filename + FORMATS["lista_adj"], filename, [OPTIONS[option]])
+
 
 if __name__ == "__main__":
-    filename = sys.argv[1]
-    try:
-        option = int(sys.argv[2])
-    except:
-        option = None
-    
-    parse_graph(filename, option)
\ No newline at end of file
+    parser = argparse.ArgumentParser()
+    parser.add_argument("filename", help="Nome do arquivo sem o sufixo do formato")
+    parser.add_argument("option", nargs="?", type=int, choices=[0, 1, 2],
+                        help="0 (ou omitida): matriz de adjacência, 1: matriz de incidência, 2: binário")
+    parser.add_argument("--input", help="Arquivo de entrada em qualquer formato " \
+                                        "(padrão: filename + '_lista_adj.txt')")
+    parser.add_argument("--formats", nargs="+", choices=list(FORMATS),
+                        help="Formatos gravados (substitui a opção)")
+    args = parser.parse_args()
+
+    input_filename = args.input or args.filename + FORMATS["lista_adj"]
+    formats = args.formats or [OPTIONS[args.option]]
+    convert_graph(input_filename, args.filename, formats)
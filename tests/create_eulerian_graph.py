@@ -1,43 +1,156 @@
-import sys
-import numpy as np
+import argparse
+import bisect
+import random
+from array import array
+from convert_adj_list import FORMATS, graph_to_file
 
-def create_eulerian_graph ( n_nodes = 8 , max_edges = 50 ) :
+DISTRIBUTIONS = ("uniform", "power_law", "regular")
 
-    m = np.zeros((n_nodes,n_nodes))
-    
-    for i in range( len(m)-2 ) :
-        a = min(max_edges, len(m)-i-1)
-        n_edges = np.random.randint(1,a//2+1) * 2
+def vertex_sampler(rng: random.Random, n_nodes: int, distribution: str, exponent: float = 2.5):
+    """Retorna uma função que sorteia vértices de acordo com a
+    distribuição de graus desejada, em O(log |V|) por sorteio.
 
-        used_edges = int(np.sum(m[i][0:i])) % 2
+    - uniform: todos os vértices têm a mesma chance.
+    - power_law: a chance do i-ésimo vértice é proporcional a
+    (i+1)^(-1/(exponent-1)), gerando poucos vértices de grau alto
+    (hubs), como nos grafos de Chung-Lu.
+    - regular: os vértices são sorteados em rodadas, cada um uma
+    vez por rodada, de modo que os graus ficam quase iguais.
+    """
 
-        n_edges = max(0, n_edges - used_edges)
+    if distribution == "uniform":
+        return lambda: rng.randrange(n_nodes)
 
-        edges = np.random.choice(list(range(i+1,len(m))), n_edges, replace=False)
-        m[i,edges] = 1
-        m[edges,i] = 1
+    if distribution == "power_law":
+        # Os rótulos dos hubs são embaralhados para não serem sempre 0, 1, 2, ...
+        labels = list(range(n_nodes))
+        rng.shuffle(labels)
+        alpha = 1.0 / (exponent - 1.0)
+        cum_weights = []
+        total = 0.0
+        for i in range(n_nodes):
+            total += (i + 1) ** -alpha
+            cum_weights.append(total)
+        return lambda: labels[bisect.bisect(cum_weights, rng.random() * total)]
 
-    i = len(m)-2
-    if int(np.sum(m[i][0:i])) % 2 != 0 :
-        m[i,-1] = 1
-        m[-1,i] = 1
+    if distribution == "regular":
+        order = list(range(n_nodes))
+        state = {"position": n_nodes}
+        def next_vertex():
+            if state["position"] == n_nodes: # Nova rodada
+                rng.shuffle(order)
+                state["position"] = 0
+            state["position"] += 1
+            return order[state["position"] - 1]
+        return next_vertex
 
-    return m
+    raise ValueError("Distribuição desconhecida: {}".format(distribution))
 
-def graph_to_file (m, filename="graph") :
-    with open(filename + "_lista_adj.txt", 'w') as fp:
-        for edges in m :
-            linked = [str(i) for i, e in enumerate(edges) if e == 1]
-            fp.write(','.join(linked))
-            fp.write('\n')
+def create_eulerian_graph(n_nodes: int = 8, degree: int = 4, seed: int = None,
+                          distribution: str = "uniform", loops: int = 0, multi_edges: bool = False):
+    """Gera um grafo euleriano (conectado e com todos os graus pares)
+    como uma lista de arestas, em memória O(|V|+|A|).
+
+    Um ciclo que passa por todos os vértices, em ordem aleatória,
+    garante a conectividade. As demais arestas são adicionadas em
+    ciclos curtos, que somam 2 ao grau de cada vértice visitado e,
+    portanto, preservam a paridade. Laços também somam 2 ao grau.
+
+    Parâmetros
+    ----------
+    - n_nodes (int): Quantidade de vértices (no mínimo 3).
+    - degree (int): Grau médio desejado (no mínimo 2).
+    - seed (int): Semente do gerador aleatório.
+    - distribution (str): Distribuição dos graus ("uniform", "power_law" ou "regular").
+    - loops (int): Quantidade de laços adicionados.
+    - multi_edges (bool): Indica se arestas paralelas são permitidas.
+
+    Retorno
+    -------
+    - sources (array): Primeira extremidade de cada aresta.
+    - targets (array): Segunda extremidade de cada aresta.
+    """
+
+    if n_nodes < 3:
+        raise ValueError("O grafo precisa de pelo menos 3 vértices")
+    rng = random.Random(seed)
+    sample = vertex_sampler(rng, n_nodes, distribution)
+    sources = array('i')
+    targets = array('i')
+    # Arestas já existentes (u*|V|+v, com u <= v), apenas se não houver arestas paralelas
+    existing = None if multi_edges else set()
+
+    def add_edge(u, v):
+        sources.append(u)
+        targets.append(v)
+        if existing is not None:
+            existing.add(min(u, v) * n_nodes + max(u, v))
+
+    def has_edge(u, v):
+        return existing is not None and min(u, v) * n_nodes + max(u, v) in existing
+
+    # Ciclo por todos os vértices: garante a conectividade
+    order = list(range(n_nodes))
+    rng.shuffle(order)
+    for i in range(n_nodes):
+        add_edge(order[i], order[(i + 1) % n_nodes])
+
+    # Laços em vértices sorteados
+    added_loops = 0
+    failures = 0
+    while added_loops < loops and failures < 100:
+        v = sample()
+        if has_edge(v, v):
+            failures += 1
+            continue
+        add_edge(v, v)
+        added_loops += 1
+
+    # Ciclos curtos até atingir o grau médio desejado
+    remaining = n_nodes * degree // 2 - n_nodes
+    min_length = 2 if multi_edges else 3
+    failures = 0
+    while remaining >= min_length and failures < 100: # Desiste se o grafo estiver saturado
+        length = min(rng.randint(min_length, 10), remaining, n_nodes)
+        cycle = [sample()]
+        while len(cycle) < length:
+            for attempt in range(10): # Sorteia um vértice novo no ciclo e sem aresta repetida
+                v = sample()
+                if v not in cycle and not has_edge(cycle[-1], v):
+                    cycle.append(v)
+                    break
+            else:
+                break
+        if len(cycle) < length or (length > 2 and has_edge(cycle[-1], cycle[0])):
+            failures += 1 # Ciclo descartado
+            continue
+
+        failures = 0
+        for i in range(length - 1):
+            add_edge(cycle[i], cycle[i + 1])
+        if length > 2:
+            add_edge(cycle[-1], cycle[0])
+        else: # Duas arestas paralelas formam um ciclo de tamanho 2
+            add_edge(cycle[0], cycle[1])
+        remaining -= length
+
+    return sources, targets
 
 
 if __name__ == "__main__":
-    filename = sys.argv[1]
-    try:
-        nodes = int(sys.argv[2])
-    except:
-        nodes = None
-    
-    m = create_eulerian_graph(n_nodes=nodes)
-    graph_to_file(m, filename)
\ No newline at end of file
+    parser = argparse.ArgumentParser()
+    parser.add_argument("filename", help="Nome do arquivo sem extensão")
+    parser.add_argument("nodes", nargs="?", type=int, default=8, help="Quantidade de vértices")
+    parser.add_argument("--degree", type=int, default=4, help="Grau médio desejado")
+    parser.add_argument("--seed", type=int, help="Semente do gerador aleatório")
+    parser.add_argument("--distribution", default="uniform", choices=DISTRIBUTIONS,
+                        help="Distribuição dos graus")
+    parser.add_argument("--loops", type=int, default=0, help="Quantidade de laços")
+    parser.add_argument("--multi-edges", action="store_true", help="Permite arestas paralelas")
+    parser.add_argument("--formats", nargs="+", default=["lista_adj"], choices=list(FORMATS),
+                        help="Formatos dos arquivos gerados")
+    args = parser.parse_args()
+
+    sources, targets = create_eulerian_graph(args.nodes, args.degree, args.seed,
+                                             args.distribution, args.loops, args.multi_edges)
+    graph_to_file(sources, targets, args.nodes, args.filename, args.formats)